@@ -6,6 +6,7 @@ from rendering.cable_renderer import CableRenderer
 from rendering.asset_loader import AssetLoader
 from rendering.resource_ui import ResourceUI
 from rendering.time_ui import TimeUI
+from utils.tracing import Tracer
 
 def main():
     pygame.init()
@@ -66,6 +67,8 @@ def main():
         time_ui.draw_time_controls(game_state.screen, game_state.time_manager, game_state.build_ui)
         pygame.display.flip()
 
+    game_state.ship.path_scheduler.close()
+    Tracer.get_instance().close()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+"""Compare per-turret and batched (NumPy) turret updates as turrets and enemies grow.
+
+Run from the repository root:
+    python -m benchmarks.combat_benchmark
+"""
+import random
+import time
+
+from models.enemies import Enemy, EnemyType
+from world.spatial_hash import ENEMIES, SpatialHash
+from world.systems.combat_system import np, update_turrets
+from world.weapons import LaserTurret
+
+TICKS = 100
+
+class PoweredTile:
+    """Stands in for a tile on a fully powered cable network"""
+    def has_power(self, required):
+        return True
+
+class Ship:
+    def __init__(self, enemies):
+        self.enemies = enemies
+        self.timers = None  # Cooldowns count down in the turrets' updates
+        self.spatial_hash = SpatialHash()
+        for enemy in enemies:
+            self.spatial_hash.insert(enemy, ENEMIES)
+
+def battle(turret_count, enemy_count, seed=0):
+    """Turrets and tough enemies scattered over a 100x100 area, so most turrets keep searching"""
+    rng = random.Random(seed)
+    enemies = []
+    for i in range(enemy_count):
+        enemy = Enemy(f"Enemy {i}", EnemyType.MELEE)
+        enemy.x, enemy.y = rng.uniform(0, 100), rng.uniform(0, 100)
+        enemy.health = enemy.max_health = 10 ** 9
+        enemies.append(enemy)
+    ship = Ship(enemies)
+    turrets = []
+    for _ in range(turret_count):
+        turret = LaserTurret()
+        turret.x, turret.y = rng.randrange(100), rng.randrange(100)
+        turret.tile = PoweredTile()
+        turret.set_ship(ship)
+        turrets.append(turret)
+    return turrets
+
+def ms_per_tick(update, turrets):
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        update(turrets, 0.1)
+    return (time.perf_counter() - start) * 1000 / TICKS
+
+def per_turret(turrets, dt):
+    return [turret.update(dt) for turret in turrets]
+
+def main():
+    if np is None:
+        print("NumPy is not installed; only the per-turret update is available")
+    for turret_count, enemy_count in ((10, 100), (100, 100), (100, 1000), (500, 1000)):
+        scalar = ms_per_tick(per_turret, battle(turret_count, enemy_count))
+        line = f"{turret_count:>4} turrets x {enemy_count:>5} enemies: per turret {scalar:8.3f} ms/tick"
+        if np is not None:
+            line += f", batched {ms_per_tick(update_turrets, battle(turret_count, enemy_count)):8.3f} ms/tick"
+        print(line)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compare per-member and batched (NumPy) crew updates as the crew grows.
+
+Run from the repository root:
+    python -m benchmarks.crew_benchmark
+"""
+import random
+import time
+
+from models.crew import CrewMember, Skill
+from world.path import Path
+from world.systems.crew_kernel import CrewKernel, np
+from world.systems.crew_manager import CrewManager
+
+TICKS = 100
+
+def walking_crew(count, seed=0):
+    """Well-fed crew each walking a long random route, so no one needs a path search"""
+    rng = random.Random(seed)
+    crew = []
+    for i in range(count):
+        member = CrewMember(f"Crew {i}", Skill.ENGINEER)
+        member.hunger = 100
+        x, y = rng.randrange(100), rng.randrange(100)
+        member.x, member.y = x, y
+        route = []
+        for _ in range(200):
+            x += rng.choice((-1, 0, 1))
+            y += rng.choice((-1, 0, 1))
+            route.append((x, y))
+        member.move_path = Path(route)
+        crew.append(member)
+    return crew
+
+def ms_per_tick(manager):
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        manager.update(0.1)
+    return (time.perf_counter() - start) * 1000 / TICKS
+
+def main():
+    if np is None:
+        print("NumPy is not installed; only the per-member update is available")
+    for count in (100, 1000, 5000):
+        timings = []
+        for kernel in ([None, CrewKernel()] if np is not None else [None]):
+            manager = CrewManager()
+            manager.kernel = kernel
+            manager.crew = walking_crew(count)
+            timings.append(ms_per_tick(manager))
+        line = f"{count:>6} crew: per member {timings[0]:8.3f} ms/tick"
+        if len(timings) > 1:
+            line += f", batched {timings[1]:8.3f} ms/tick"
+        print(line)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Measure memory used per deck tile and per game entity.
+
+Run from the repository root:
+    python -m benchmarks.memory_benchmark
+"""
+import gc
+import tracemalloc
+
+from models.crew import CrewMember, Skill
+from models.enemies import MeleeEnemy
+from world.array_deck import ArrayDeck, np
+from world.deck import Deck
+from world.items import FoodItem
+from world.modules import LifeSupportModule, ReactorModule
+from world.objects import Bed, StorageContainer
+from world.weapons import LaserTurret
+
+ENTITY_COUNT = 2000
+
+ENTITIES = {
+    'CrewMember': lambda: CrewMember("Crew", Skill.ENGINEER),
+    'Enemy': lambda: MeleeEnemy("Enemy"),
+    'Module': ReactorModule,
+    'LifeSupportModule': LifeSupportModule,
+    'Object': Bed,
+    'StorageContainer': StorageContainer,
+    'LaserTurret': LaserTurret,
+    'Item': FoodItem,
+}
+
+def measure(build):
+    """Bytes allocated by build() that are still alive afterwards, and its result"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used, result
+
+def bytes_per_tile(deck_type, size):
+    used, deck = measure(lambda: deck_type(size, size))
+    return used / (deck.width * deck.height)
+
+def bytes_per_entity(factory, count=ENTITY_COUNT):
+    used, _ = measure(lambda: [factory() for _ in range(count)])
+    return used / count
+
+def main():
+    deck_types = [Deck] + ([ArrayDeck] if np is not None else [])
+    for size in (64, 256):
+        for deck_type in deck_types:
+            print(f"{deck_type.__name__:>10} {size}x{size}: {bytes_per_tile(deck_type, size):8.1f} bytes/tile")
+    for name, factory in ENTITIES.items():
+        print(f"{name:>18}: {bytes_per_entity(factory):8.1f} bytes each")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Compare path engines on large decks.
+
+Run from the repository root:
+    python -m benchmarks.pathfinding_benchmark
+"""
+import random
+import time
+
+from world.deck import Deck
+from world.hierarchical_pathfinding import HierarchicalPathfinder, find_path_hierarchical
+from world.jump_point_search import JumpTables, find_path_jps
+from world.landmarks import LandmarkTables
+from world.pathfinding import _search_path_alt, _search_path_to_tile
+
+ENGINES = {
+    'astar': _search_path_to_tile,
+    'alt': _search_path_alt,
+    'jps': find_path_jps,
+    'hpa': find_path_hierarchical,
+}
+EXACT_ENGINES = ('astar', 'alt', 'jps')  # Must return optimal path lengths
+
+def open_deck(size, obstacle_ratio=0.0, seed=0):
+    """Square deck with a wall border and optional scattered obstacles"""
+    rng = random.Random(seed)
+    deck = Deck(size, size, name=f"Open {size}x{size}, {obstacle_ratio:.0%} obstacles")
+    for y in range(size):
+        for x in range(size):
+            edge = x in (0, size - 1) or y in (0, size - 1)
+            deck.tiles[y][x].wall = edge or rng.random() < obstacle_ratio
+    return deck
+
+def maze_deck(size, loop_ratio=0.1, seed=0):
+    """Square deck carved into a maze of one-tile corridors, with some extra openings for loops"""
+    rng = random.Random(seed)
+    deck = Deck(size, size, name=f"Maze {size}x{size}, {loop_ratio:.0%} loops")
+    for row in deck.tiles:
+        for tile in row:
+            tile.wall = True
+
+    # Depth-first carving over the odd coordinates
+    cells = [(x, y) for y in range(1, size - 1, 2) for x in range(1, size - 1, 2)]
+    stack = [cells[0]]
+    deck.tiles[cells[0][1]][cells[0][0]].wall = False
+    while stack:
+        x, y = stack[-1]
+        options = [(x + dx, y + dy) for dx, dy in [(2, 0), (-2, 0), (0, 2), (0, -2)]
+                   if 0 < x + dx < size - 1 and 0 < y + dy < size - 1 and
+                   deck.tiles[y + dy][x + dx].wall]
+        if not options:
+            stack.pop()
+            continue
+        nx, ny = rng.choice(options)
+        deck.tiles[(y + ny) // 2][(x + nx) // 2].wall = False
+        deck.tiles[ny][nx].wall = False
+        stack.append((nx, ny))
+
+    # Knock through some inner walls so there is more than one route
+    for y in range(1, size - 1):
+        for x in range(1, size - 1):
+            if (x + y) % 2 == 1 and rng.random() < loop_ratio:
+                deck.tiles[y][x].wall = False
+    return deck
+
+def random_queries(deck, count, seed=0):
+    rng = random.Random(seed)
+    floor = [(x, y) for y in range(deck.height) for x in range(deck.width)
+             if deck.tiles[y][x].is_walkable()]
+    return [(rng.choice(floor), rng.choice(floor)) for _ in range(count)]
+
+def run(deck, queries, engines=ENGINES):
+    """Time each engine over the same queries; returns {name: (seconds, expanded, total length)}"""
+    results = {}
+    for name, search in engines.items():
+        stats = {'expanded': 0}
+        total_length = 0
+        started = time.perf_counter()
+        for start, goal in queries:
+            total_length += len(search(deck, start, goal, stats))
+        results[name] = (time.perf_counter() - started, stats['expanded'], total_length)
+    return results
+
+def report(title, results):
+    print(title)
+    for name, (seconds, expanded, total_length) in results.items():
+        print(f"  {name:>6}: {seconds * 1000:9.1f} ms  {expanded:>10} expansions  "
+              f"total path length {total_length}")
+
+def main():
+    layouts = [open_deck(64), open_deck(128), open_deck(128, 0.05), open_deck(256),
+               maze_deck(65), maze_deck(129), maze_deck(129, loop_ratio=0.3)]
+    for deck in layouts:
+        queries = random_queries(deck, 50)
+        results = run(deck, queries)
+        report(f"{deck.name}, {len(queries)} queries", results)
+        lengths = {results[name][2] for name in EXACT_ENGINES}
+        assert len(lengths) == 1, "exact engines returned different path lengths"
+        overhead = results['hpa'][2] / results['astar'][2] - 1
+        print(f"  (hpa paths {overhead:.1%} longer than optimal)")
+        saved = 1 - results['alt'][1] / results['astar'][1]
+        print(f"  (alt expands {saved:.1%} fewer nodes than astar)")
+        for name, build in [('jps table', JumpTables), ('hpa cluster', HierarchicalPathfinder),
+                            ('alt landmark', LandmarkTables)]:
+            started = time.perf_counter()
+            build(deck)
+            print(f"  ({name} rebuild after a walkability change: "
+                  f"{(time.perf_counter() - started) * 1000:.1f} ms)")
+
+if __name__ == "__main__":
+    main()
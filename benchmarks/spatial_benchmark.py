@@ -0,0 +1,65 @@
+"""Compare linear scans and the spatial hash for picking and nearest-enemy queries.
+
+Run from the repository root:
+    python -m benchmarks.spatial_benchmark
+"""
+import random
+import time
+
+from models.crew import CrewMember, Skill
+from models.enemies import Enemy, EnemyType
+from world.spatial_hash import CREW, ENEMIES, SpatialHash
+
+QUERIES = 1000
+
+def populated(count, size=200, seed=0):
+    """Crew and enemies scattered over a size x size ship, half of each"""
+    rng = random.Random(seed)
+    spatial_hash = SpatialHash()
+    crew, enemies = [], []
+    for i in range(count):
+        if i % 2:
+            obj = CrewMember(f"Crew {i}", Skill.ENGINEER)
+            crew.append(obj)
+        else:
+            obj = Enemy(f"Enemy {i}", EnemyType.MELEE)
+            enemies.append(obj)
+        obj.x, obj.y = rng.uniform(0, size), rng.uniform(0, size)
+        spatial_hash.insert(obj, CREW if i % 2 else ENEMIES)
+    points = [(rng.uniform(0, size), rng.uniform(0, size)) for _ in range(QUERIES)]
+    return spatial_hash, crew, enemies, points
+
+def scan_pick(crew, x, y):
+    """The old selection loop"""
+    for member in crew:
+        if int(member.x) == int(x) and int(member.y) == int(y):
+            return member
+    return None
+
+def scan_nearest(enemies, x, y, radius):
+    """The old targeting loop"""
+    closest, closest_distance = None, float('inf')
+    for enemy in enemies:
+        distance = ((enemy.x - x) ** 2 + (enemy.y - y) ** 2) ** 0.5
+        if distance <= radius and distance < closest_distance:
+            closest, closest_distance = enemy, distance
+    return closest
+
+def us_per_query(query, points):
+    start = time.perf_counter()
+    for x, y in points:
+        query(x, y)
+    return (time.perf_counter() - start) * 1e6 / len(points)
+
+def main():
+    for count in (100, 1000, 10000):
+        spatial_hash, crew, enemies, points = populated(count)
+        picks = (us_per_query(lambda x, y: scan_pick(crew, x, y), points),
+                 us_per_query(lambda x, y: spatial_hash.pick(int(x), int(y), CREW), points))
+        targets = (us_per_query(lambda x, y: scan_nearest(enemies, x, y, 4), points),
+                   us_per_query(lambda x, y: spatial_hash.nearest(x, y, radius=4, layer=ENEMIES), points))
+        print(f"{count:>6} entities: pick scan {picks[0]:8.2f} us, hash {picks[1]:6.2f} us; "
+              f"nearest in range 4 scan {targets[0]:8.2f} us, hash {targets[1]:6.2f} us")
+
+if __name__ == "__main__":
+    main()
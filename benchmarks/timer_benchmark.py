@@ -0,0 +1,48 @@
+"""Compare polling cooldowns every tick with firing them from the timer wheel.
+
+Run from the repository root:
+    python -m benchmarks.timer_benchmark
+"""
+import random
+import time
+
+from world.systems.timer_wheel import TimerWheel
+
+TICKS = 300
+DT = 1 / 30
+
+def cooldowns(count, seed=0):
+    """Cooldowns of 0.5-10 seconds; each restarts as soon as it runs out"""
+    rng = random.Random(seed)
+    return [rng.uniform(0.5, 10) for _ in range(count)]
+
+def polled(durations):
+    remaining = list(durations)
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        for i, left in enumerate(remaining):
+            left -= DT
+            remaining[i] = left if left > 0 else durations[i]
+    return (time.perf_counter() - start) * 1000 / TICKS
+
+def wheeled(durations):
+    wheel = TimerWheel()
+
+    def expired(i):
+        wheel.schedule(durations[i], expired, i)
+
+    for i, duration in enumerate(durations):
+        wheel.schedule(duration, expired, i)
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        wheel.advance(DT)
+    return (time.perf_counter() - start) * 1000 / TICKS
+
+def main():
+    for count in (100, 1000, 10000, 100000):
+        durations = cooldowns(count)
+        print(f"{count:>7} cooldowns: polled {polled(durations):8.3f} ms/tick, "
+              f"timer wheel {wheeled(durations):8.3f} ms/tick")
+
+if __name__ == "__main__":
+    main()
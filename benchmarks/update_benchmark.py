@@ -0,0 +1,84 @@
+"""Measure the cost of a ship tick as decks fill up with idle objects.
+
+Run from the repository root:
+    python -m benchmarks.update_benchmark
+"""
+import time
+
+from models.enemies import MeleeEnemy
+from world.cables import CableSystem
+from world.deck import Deck
+from world.modules import ReactorModule
+from world.objects import Bed
+from world.ship import Ship
+from world.weapons import LaserTurret
+
+TICKS = 200
+
+def furnished_ship(size, spacing=2):
+    """Ship with one square deck holding a bed or an unpowered turret every `spacing` tiles"""
+    deck = Deck(size, size)
+    for y in range(0, size, spacing):
+        for x in range(0, size, spacing):
+            deck.tiles[y][x].object = LaserTurret() if (x + y) % 4 == 0 else Bed()
+    ship = Ship()
+    ship.add_deck(deck)
+    return ship
+
+def guarded_ship(size, spacing=2):
+    """Ship whose deck is covered in powered turrets, with one enemy walking around far outside"""
+    deck = Deck(size + 1, size + 1)
+    for y in range(0, size, spacing):
+        for x in range(0, size, spacing):
+            deck.tiles[y][x].object = LaserTurret()
+    deck.tiles[size][size].module = ReactorModule(power_output=10 ** 6)
+    ship = Ship()
+    ship.add_deck(deck)
+    ship.cable_system = CableSystem()
+    ship.cable_system.ship = ship
+    ship.cable_system.add_cables([(x, y) for y in range(size + 1) for x in range(size + 1)])
+    for turret, _ in deck.find_objects(LaserTurret):
+        turret.set_ship(ship)
+    enemy = MeleeEnemy("Intruder")
+    enemy.x, enemy.y = -50.0, -50.0
+    ship.add_enemy(enemy)
+    return ship, enemy
+
+def walk_all_tiles(deck, dt):
+    """The old per-tick loop: update whatever sits on every tile"""
+    for row in deck.tiles:
+        for tile in row:
+            if tile.module:
+                tile.module.update(dt)
+            if tile.object:
+                tile.object.update(dt)
+
+def ms_per_tick(tick):
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        tick()
+    return (time.perf_counter() - start) * 1000 / TICKS
+
+def main():
+    for size in (32, 128, 256):
+        ship = furnished_ship(size)
+        ship.update(0.1)  # First tick puts idle entities to sleep
+        scheduled = ms_per_tick(lambda: ship.update(0.1))
+        walked = ms_per_tick(lambda: walk_all_tiles(ship.decks[0], 0.1))
+        print(f"{size:>4}x{size:<4} {len(ship.update_scheduler.active):>6} active: "
+              f"scheduled {scheduled:8.3f} ms/tick, every tile {walked:8.3f} ms/tick")
+
+    # Idle turrets waiting for enemies should cost nothing while no enemy comes near
+    for size in (32, 96):
+        ship, enemy = guarded_ship(size)
+        ship.update(0.1)
+
+        def tick():
+            enemy.x += 0.1
+            ship.update(0.1)
+        scheduled = ms_per_tick(tick)
+        print(f"{size:>4}x{size:<4} {len(ship.update_scheduler._range_waiters):>6} turrets asleep "
+              f"until an enemy comes in range: {scheduled:8.3f} ms/tick")
+
+if __name__ == "__main__":
+    main()
@@ -35,8 +35,12 @@ class BuildEventHandler(BaseEventHandler):
             if current_item.name == "Power Cable":
                 self.game_state.state_manager.change_state(GameStateEnum.BUILDING)
                 self.game_state.cable_system.start_drag(grid_x, grid_y)
-            elif 0 <= grid_x <= self.game_state.ship.decks[0].width and 0 <= grid_y <= self.game_state.ship.decks[0].height:
-                current_item.build(self.game_state.ship, grid_x, grid_y)
+            else:
+                deck = self.game_state.ship.decks[0]
+                # One tile past any edge is allowed so floors can grow the deck
+                if (deck.min_x - 1 <= grid_x <= deck.max_x and
+                        deck.min_y - 1 <= grid_y <= deck.max_y):
+                    current_item.build(self.game_state.ship, grid_x, grid_y)
 
     def handle_left_release(self, event):
         """Handle mouse left button release"""
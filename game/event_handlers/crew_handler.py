@@ -1,7 +1,7 @@
 import pygame
 from .base_handler import BaseEventHandler
 from world.objects import Bed
-from world.pathfinding import find_path
+from world.spatial_hash import CREW
 
 class CrewEventHandler(BaseEventHandler):
     def handle_event(self, event):
@@ -16,16 +16,16 @@ class CrewEventHandler(BaseEventHandler):
         grid_x, grid_y = self.game_state.camera.screen_to_grid(mouse_x, mouse_y)
         
         # Check for crew selection
-        for crew in self.game_state.ship.crew:
-            if int(crew.x) == grid_x and int(crew.y) == grid_y:
-                # Allow selecting sleeping crew members, but don't allow movement
-                self.game_state.selected_crew = crew
-                return True
+        crew = self.game_state.ship.spatial_hash.pick(grid_x, grid_y, layer=CREW)
+        if crew is not None:
+            # Allow selecting sleeping crew members, but don't allow movement
+            self.game_state.selected_crew = crew
+            return True
         
         # Handle crew movement or bed interaction
         if self.game_state.selected_crew and self.game_state.selected_crew.current_action != "sleeping":
             deck = self.game_state.ship.decks[0]
-            if grid_x < deck.width and grid_y < deck.height:
+            if deck.in_bounds(grid_x, grid_y):
                 tile = deck.tiles[grid_y][grid_x]
                 if self.handle_crew_destination(tile, grid_x, grid_y):
                     # Deselect crew after giving them a valid movement command
@@ -35,17 +35,17 @@ class CrewEventHandler(BaseEventHandler):
         crew = self.game_state.selected_crew
         start = (int(crew.x), int(crew.y))
         goal = (grid_x, grid_y)
+        deck = self.game_state.ship.decks[0]
 
+        # Clicks into a sealed-off area are rejected without searching
+        if not deck.is_reachable(start, goal):
+            return False
+
+        # Searches run on the ship's path scheduler; the crew member picks up the path when done
         if tile.object and isinstance(tile.object, Bed):
-            path = find_path(self.game_state.ship.decks[0], start, goal)
-            if path:
-                crew.target_object = tile.object
-                crew.set_path(path)
-                return True
+            crew.request_move(deck, goal, tile.object)
+            return True
         elif tile.is_walkable():
-            path = find_path(self.game_state.ship.decks[0], start, goal)
-            if path:
-                crew.target_object = None
-                crew.set_path(path)
-                return True
-        return False 
\ No newline at end of file
+            crew.request_move(deck, goal)
+            return True
+        return False
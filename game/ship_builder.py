@@ -1,4 +1,4 @@
-from world.deck import Deck
+from world.array_deck import create_deck
 from world.room import Room
 from world.ship import Ship
 from world.modules import LifeSupportModule, ReactorModule
@@ -7,9 +7,12 @@ from models.crew import CrewMember, Skill
 from models.enemies import RangedEnemy
 from world.items import FoodItem
 from world.weapons import LaserTurret
+from utils.tracing import get_channel
+
+_trace = get_channel("ship")
 
 def create_basic_ship(cable_system=None):
-    main_deck = Deck(width=10, height=10, name="Main Deck")
+    main_deck = create_deck(width=10, height=10, name="Main Deck")
     
     # Initialize all tiles as floors by default
     for y in range(main_deck.height):
@@ -40,13 +43,12 @@ def create_basic_ship(cable_system=None):
     main_deck.tiles[5][4].object = storage
 
     # Add a laser turret for defense
-    print("\n--- Adding Laser Turret ---")
     turret = LaserTurret()
     main_deck.tiles[6][7].object = turret
     turret.tile = main_deck.tiles[6][7]
     turret.x = 6
     turret.y = 7
-    print(f"Turret placed at ({turret.x}, {turret.y})")
+    _trace.info("Turret placed at (%s, %s)", turret.x, turret.y)
 
     # Create room from all non-wall tiles
     room_tiles = [tile for row in main_deck.tiles for tile in row if not tile.wall]
@@ -78,7 +80,7 @@ def create_basic_ship(cable_system=None):
     enemy.y = 8.0
     enemy.health = 100
     enemy.max_health = 100
-    print(f"Enemy initialized at ({enemy.x}, {enemy.y}) with health {enemy.health}")
+    _trace.info("Enemy initialized at (%s, %s) with health %s", enemy.x, enemy.y, enemy.health)
     ship.add_enemy(enemy)
 
     return ship
\ No newline at end of file
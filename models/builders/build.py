@@ -2,15 +2,11 @@ from enum import Enum, auto
 from dataclasses import dataclass
 
 from models.builders.object_builder import ObjectBuilder
-from world.modules import (
-    LifeSupportModule, 
-    ReactorModule, 
-    EngineModule,
-    DockingDoorModule
-)
-from world.objects import Bed, StorageContainer, Tank
-from world.tile import Tile
-from world.weapons import LaserTurret
+from world.type_registry import buildable
+# Imported so their buildable classes are registered
+import world.modules
+import world.objects
+import world.weapons
 
 class BuildMode(Enum):
     NONE = auto()
@@ -34,7 +30,7 @@ class BuildableItem:
             return False
         deck = ship.decks[0]
         
-        if not (0 <= x < deck.width and 0 <= y < deck.height):
+        if not deck.in_bounds(x, y):
             return False
         
         tile = deck.tiles[y][x]
@@ -47,12 +43,12 @@ class BuildableItem:
             # Additional check for DockingDoor - needs two adjacent walls
             if self.name == "Docking Door":
                 # Check horizontal placement
-                if x + 1 < deck.width:
+                if deck.in_bounds(x + 1, y):
                     next_tile = deck.tiles[y][x + 1]
                     if next_tile.wall and not next_tile.module:
                         return True
                 # Check vertical placement
-                if y + 1 < deck.height:
+                if deck.in_bounds(x, y + 1):
                     next_tile = deck.tiles[y + 1][x]
                     if next_tile.wall and not next_tile.module:
                         return True
@@ -74,119 +70,66 @@ class BuildableItem:
             
         deck = ship.decks[0]
         
-        # Handle module placement
-        if self.name == "Life Support":
-            deck.tiles[grid_y][grid_x].module = LifeSupportModule()
-            return True
-        elif self.name == "Reactor":
-            deck.tiles[grid_y][grid_x].module = ReactorModule()
-            return True
-        elif self.name == "Engine":
-            deck.tiles[grid_y][grid_x].module = EngineModule()
-            return True
-        elif self.name == "Docking Door":
-            module = DockingDoorModule()
-            module.primary_position = (grid_x, grid_y)
-            
-            # Check horizontal placement
-            if grid_x + 1 < deck.width and deck.tiles[grid_y][grid_x + 1].wall:
-                module.direction = 'horizontal'
-                module.secondary_position = (grid_x + 1, grid_y)
-                deck.tiles[grid_y][grid_x].module = module
-                deck.tiles[grid_y][grid_x + 1].module = module
-                return True
-            # Check vertical placement    
-            elif grid_y + 1 < deck.height and deck.tiles[grid_y + 1][grid_x].wall:
-                module.direction = 'vertical'
-                module.secondary_position = (grid_x, grid_y + 1)
-                deck.tiles[grid_y][grid_x].module = module
-                deck.tiles[grid_y + 1][grid_x].module = module
-                return True
-            return False
-        
-        # Handle wall placement with expansion
-        if self.name == "Basic Wall":
-            # Handle expansion cases
-            if grid_x == deck.width:
-                ship.expand_deck("right", y=grid_y)
-                return True
-            elif grid_x == -1:
-                ship.expand_deck("left", y=grid_y)
-                return True
-            elif grid_y == deck.height:
-                ship.expand_deck("down", x=grid_x)
-                return True
-            elif grid_y == -1:
-                ship.expand_deck("up", x=grid_x)
-                return True
-            
-            # Place single wall within bounds
-            if 0 <= grid_x < deck.width and 0 <= grid_y < deck.height:
-                # Ensure tile exists before setting wall
-                if not deck.tiles[grid_y][grid_x]:
-                    deck.tiles[grid_y][grid_x] = Tile(x=grid_x, y=grid_y)
-                deck.tiles[grid_y][grid_x].wall = True
-                return True
-        
-        # Handle object placement
-        if self.name == "Storage Tank":
-            deck.tiles[grid_y][grid_x].object = Tank()
-            return True
-        elif self.name == "Storage Container":
-            deck.tiles[grid_y][grid_x].object = StorageContainer()
-            return True
-        elif self.name == "Bed":
-            deck.tiles[grid_y][grid_x].object = Bed()
-            return True
-        
-        # Handle floor placement with automatic wall creation
-        elif self.name == "Basic Floor":
-            if not deck.tiles[grid_y][grid_x]:
-                deck.tiles[grid_y][grid_x] = Tile(x=grid_x, y=grid_y)
-            deck.tiles[grid_y][grid_x].wall = False
-            
-            # Check for needed expansion in each direction
-            if grid_x == deck.width - 1:  # Right edge
-                ship.expand_deck("right", y=grid_y)
-            elif grid_x == 0:  # Left edge
-                ship.expand_deck("left", y=grid_y)
-            
-            if grid_y == deck.height - 1:  # Bottom edge
-                ship.expand_deck("down", x=grid_x)
-            elif grid_y == 0:  # Top edge
-                ship.expand_deck("up", x=grid_x)
-            
-            # Create walls in empty space around the edges of the ship
-            for y in range(deck.height):
-                if not deck.tiles[y][0].wall and not deck.tiles[y][0].module and not deck.tiles[y][0].object:
-                    deck.tiles[y][0].wall = True
-                if not deck.tiles[y][deck.width-1].wall and not deck.tiles[y][deck.width-1].module and not deck.tiles[y][deck.width-1].object:
-                    deck.tiles[y][deck.width-1].wall = True
-            
-            for x in range(deck.width):
-                if not deck.tiles[0][x].wall and not deck.tiles[0][x].module and not deck.tiles[0][x].object:
-                    deck.tiles[0][x].wall = True
-                if not deck.tiles[deck.height-1][x].wall and not deck.tiles[deck.height-1][x].module and not deck.tiles[deck.height-1][x].object:
-                    deck.tiles[deck.height-1][x].wall = True
-            
-            return True
-        elif self.name == "Power Cable":
-            ship.cable_system.add_cable(grid_x, grid_y)
-            return True
-        
-        # Add Laser Turret placement
-        elif self.name == "Laser Turret":
-            deck = ship.decks[0]  # Get main deck
-            if 0 <= grid_x < deck.width and 0 <= grid_y < deck.height:
-                turret = LaserTurret()
-                deck.tiles[grid_y][grid_x].object = turret
-                turret.tile = deck.tiles[grid_y][grid_x]
-                turret.x = grid_x
-                turret.y = grid_y
-                turret.set_ship(ship)  # Important: Set the ship reference
-                return True
+        # Walls, floors and cables aren't entities; everything else is built by its registered class
+        terrain_builder = _TERRAIN_BUILDERS.get(self.name)
+        if terrain_builder:
+            return terrain_builder(ship, deck, grid_x, grid_y)
+        entry = buildable(self.name)
+        if entry:
+            return entry.builder(ship, deck, grid_x, grid_y)
         return False
 
+def _build_wall(ship, deck, grid_x, grid_y) -> bool:
+    """Place a wall, expanding the deck when building just past its edge"""
+    if grid_x == deck.max_x:
+        ship.expand_deck("right", y=grid_y)
+        return True
+    elif grid_x == deck.min_x - 1:
+        ship.expand_deck("left", y=grid_y)
+        return True
+    elif grid_y == deck.max_y:
+        ship.expand_deck("down", x=grid_x)
+        return True
+    elif grid_y == deck.min_y - 1:
+        ship.expand_deck("up", x=grid_x)
+        return True
+    
+    # Place single wall within bounds
+    if deck.in_bounds(grid_x, grid_y):
+        deck.tiles[grid_y][grid_x].wall = True
+        return True
+    return False
+
+def _build_floor(ship, deck, grid_x, grid_y) -> bool:
+    """Place a floor with automatic wall creation"""
+    deck.tiles[grid_y][grid_x].wall = False
+    
+    # Check for needed expansion in each direction; existing tiles keep their coordinates
+    if grid_x == deck.max_x - 1:  # Right edge
+        ship.expand_deck("right", y=grid_y)
+    elif grid_x == deck.min_x:  # Left edge
+        ship.expand_deck("left", y=grid_y)
+    
+    if grid_y == deck.max_y - 1:  # Bottom edge
+        ship.expand_deck("down", x=grid_x)
+    elif grid_y == deck.min_y:  # Top edge
+        ship.expand_deck("up", x=grid_x)
+    
+    # Create walls in empty space around the edges of the ship
+    deck.seal_edges()
+    
+    return True
+
+def _build_cable(ship, deck, grid_x, grid_y) -> bool:
+    ship.cable_system.add_cables([(grid_x, grid_y)])
+    return True
+
+_TERRAIN_BUILDERS = {
+    "Basic Wall": _build_wall,
+    "Basic Floor": _build_floor,
+    "Power Cable": _build_cable,
+}
+
 class BuildCategory:
     def __init__(self, mode: BuildMode, items: list[BuildableItem]):
         self.mode = mode
@@ -6,7 +6,7 @@ class CableBuilder(BaseBuilder):
             return False
         deck = ship.decks[0]
         
-        if not (0 <= x < deck.width and 0 <= y < deck.height):
+        if not deck.in_bounds(x, y):
             return False
             
         tile = deck.tiles[y][x]
@@ -16,5 +16,5 @@ class CableBuilder(BaseBuilder):
         if not self.can_build(ship, x, y):
             return False
             
-        ship.cable_system.add_cable(x, y)
+        ship.cable_system.add_cables([(x, y)])
         return True 
\ No newline at end of file
@@ -1,5 +1,4 @@
 from .base_builder import BaseBuilder
-from world.tile import Tile
 
 class FloorBuilder(BaseBuilder):
     def can_build(self, ship, x: int, y: int) -> bool:
@@ -8,11 +7,11 @@ class FloorBuilder(BaseBuilder):
         deck = ship.decks[0]
         
         # Allow building within bounds or one tile beyond
-        if not (-1 <= x <= deck.width and -1 <= y <= deck.height):
+        if not (deck.min_x - 1 <= x <= deck.max_x and deck.min_y - 1 <= y <= deck.max_y):
             return False
             
         # If within bounds, check if tile is empty or is a wall
-        if 0 <= x < deck.width and 0 <= y < deck.height:
+        if deck.in_bounds(x, y):
             tile = deck.tiles[y][x]
             if tile.module or tile.object:
                 return False
@@ -21,7 +20,7 @@ class FloorBuilder(BaseBuilder):
         adjacent_coords = [
             (ax, ay) for ax, ay in [
                 (x+1, y), (x-1, y), (x, y+1), (x, y-1)
-            ] if 0 <= ax < deck.width and 0 <= ay < deck.height
+            ] if deck.in_bounds(ax, ay)
         ]
         return any(not deck.tiles[ay][ax].wall for ax, ay in adjacent_coords)
 
@@ -31,20 +30,26 @@ class FloorBuilder(BaseBuilder):
             
         deck = ship.decks[0]
         
-        # Create floor tile
-        if not deck.tiles[y][x]:
-            deck.tiles[y][x] = Tile(x=x, y=y)
+        # Building one tile past an edge grows the deck to include it first
+        if x == deck.max_x:
+            ship.deck_manager.expand_deck("right", y=y)
+        elif x == deck.min_x - 1:
+            ship.deck_manager.expand_deck("left", y=y)
+        elif y == deck.max_y:
+            ship.deck_manager.expand_deck("down", x=x)
+        elif y == deck.min_y - 1:
+            ship.deck_manager.expand_deck("up", x=x)
         deck.tiles[y][x].wall = False
         
         # Handle expansion if needed
-        if x == deck.width - 1:  # Right edge
+        if x == deck.max_x - 1:  # Right edge
             ship.deck_manager.expand_deck("right", y=y)
-        elif x == 0:  # Left edge
+        elif x == deck.min_x:  # Left edge
             ship.deck_manager.expand_deck("left", y=y)
         
-        if y == deck.height - 1:  # Bottom edge
+        if y == deck.max_y - 1:  # Bottom edge
             ship.deck_manager.expand_deck("down", x=x)
-        elif y == 0:  # Top edge
+        elif y == deck.min_y:  # Top edge
             ship.deck_manager.expand_deck("up", x=x)
         
         # Create walls in empty space around edges
@@ -53,14 +58,4 @@ class FloorBuilder(BaseBuilder):
 
     def _update_edge_walls(self, deck):
         """Create walls in empty space around the edges of the ship"""
-        for y in range(deck.height):
-            if not deck.tiles[y][0].wall and not deck.tiles[y][0].module and not deck.tiles[y][0].object:
-                deck.tiles[y][0].wall = True
-            if not deck.tiles[y][deck.width-1].wall and not deck.tiles[y][deck.width-1].module and not deck.tiles[y][deck.width-1].object:
-                deck.tiles[y][deck.width-1].wall = True
-        
-        for x in range(deck.width):
-            if not deck.tiles[0][x].wall and not deck.tiles[0][x].module and not deck.tiles[0][x].object:
-                deck.tiles[0][x].wall = True
-            if not deck.tiles[deck.height-1][x].wall and not deck.tiles[deck.height-1][x].module and not deck.tiles[deck.height-1][x].object:
-                deck.tiles[deck.height-1][x].wall = True 
\ No newline at end of file
+        deck.seal_edges()
@@ -16,7 +16,7 @@ class ModuleBuilder(BaseBuilder):
             return False
         deck = ship.decks[0]
         
-        if not (0 <= x < deck.width and 0 <= y < deck.height):
+        if not deck.in_bounds(x, y):
             return False
             
         tile = deck.tiles[y][x]
@@ -24,14 +24,14 @@ class ModuleBuilder(BaseBuilder):
         # Special handling for DockingDoor
         if self.name == "Docking Door":
             # Try horizontal placement
-            if x + 1 < deck.width:
+            if deck.in_bounds(x + 1, y):
                 next_tile = deck.tiles[y][x + 1]
                 if (tile.wall and next_tile.wall and 
                     not tile.module and not next_tile.module):
                     return True
                 
             # Try vertical placement
-            if y + 1 < deck.height:
+            if deck.in_bounds(x, y + 1):
                 next_tile = deck.tiles[y + 1][x]
                 if (tile.wall and next_tile.wall and 
                     not tile.module and not next_tile.module):
@@ -57,7 +57,7 @@ class ModuleBuilder(BaseBuilder):
             module.primary_position = (x, y)
             
             # Determine placement direction
-            if x + 1 < deck.width and deck.tiles[y][x + 1].wall:
+            if deck.in_bounds(x + 1, y) and deck.tiles[y][x + 1].wall:
                 module.direction = 'horizontal'
                 module.secondary_position = (x + 1, y)
                 deck.tiles[y][x + 1].module = module
@@ -11,7 +11,7 @@ class ObjectBuilder(BaseBuilder):
             return False
         deck = ship.decks[0]
         
-        if not (0 <= x < deck.width and 0 <= y < deck.height):
+        if not deck.in_bounds(x, y):
             return False
             
         tile = deck.tiles[y][x]
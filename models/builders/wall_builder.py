@@ -1,5 +1,4 @@
 from .base_builder import BaseBuilder
-from world.tile import Tile
 
 class WallBuilder(BaseBuilder):
     def can_build(self, ship, x: int, y: int) -> bool:
@@ -8,11 +7,11 @@ class WallBuilder(BaseBuilder):
         deck = ship.decks[0]
         
         # Allow building within bounds or one tile beyond
-        if not (-1 <= x <= deck.width and -1 <= y <= deck.height):
+        if not (deck.min_x - 1 <= x <= deck.max_x and deck.min_y - 1 <= y <= deck.max_y):
             return False
             
         # If within bounds, check if tile is empty
-        if 0 <= x < deck.width and 0 <= y < deck.height:
+        if deck.in_bounds(x, y):
             tile = deck.tiles[y][x]
             if tile.wall or tile.module or tile.object:
                 return False
@@ -21,7 +20,7 @@ class WallBuilder(BaseBuilder):
         adjacent_coords = [
             (ax, ay) for ax, ay in [
                 (x+1, y), (x-1, y), (x, y+1), (x, y-1)
-            ] if 0 <= ax < deck.width and 0 <= ay < deck.height
+            ] if deck.in_bounds(ax, ay)
         ]
         return len(adjacent_coords) > 0
 
@@ -32,23 +31,21 @@ class WallBuilder(BaseBuilder):
         deck = ship.decks[0]
         
         # Handle expansion cases
-        if x == deck.width:
+        if x == deck.max_x:
             ship.deck_manager.expand_deck("right", y=y)
             return True
-        elif x == -1:
+        elif x == deck.min_x - 1:
             ship.deck_manager.expand_deck("left", y=y)
             return True
-        elif y == deck.height:
+        elif y == deck.max_y:
             ship.deck_manager.expand_deck("down", x=x)
             return True
-        elif y == -1:
+        elif y == deck.min_y - 1:
             ship.deck_manager.expand_deck("up", x=x)
             return True
         
         # Place single wall within bounds
-        if 0 <= x < deck.width and 0 <= y < deck.height:
-            if not deck.tiles[y][x]:
-                deck.tiles[y][x] = Tile(x=x, y=y)
+        if deck.in_bounds(x, y):
             deck.tiles[y][x].wall = True
             return True
             
@@ -3,17 +3,39 @@ from enum import Enum
 from world.objects import Bed
 from world.items import ItemType
 from world.objects import StorageContainer
-from world.pathfinding import find_path
 from utils.config_manager import ConfigManager
+from world.entity_store import (ComponentField, Entity, EntityStore, NEEDS, PATH, POSITION,
+                                TrackedField, VELOCITY)
+from world.path import Path, walking_path
+from world.systems.entity_systems import HUNGER_THRESHOLD, decay_needs, move_entities
+from world.systems.path_scheduler import PRIORITY_NEED, PRIORITY_ORDER
+
+_needs = EntityStore.get_instance().components[NEEDS]
+_paths = EntityStore.get_instance().components[PATH]
 
 class Skill(Enum):
     ENGINEER = "Engineer"
     PILOT = "Pilot"
     SCIENTIST = "Scientist"
 
-class CrewMember:
+class CrewMember(Entity):
+    __slots__ = ("entity", "name", "skill", "ship", "mood", "work_efficiency", "target_x",
+                 "target_y", "_current_action", "target_object", "_path_request",
+                 "path_request_kind", "order_target")
+
+    # Stored in the entity store
+    x = TrackedField(POSITION, "x")
+    y = TrackedField(POSITION, "y")
+    move_speed = ComponentField(VELOCITY, "speed")
+    move_path = TrackedField(PATH, "path")
+    hunger = TrackedField(NEEDS, "hunger")  # Writes re-arm the crew manager's hunger timer
+    sleep = ComponentField(NEEDS, "sleep")
+    oxygen = ComponentField(NEEDS, "oxygen")
+
     def __init__(self, name: str, skill: Skill):
         config = ConfigManager.get_instance()
+        self.entity = EntityStore.get_instance().create(
+            position={}, velocity={}, path={}, needs={'resting': False})
         
         self.name = name
         self.skill = skill
@@ -32,7 +54,7 @@ class CrewMember:
         self.work_efficiency = 1.0  # Multiplier for work speed
         
         # Add movement properties
-        self.move_path = []
+        self.move_path = Path()
         self.move_speed = config.get('crew.movement.base_speed', 2.0)
         self.target_x = None
         self.target_y = None
@@ -40,67 +62,75 @@ class CrewMember:
         self.current_action = None  # Initialize current_action
         self.target_object = None   # Add this to track target object
 
+        # Queued search on the ship's path scheduler, polled each update
+        self.path_request = None
+        self.path_request_kind = None  # "food" or "order"
+        self.order_target = None  # Object a pending move order is heading for
+
+    @property
+    def current_action(self):
+        return self._current_action
+
+    @current_action.setter
+    def current_action(self, action):
+        self._current_action = action
+        _needs.set(self.entity, "resting", action == "sleeping")  # Needs don't decay while asleep
+
+    @property
+    def path_request(self):
+        return self._path_request
+
+    @path_request.setter
+    def path_request(self, request):
+        self._path_request = request
+        _paths.set(self.entity, "pending", request is not None)
+
     def update(self, dt):
+        """Update this crew member alone; CrewManager.update runs the whole crew in batch"""
+        if not self.think():
+            return
+        decay_needs(dt, [self.entity])
+        self.seek_food()
+        if move_entities(dt, [self.entity]):
+            self.arrive()
+
+    def think(self) -> bool:
+        """Rest while asleep, otherwise act on finished path searches; False while asleep"""
         # Skip updates if currently sleeping
         if self.current_action == "sleeping":
             self.rest()
             # Clear any movement path if we somehow got one while sleeping
-            self.move_path = []
+            if self.move_path:
+                self.move_path = Path()
             self.target_object = None
-            return
+            return False
 
-        # Gradually decrease needs over time
-        self.hunger = max(0, self.hunger - 0.1 * dt)  # Increased hunger rate
-        self.sleep = max(0, self.sleep - 0.01 * dt)
-        
+        self._poll_path_request()
+        return True
+
+    def seek_food(self):
         # Check if needs food and not already heading to food
-        if self.hunger < 50 and not self.current_action == "getting_food":
-            # Only look for food if not moving or doing other actions
-            if not self.move_path and not self.target_object:
-                nearest = self.ship.find_nearest_storage(int(self.x), int(self.y))
-                if nearest:
-                    storage, pos = nearest
-                    # Create path to storage
-                    start = (int(self.x), int(self.y))
-                    path = find_path(self.ship.decks[0], start, pos)
-                    if path:
-                        self.target_object = storage
-                        self.current_action = "getting_food"
-                        self.set_path(path)
+        if self.hunger < HUNGER_THRESHOLD and not self.current_action == "getting_food":
+            # Only look for food if not moving, waiting on a path or doing other actions
+            if not self.move_path and not self.target_object and self.path_request is None:
+                # Walk down the shared food flow field; the scheduler builds it over several ticks
+                start = (int(self.x), int(self.y))
+                search = self.ship.flow_field_system.find_nearest_steps(self.ship.decks[0], "food", start)
+                self.path_request = self.ship.path_scheduler.submit(search, PRIORITY_NEED)
+                self.path_request_kind = "food"
 
-        
-        # Handle movement and actions
-        if self.move_path:
-            # Get the next target position
-            target = self.move_path[0]
-            
-            # Calculate movement distance this frame
-            move_distance = self.move_speed * dt
-            
-            # Calculate direction to target
-            dx = target[0] - self.x
-            dy = target[1] - self.y
-            distance = (dx ** 2 + dy ** 2) ** 0.5
-            
-            if distance <= move_distance:
-                # Reached the next point in path
-                self.x, self.y = target
-                self.move_path.pop(0)
-                
-                # If we've reached our destination and have a target object
-                if not self.move_path and self.target_object:
-                    if isinstance(self.target_object, Bed):
-                        self.current_action = "sleeping"
-                        self.rest()
-                    elif isinstance(self.target_object, StorageContainer):
-                        if self.current_action == "getting_food":
-                            self.eat_from_storage(self.target_object)
-                            self.current_action = None
-                            self.target_object = None
-            else:
-                # Move towards target
-                self.x += (dx / distance) * move_distance
-                self.y += (dy / distance) * move_distance
+    def arrive(self):
+        """Use the object at the end of the path, if we were heading for one"""
+        if not self.target_object:
+            return
+        if isinstance(self.target_object, Bed):
+            self.current_action = "sleeping"
+            self.rest()
+        elif isinstance(self.target_object, StorageContainer):
+            if self.current_action == "getting_food":
+                self.eat_from_storage(self.target_object)
+                self.current_action = None
+                self.target_object = None
 
     def eat(self):
         self.hunger = min(100, self.hunger + 30)
@@ -114,8 +144,44 @@ class CrewMember:
             self.current_action = None
             self.target_object = None
 
+    def request_move(self, deck, goal, target_object=None):
+        """Queue a player move order; it replaces any search still pending"""
+        self.cancel_path_request()
+        start = (int(self.x), int(self.y))
+        self.path_request = self.ship.path_scheduler.request_path(deck, start, goal, PRIORITY_ORDER)
+        self.path_request_kind = "order"
+        self.order_target = target_object
+
+    def cancel_path_request(self):
+        if self.path_request is not None:
+            self.path_request.cancel()
+        self.path_request = None
+        self.path_request_kind = None
+        self.order_target = None
+
+    def _poll_path_request(self):
+        """Act on a finished scheduler search"""
+        request = self.path_request
+        if request is None or not request.done:
+            return
+        kind, target = self.path_request_kind, self.order_target
+        self.path_request = None
+        self.path_request_kind = None
+        self.order_target = None
+
+        if kind == "food":
+            if request.result:
+                storage, pos, path = request.result
+                self.target_object = storage
+                self.current_action = "getting_food"
+                self.set_path(path)
+        elif request.result:
+            self.target_object = target
+            self.set_path(request.result)
+
     def set_path(self, path):
-        self.move_path = path[1:]  # Skip first position (current position) 
+        deck = self.ship.decks[0] if self.ship else None
+        self.move_path = walking_path(path, deck)
 
     def eat_from_storage(self, storage: StorageContainer):
         food = storage.remove_item(ItemType.FOOD)
@@ -1,12 +1,33 @@
 from enum import Enum
 from typing import Optional
 
+from world.entity_store import (COOLDOWN, ComponentField, Entity, EntityStore, HEALTH, PATH,
+                                POSITION, TrackedField, VELOCITY)
+from world.path import Path, walking_path
+from world.systems.entity_systems import move_entities
+
 class EnemyType(Enum):
     MELEE = "Melee"
     RANGED = "Ranged"
 
-class Enemy:
+class Enemy(Entity):
+    __slots__ = ("entity", "name", "enemy_type", "ship", "damage", "attack_range", "target_x",
+                 "target_y", "path_request", "current_action", "target_object", "target_crew",
+                 "cooldown_timer")
+
+    # Stored in the entity store
+    x = TrackedField(POSITION, "x")
+    y = TrackedField(POSITION, "y")
+    move_speed = ComponentField(VELOCITY, "speed")
+    move_path = ComponentField(PATH, "path")
+    health = ComponentField(HEALTH, "health")
+    max_health = ComponentField(HEALTH, "max_health")
+    current_cooldown = ComponentField(COOLDOWN, "remaining")
+    attack_cooldown = ComponentField(COOLDOWN, "duration")
+
     def __init__(self, name: str, enemy_type: EnemyType):
+        self.entity = EntityStore.get_instance().create(
+            position={}, velocity={}, path={}, health={}, cooldown={})
         # Basic properties
         self.name = name
         self.enemy_type = enemy_type
@@ -23,12 +44,14 @@ class Enemy:
         self.attack_range = 1 if enemy_type == EnemyType.MELEE else 3
         self.attack_cooldown = 2.0  # Seconds between attacks
         self.current_cooldown = 0
+        self.cooldown_timer = None  # Timer ending the cooldown on the ship's timer wheel
         
         # Movement properties
-        self.move_path = []
+        self.move_path = Path()
         self.move_speed = 1.5  # Slightly slower than crew
         self.target_x = None
         self.target_y = None
+        self.path_request = None  # Queued search on the ship's path scheduler
         
         # AI properties
         self.current_action = None
@@ -36,28 +59,29 @@ class Enemy:
         self.target_crew = None
 
     def update(self, dt):
-        # Update attack cooldown
-        if self.current_cooldown > 0:
+        # Update attack cooldown, unless the ship's timers end it
+        if self.current_cooldown > 0 and self.cooldown_timer is None:
             self.current_cooldown = max(0, self.current_cooldown - dt)
+
+        # Pick up a path the scheduler has finished
+        if self.path_request is not None and self.path_request.done:
+            if self.path_request.result:
+                self.set_path(self.path_request.result)
+            self.path_request = None
             
         # Handle movement similar to crew
-        if self.move_path:
-            target = self.move_path[0]
-            move_distance = self.move_speed * dt
-            
-            dx = target[0] - self.x
-            dy = target[1] - self.y
-            distance = (dx ** 2 + dy ** 2) ** 0.5
-            
-            if distance <= move_distance:
-                self.x, self.y = target
-                self.move_path.pop(0)
-            else:
-                self.x += (dx / distance) * move_distance
-                self.y += (dy / distance) * move_distance
+        move_entities(dt, [self.entity])
+
+    def request_move(self, deck, goal):
+        """Queue a path search towards goal; the path is picked up in a later update"""
+        if self.path_request is not None:
+            self.path_request.cancel()
+        start = (int(self.x), int(self.y))
+        self.path_request = self.ship.path_scheduler.request_path(deck, start, goal)  # Background priority
 
     def set_path(self, path):
-        self.move_path = path[1:]  # Skip first position (current position)
+        deck = self.ship.decks[0] if self.ship else None
+        self.move_path = walking_path(path, deck)
 
     def attack(self, target) -> bool:
         """Attempt to attack a target"""
@@ -70,19 +94,38 @@ class Enemy:
         distance = (dx ** 2 + dy ** 2) ** 0.5
         
         if distance <= self.attack_range:
-            self.current_cooldown = self.attack_cooldown
+            self.start_cooldown()
             return True
         return False
 
+    def start_cooldown(self):
+        """Start the attack cooldown, on the ship's timers when there is a ship"""
+        self.current_cooldown = self.attack_cooldown
+        if self.ship is not None:
+            self.cooldown_timer = self.ship.timers.schedule(self.attack_cooldown, self._cooldown_expired)
+
+    def _cooldown_expired(self):
+        self.cooldown_timer = None
+        self.current_cooldown = 0
+
+    def destroy(self):
+        if self.cooldown_timer is not None:
+            self.cooldown_timer.cancel()
+            self.cooldown_timer = None
+        super().destroy()
+
     def take_damage(self, amount: float):
         """Take damage and return True if enemy dies"""
         self.health = max(0, self.health - amount)
         return self.health <= 0 
 
     def is_dead(self) -> bool:
-        return self.health <= 0
+        # Turrets may still hold an enemy that was removed from the ship
+        return self.destroyed or self.health <= 0
 
 class MeleeEnemy(Enemy):
+    __slots__ = ()
+
     def __init__(self, name: str):
         super().__init__(name, EnemyType.MELEE)
         self.damage = 15  # Higher damage but must be close
@@ -91,6 +134,8 @@ class MeleeEnemy(Enemy):
         self.max_health = 120  # Need to set max_health to match initial health 
 
 class RangedEnemy(Enemy):
+    __slots__ = ()
+
     def __init__(self, name: str):
         super().__init__(name, EnemyType.RANGED)
         self.damage = 8  # Lower damage but can attack from range
@@ -164,8 +164,9 @@ class BuildUI:
             highlight_color = (0, 255, 0, 128) if can_build else (255, 0, 0, 128)
 
             # Only highlight if mouse is over valid grid position
-            if (-1 <= grid_x <= self.game_state.ship.decks[0].width and 
-                -1 <= grid_y <= self.game_state.ship.decks[0].height):
+            deck = self.game_state.ship.decks[0]
+            if (deck.min_x - 1 <= grid_x <= deck.max_x and
+                deck.min_y - 1 <= grid_y <= deck.max_y):
                 
                 # Convert grid position back to screen coordinates
                 screen_x, screen_y = self.game_state.camera.grid_to_screen(grid_x, grid_y)
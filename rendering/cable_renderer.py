@@ -17,7 +17,7 @@ class CableRenderer:
         
         # Draw existing cables
         for (x, y), cable in cable_system.cables.items():
-            if 0 <= x < deck.width and 0 <= y < deck.height:
+            if deck.in_bounds(x, y):
                 screen_x, screen_y = camera.grid_to_screen(x, y)
                 rect = pygame.Rect(screen_x, screen_y, tile_size, tile_size)
                 
@@ -38,7 +38,7 @@ class CableRenderer:
         
         # Draw preview cables
         for x, y in cable_system.preview_cables:
-            if 0 <= x < deck.width and 0 <= y < deck.height:
+            if deck.in_bounds(x, y):
                 screen_x, screen_y = camera.grid_to_screen(x, y)
                 rect = pygame.Rect(screen_x, screen_y, tile_size, tile_size)
                 
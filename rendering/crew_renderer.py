@@ -2,6 +2,10 @@ import pygame
 from .base_renderer import BaseRenderer
 
 class CrewRenderer(BaseRenderer):
+    def __init__(self):
+        super().__init__()
+        self._path_points = []  # Reused between frames by draw_path
+
     def draw_crew(self, screen, crew_list, camera, selected_crew=None):
         """Draw all crew members"""
         for crew in crew_list:
@@ -27,7 +31,8 @@ class CrewRenderer(BaseRenderer):
         if not crew or not crew.move_path:
             return
             
-        path_points = []
+        path_points = self._path_points
+        path_points.clear()
         start_x, start_y = camera.world_to_screen(
             crew.x * self.game_constants.TILE_SIZE + self.game_constants.TILE_SIZE // 2,
             crew.y * self.game_constants.TILE_SIZE + self.game_constants.TILE_SIZE // 2
@@ -41,4 +46,5 @@ class CrewRenderer(BaseRenderer):
             )
             path_points.append((screen_x, screen_y))
             
-        pygame.draw.lines(screen, (255, 255, 0), False, path_points, 2) 
\ No newline at end of file
+        if len(path_points) > 1:
+            pygame.draw.lines(screen, (255, 255, 0), False, path_points, 2) 
\ No newline at end of file
@@ -1,14 +1,15 @@
 import pygame
 from .base_renderer import BaseRenderer
-from world.modules import LifeSupportModule, ReactorModule, EngineModule, DockingDoorModule
+from world.modules import DockingDoorModule
+from world.type_registry import PRODUCER, info_of, power_role, set_renderer
 
 class ModuleRenderer(BaseRenderer):
     def draw_modules(self, screen, deck, camera):
         """Draw all modules and their power status"""
         tile_size = self.get_scaled_size(camera)
         
-        for y in range(deck.height):
-            for x in range(deck.width):
+        for y in range(deck.min_y, deck.max_y):
+            for x in range(deck.min_x, deck.max_x):
                 tile = deck.tiles[y][x]
                 if not tile.module:
                     continue
@@ -19,39 +20,43 @@ class ModuleRenderer(BaseRenderer):
 
     def _draw_module(self, screen, module, x, y, size):
         """Draw a specific module"""
-        image_key = None
-        if isinstance(module, LifeSupportModule):
-            image_key = 'life_support'
-        elif isinstance(module, ReactorModule):
-            image_key = 'reactor'
-        elif isinstance(module, EngineModule):
-            image_key = 'engine'
-        elif isinstance(module, DockingDoorModule):
-            # Only draw at primary position
-            if (x // size, y // size) == module.primary_position:
-                image_key = 'docking_door'
-                if module.direction == 'horizontal':
-                    size = (size * 2, size)  # Double width
-                else:
-                    size = (size, size * 2)  # Double height
-        
-        if image_key:
-            image = self.asset_loader.get_image(image_key)
-            if image:
-                scaled_image = pygame.transform.scale(image, size if isinstance(size, tuple) else (size, size))
-                if not module.is_powered():
-                    tinted = scaled_image.copy()
-                    tinted.fill((255, 0, 0, 128), special_flags=pygame.BLEND_RGBA_MULT)
-                    screen.blit(tinted, (x, y))
-                else:
-                    screen.blit(scaled_image, (x, y))
+        info = info_of(module)
+        if info is None or info.sprite is None:
+            return
+        if info.renderer:
+            info.renderer(self, screen, module, x, y, size)
+        else:
+            self._draw_sprite(screen, module, info.sprite, x, y, (size, size))
+
+    def _draw_docking_door(self, screen, module, x, y, size):
+        """Draw a docking door once, across both its tiles"""
+        # Only draw at primary position
+        if (x // size, y // size) != module.primary_position:
+            return
+        if module.direction == 'horizontal':
+            size = (size * 2, size)  # Double width
+        else:
+            size = (size, size * 2)  # Double height
+        self._draw_sprite(screen, module, 'docking_door', x, y, size)
+
+    def _draw_sprite(self, screen, module, image_key, x, y, size):
+        """Draw a module's image, tinted red when unpowered"""
+        image = self.asset_loader.get_image(image_key)
+        if image:
+            scaled_image = pygame.transform.scale(image, size)
+            if not module.is_powered():
+                tinted = scaled_image.copy()
+                tinted.fill((255, 0, 0, 128), special_flags=pygame.BLEND_RGBA_MULT)
+                screen.blit(tinted, (x, y))
+            else:
+                screen.blit(scaled_image, (x, y))
 
     def _draw_power_status(self, screen, module, x, y, size, camera):
         """Draw power status text for a module"""
         font_size = int(20 * camera.zoom)
         font = pygame.font.Font(None, max(10, font_size))
         
-        if isinstance(module, ReactorModule):
+        if power_role(module) == PRODUCER:
             text = f"+{module.power_output}"
             text_color = (100, 255, 100)
         else:
@@ -83,4 +88,6 @@ class ModuleRenderer(BaseRenderer):
                        text_rect.move(dx, dy))
         
         # Draw main text
-        screen.blit(text_surface, text_rect) 
\ No newline at end of file
+        screen.blit(text_surface, text_rect)
+
+set_renderer(DockingDoorModule, ModuleRenderer._draw_docking_door)
@@ -29,8 +29,8 @@ class SelectionRenderer(BaseRenderer):
             
         tile_size = self.get_scaled_size(camera)
         
-        for y in range(deck.height):
-            for x in range(deck.width):
+        for y in range(deck.min_y, deck.max_y):
+            for x in range(deck.min_x, deck.max_x):
                 tile = deck.tiles[y][x]
                 if tile and tile.object and isinstance(tile.object, Bed):
                     screen_x, screen_y = self.get_screen_position(camera, x, y)
@@ -1,22 +1,48 @@
 import pygame
 from .base_renderer import BaseRenderer
+from world.array_deck import ArrayDeck, np
+
+WALL_COLOR = (50, 50, 50)
+FLOOR_COLOR = (200, 200, 200)
 
 class TileRenderer(BaseRenderer):
     def draw_tiles(self, screen, deck, camera):
         """Draw all base tiles"""
         tile_size = self.get_scaled_size(camera)
+        if isinstance(deck, ArrayDeck):
+            self._draw_tile_layers(screen, deck, camera, tile_size)
+            return
         
-        for y in range(deck.height):
-            for x in range(deck.width):
+        for y in range(deck.min_y, deck.max_y):
+            for x in range(deck.min_x, deck.max_x):
                 tile = deck.tiles[y][x]
                 screen_x, screen_y = self.get_screen_position(camera, x, y)
                 rect = pygame.Rect(screen_x, screen_y, tile_size, tile_size)
                 
                 # Draw the tile
-                color = (50, 50, 50) if tile.wall else (200, 200, 200)
+                color = WALL_COLOR if tile.wall else FLOOR_COLOR
                 pygame.draw.rect(screen, color, rect)
                 pygame.draw.rect(screen, (0, 0, 0), rect, 1)  # Border
 
+    def _draw_tile_layers(self, screen, deck, camera, tile_size):
+        """Draw an ArrayDeck from its wall layer: one scaled blit plus grid lines"""
+        colors = np.where(deck.walls[..., None], WALL_COLOR, FLOOR_COLOR).astype(np.uint8)
+        surface = pygame.surfarray.make_surface(colors.swapaxes(0, 1))  # surfarray is (x, y)
+        origin_x, origin_y = self.get_screen_position(camera, deck.min_x, deck.min_y)
+        end_x, end_y = self.get_screen_position(camera, deck.max_x, deck.max_y)
+        screen.blit(pygame.transform.scale(surface, (end_x - origin_x, end_y - origin_y)),
+                    (origin_x, origin_y))
+
+        # Each tile has a 1px border on all four sides, as in the per-tile path
+        for x in range(deck.min_x, deck.max_x):
+            screen_x = self.get_screen_position(camera, x, deck.min_y)[0]
+            for edge in (screen_x, screen_x + tile_size - 1):
+                pygame.draw.line(screen, (0, 0, 0), (edge, origin_y), (edge, end_y - 1))
+        for y in range(deck.min_y, deck.max_y):
+            screen_y = self.get_screen_position(camera, deck.min_x, y)[1]
+            for edge in (screen_y, screen_y + tile_size - 1):
+                pygame.draw.line(screen, (0, 0, 0), (origin_x, edge), (end_x - 1, edge))
+
     def draw_build_highlights(self, screen, ship, camera, current_item):
         """Draw build mode highlights"""
         if not current_item or not ship.decks:
@@ -25,8 +51,8 @@ class TileRenderer(BaseRenderer):
         deck = ship.decks[0]
         tile_size = self.get_scaled_size(camera)
         
-        for y in range(deck.height):
-            for x in range(deck.width):
+        for y in range(deck.min_y, deck.max_y):
+            for x in range(deck.min_x, deck.max_x):
                 if current_item.can_build(ship, x, y):
                     screen_x, screen_y = self.get_screen_position(camera, x, y)
                     s = pygame.Surface((tile_size, tile_size))
@@ -0,0 +1,157 @@
+import threading
+import time
+from collections import deque
+from enum import IntEnum
+from queue import SimpleQueue
+from typing import NamedTuple
+
+from utils.config_manager import ConfigManager
+
+class TraceLevel(IntEnum):
+    OFF = 0
+    INFO = 1
+    DEBUG = 2
+
+class TraceRecord(NamedTuple):
+    timestamp: float
+    channel: str
+    level: TraceLevel
+    message: str
+    args: tuple
+
+    def format(self) -> str:
+        """Build the final text; only done when a sink actually needs it"""
+        text = self.message % self.args if self.args else self.message
+        return f"{self.timestamp:.6f} [{self.channel}] {self.level.name}: {text}"
+
+class RingSink:
+    """Keeps the most recent records in memory, unformatted"""
+    def __init__(self, capacity: int = 10000):
+        self.records = deque(maxlen=capacity)
+
+    def write(self, record: TraceRecord):
+        self.records.append(record)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    def lines(self) -> list[str]:
+        return [record.format() for record in self.records]
+
+class FileSink:
+    """Buffers records and writes them to a file from a background thread"""
+    def __init__(self, path: str, batch_size: int = 500):
+        self.path = path
+        self.batch_size = batch_size
+        self._buffer = []
+        self._queue = SimpleQueue()
+        self._writer = threading.Thread(target=self._write_batches, daemon=True)
+        self._writer.start()
+
+    def write(self, record: TraceRecord):
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._queue.put(self._buffer)
+            self._buffer = []
+
+    def close(self):
+        """Write out everything still buffered and stop the writer thread"""
+        self.flush()
+        self._queue.put(None)
+        self._writer.join()
+
+    def _write_batches(self):
+        with open(self.path, 'a') as f:
+            while True:
+                batch = self._queue.get()
+                if batch is None:
+                    return
+                f.write("\n".join(record.format() for record in batch) + "\n")
+                f.flush()
+
+class TraceChannel:
+    """A named trace channel.
+
+    Call sites check the *_enabled flag before logging so that a disabled
+    channel costs one attribute lookup and no string formatting:
+
+        if _trace.debug_enabled:
+            _trace.debug("Firing at %s", target.name)
+    """
+    def __init__(self, name: str, tracer: 'Tracer'):
+        self.name = name
+        self._tracer = tracer
+        self.level = TraceLevel.OFF
+        self.info_enabled = False
+        self.debug_enabled = False
+
+    def set_level(self, level: TraceLevel):
+        self.level = TraceLevel(level)
+        self.info_enabled = self.level >= TraceLevel.INFO
+        self.debug_enabled = self.level >= TraceLevel.DEBUG
+
+    def info(self, message: str, *args):
+        if self.info_enabled:
+            self._tracer.emit(self.name, TraceLevel.INFO, message, args)
+
+    def debug(self, message: str, *args):
+        if self.debug_enabled:
+            self._tracer.emit(self.name, TraceLevel.DEBUG, message, args)
+
+class Tracer:
+    _instance = None
+
+    def __init__(self):
+        if Tracer._instance is not None:
+            raise Exception("Tracer is a singleton!")
+        Tracer._instance = self
+        self.channels: dict[str, TraceChannel] = {}
+        self.sink = RingSink()
+        self.configure(ConfigManager.get_instance().get('game.tracing', {}))
+
+    @staticmethod
+    def get_instance():
+        if Tracer._instance is None:
+            Tracer()
+        return Tracer._instance
+
+    def configure(self, config: dict):
+        """Apply a tracing config: sink type and per-channel levels"""
+        self.sink.close()
+        if config.get('sink') == 'file':
+            self.sink = FileSink(config.get('file', 'trace.log'),
+                                 config.get('batch_size', 500))
+        else:
+            self.sink = RingSink(config.get('ring_size', 10000))
+
+        for name, level in (config.get('channels') or {}).items():
+            self.channel(name).set_level(TraceLevel[str(level).upper()])
+
+    def channel(self, name: str) -> TraceChannel:
+        """Get (or create) the channel with the given name"""
+        if name not in self.channels:
+            self.channels[name] = TraceChannel(name, self)
+        return self.channels[name]
+
+    def set_level(self, name: str, level: TraceLevel):
+        self.channel(name).set_level(level)
+
+    def emit(self, channel: str, level: TraceLevel, message: str, args: tuple):
+        self.sink.write(TraceRecord(time.perf_counter(), channel, level, message, args))
+
+    def flush(self):
+        self.sink.flush()
+
+    def close(self):
+        self.sink.close()
+
+def get_channel(name: str) -> TraceChannel:
+    """Shortcut for Tracer.get_instance().channel(name)"""
+    return Tracer.get_instance().channel(name)
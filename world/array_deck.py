@@ -0,0 +1,242 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; create_deck falls back to Tile objects
+    np = None
+
+from utils.config_manager import ConfigManager
+from utils.tracing import get_channel
+from world.deck import Deck
+from world.tile import FLOOR_TYPES, Tile, floor_type_id
+
+_trace = get_channel("ship")
+
+class TileView(Tile):
+    """Tile-compatible view of one cell of an ArrayDeck; all state lives in the deck's layers"""
+    __slots__ = ()
+
+    def __init__(self, x, y, deck):
+        self.x = x
+        self.y = y
+        self.deck = deck
+
+    def __eq__(self, other):
+        return (isinstance(other, TileView) and other.deck is self.deck and
+                other.x == self.x and other.y == self.y)
+
+    def __hash__(self):
+        return hash((id(self.deck), self.x, self.y))
+
+    def is_walkable(self):
+        return bool(self.deck.walkable[self._cell])
+
+    @property
+    def _cell(self):
+        """(row, column) of this tile in the deck's layers"""
+        return self.deck.cell(self.x, self.y)
+
+    @property
+    def wall(self):
+        return bool(self.deck.walls[self._cell])
+
+    @wall.setter
+    def wall(self, value):
+        old = self.wall
+        if bool(value) != old:
+            self.deck.walls[self._cell] = value
+            self._notify("wall", old)
+
+    @property
+    def object(self):
+        return self.deck.entity(self.deck.object_ids[self._cell])
+
+    @object.setter
+    def object(self, value):
+        old = self.object
+        if value is not old:
+            self.deck.assign(self.deck.object_ids, self._cell, value)
+            self._notify("object", old)
+
+    @property
+    def module(self):
+        return self.deck.entity(self.deck.module_ids[self._cell])
+
+    @module.setter
+    def module(self, value):
+        old = self.module
+        if value is not old:
+            self.deck.assign(self.deck.module_ids, self._cell, value)
+            self._notify("module", old)
+
+    @property
+    def cable(self):
+        return self.deck.entity(self.deck.cable_ids[self._cell])
+
+    @cable.setter
+    def cable(self, value):
+        old = self.cable
+        if value is not old:
+            self.deck.assign(self.deck.cable_ids, self._cell, value)
+            self._notify("cable", old)
+
+    @property
+    def floor_type(self):
+        return FLOOR_TYPES[self.deck.floor_types[self._cell]]
+
+    @floor_type.setter
+    def floor_type(self, value):
+        self.deck.floor_types[self._cell] = floor_type_id(value)
+
+class TileRow:
+    """One row of an ArrayDeck, indexable by world x like a ChunkedGrid row"""
+    def __init__(self, deck, y):
+        self.deck = deck
+        self.y = y
+
+    def __len__(self):
+        return self.deck.width
+
+    def __getitem__(self, x):
+        return self.deck.tiles.get(x, self.y)
+
+    def __iter__(self):
+        for x in range(self.deck.min_x, self.deck.max_x):
+            yield TileView(x, self.y, self.deck)
+
+class TileGrid:
+    """deck.tiles for an ArrayDeck: tiles[y][x] returns a TileView, or None outside the deck"""
+    def __init__(self, deck):
+        self.deck = deck
+
+    def __len__(self):
+        return self.deck.height
+
+    def __getitem__(self, y):
+        return TileRow(self.deck, y)
+
+    def get(self, x, y):
+        deck = self.deck
+        if not (deck.min_x <= x < deck.min_x + deck.width and deck.min_y <= y < deck.min_y + deck.height):
+            return None
+        return TileView(x, y, deck)
+
+    def __iter__(self):
+        for y in range(self.deck.min_y, self.deck.max_y):
+            yield TileRow(self.deck, y)
+
+class ArrayDeck(Deck):
+    """Deck stored as dense NumPy layers (struct of arrays) instead of Tile objects.
+
+    Modules, objects and cables are kept in an id table and referenced from
+    int32 layers, so whole-deck questions become array operations. Layers
+    are dense, so growing left or up shifts the arrays; tile coordinates
+    stay stable through the deck's min_x/min_y offset.
+    """
+    LAYERS = ("walls", "floor_types", "walkable", "cable_ids", "module_ids", "object_ids")
+
+    def __init__(self, width, height, name="Deck"):
+        self.walls = np.zeros((height, width), dtype=bool)
+        self.floor_types = np.zeros((height, width), dtype=np.uint8)
+        self.walkable = np.ones((height, width), dtype=bool)
+        self.cable_ids = np.zeros((height, width), dtype=np.int32)
+        self.module_ids = np.zeros((height, width), dtype=np.int32)
+        self.object_ids = np.zeros((height, width), dtype=np.int32)
+
+        self._entities = [None]  # id -> entity; id 0 means empty
+        self._entity_refs = [0]  # id -> number of cells referencing it
+        self._entity_ids = {}  # entity -> id
+        self._free_ids = []
+        super().__init__(width, height, name)
+
+    def _create_tiles(self):
+        return TileGrid(self)
+
+    def cell(self, x, y):
+        """Layer index (row, column) of the tile at world (x, y)"""
+        return y - self.min_y, x - self.min_x
+
+    def walkable_grid(self):
+        return self.walkable.tolist()
+
+    # ---- entity table ----
+
+    def entity(self, entity_id):
+        return self._entities[entity_id] if entity_id else None
+
+    def assign(self, layer, cell, entity):
+        """Point one cell of an id layer at entity (or clear it with None)"""
+        old_id = int(layer[cell])
+        layer[cell] = self._acquire(entity) if entity is not None else 0
+        if old_id:
+            self._release(old_id)
+
+    def _acquire(self, entity):
+        entity_id = self._entity_ids.get(entity)
+        if entity_id is None:
+            if self._free_ids:
+                entity_id = self._free_ids.pop()
+            else:
+                entity_id = len(self._entities)
+                self._entities.append(None)
+                self._entity_refs.append(0)
+            self._entities[entity_id] = entity
+            self._entity_ids[entity] = entity_id
+        self._entity_refs[entity_id] += 1
+        return entity_id
+
+    def _release(self, entity_id):
+        self._entity_refs[entity_id] -= 1
+        if self._entity_refs[entity_id] == 0:
+            del self._entity_ids[self._entities[entity_id]]
+            self._entities[entity_id] = None
+            self._free_ids.append(entity_id)
+
+    # ---- change tracking ----
+
+    def tile_changed(self, tile, change: str, old=None):
+        if change in ("wall", "object"):
+            # TileView.is_walkable reads this layer, so work it out from the wall and object
+            self.walkable[self.cell(tile.x, tile.y)] = Tile.walkable_with(tile.wall, tile.object)
+        super().tile_changed(tile, change, old)
+
+    # ---- vectorized whole-deck queries ----
+
+    def count_floor_tiles(self) -> int:
+        return int(np.count_nonzero(~self.walls))
+
+    def seal_edges(self):
+        empty = ~self.walls & (self.module_ids == 0) & (self.object_ids == 0)
+        border = np.zeros_like(empty)
+        border[0, :] = border[-1, :] = border[:, 0] = border[:, -1] = True
+        for row, column in np.argwhere(empty & border):
+            self.tiles[row + self.min_y][column + self.min_x].wall = True
+
+    def expand(self, direction: str, index: int):
+        """Grow by one row or column; the new tile at index along the new edge is a wall"""
+        fills = {"walls": False, "floor_types": floor_type_id("metal_floor"), "walkable": True,
+                 "cable_ids": 0, "module_ids": 0, "object_ids": 0}
+        axis = 1 if direction in ("left", "right") else 0
+        at = 0 if direction in ("left", "up") else self.walls.shape[axis]
+        for name in self.LAYERS:
+            setattr(self, name, np.insert(getattr(self, name), at, fills[name], axis=axis))
+
+        if direction == "left":
+            self.min_x -= 1
+        elif direction == "up":
+            self.min_y -= 1
+        self.height, self.width = self.walls.shape
+
+        if axis == 1:
+            cell = self.cell(self.min_x if direction == "left" else self.max_x - 1, index)
+        else:
+            cell = self.cell(index, self.min_y if direction == "up" else self.max_y - 1)
+        self.walls[cell] = True
+        self.walkable[cell] = False
+
+def create_deck(width, height, name="Deck"):
+    """Create a deck using the storage chosen by game.deck.storage ("objects" or "arrays")"""
+    storage = ConfigManager.get_instance().get('game.deck.storage', 'objects')
+    if storage == 'arrays':
+        if np is not None:
+            return ArrayDeck(width, height, name)
+        _trace.info("NumPy is not installed; using object deck storage")
+    return Deck(width, height, name)
@@ -1,10 +1,17 @@
-from world.modules import ReactorModule
+from contextlib import contextmanager
+
+from world.change_journal import (JournalReader, OBJECT_PLACED, OBJECT_REMOVED, MODULE_PLACED,
+                                  MODULE_REMOVED)
+from world.type_registry import CONSUMER, PRODUCER, power_role
 
 
 class Cable:
+    __slots__ = ("powered", "network_id", "network", "connected_modules")
+
     def __init__(self):
         self.powered = False
         self.network_id = None
+        self.network = None
         self.connected_modules = []  # List of connected modules
 
 class Network:
@@ -24,33 +31,71 @@ class CableSystem:
         self.drag_end = None
         self.networks = []  # List of connected cable networks
         self.ship = None  # Reference to ship will be set later
+        self.topology_revision = 0  # Bumped on every cable/module/object change
+        self.power_revision = 0  # Bumped whenever power is redistributed
+        self._network_at = {}  # (x, y) -> Network owning the cable there
+        self._dirty_networks = set()  # Networks whose power must be recomputed
+        self._released = set()  # Modules/objects that may have lost their network
+        self._deck = None  # Deck whose journal we read for module/object changes
+        self._journal = None  # JournalReader on that deck
+        self._needs_rebuild = True
+        self._batch_depth = 0  # Network updates are deferred while > 0
+        self._placeable = {}  # (x, y) -> can_place_cable result for the current drag
     
     def can_place_cable(self, x: int, y: int) -> bool:
         """Check if a cable can be placed at the given coordinates"""
-        if not (0 <= x < self.ship.decks[0].width and 
-                0 <= y < self.ship.decks[0].height):
+        if not self.ship.decks[0].in_bounds(x, y):
             return False
         
         # Can only place cables on floor tiles (not walls)
         tile = self.ship.decks[0].tiles[y][x]
         return not tile.wall
     
+    @contextmanager
+    def batch(self):
+        """Group cable edits so networks are recomputed once when the batch ends"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._update_networks()
+    
     def add_cable(self, x: int, y: int):
         """Add a cable at the specified coordinates"""
-        grid_x = int(x)
-        grid_y = int(y)
-        if self.can_place_cable(grid_x, grid_y) and (grid_x, grid_y) not in self.cables:
-            cable = Cable()
-            self.cables[(grid_x, grid_y)] = cable
-            # Set the cable reference on the tile
-            self.ship.decks[0].tiles[grid_y][grid_x].cable = cable
-            self._update_networks()
+        return self.add_cables([(x, y)]) > 0
+    
+    def add_cables(self, positions) -> int:
+        """Validate and add several cables, updating networks only once.
+        Returns the number of cables actually placed."""
+        placed = 0
+        with self.batch():
+            for x, y in positions:
+                if self._place_cable(int(x), int(y)):
+                    placed += 1
+        return placed
+    
+    def _place_cable(self, grid_x: int, grid_y: int) -> bool:
+        """Insert a single cable without recomputing power"""
+        if not self.can_place_cable(grid_x, grid_y) or (grid_x, grid_y) in self.cables:
+            return False
+        cable = Cable()
+        self.cables[(grid_x, grid_y)] = cable
+        # Set the cable reference on the tile
+        self.ship.decks[0].tiles[grid_y][grid_x].cable = cable
+        self._insert_cable((grid_x, grid_y))
+        return True
     
     def remove_cable(self, x: int, y: int):
         """Remove a cable at the specified coordinates"""
         if (x, y) in self.cables:
-            del self.cables[(x, y)]
-            self._update_networks()
+            with self.batch():
+                del self.cables[(x, y)]
+                deck = self.ship.decks[0]
+                if deck.in_bounds(x, y):
+                    deck.tiles[y][x].cable = None
+                self._delete_cable((x, y))
     
     def start_drag(self, x: int, y: int):
         """Start cable dragging operation"""
@@ -58,32 +103,59 @@ class CableSystem:
         grid_y = int(y)
         if self.can_place_cable(grid_x, grid_y):
             self.drag_start = (grid_x, grid_y)
+            self.drag_end = None
             self.preview_cables.clear()
+            self._placeable = {}
     
     def update_drag(self, x: int, y: int):
         """Update cable preview during drag"""
         if self.drag_start:
-            grid_x = max(0, min(int(x), self.ship.decks[0].width - 1))
-            grid_y = max(0, min(int(y), self.ship.decks[0].height - 1))
+            deck = self.ship.decks[0]
+            grid_x = max(deck.min_x, min(int(x), deck.max_x - 1))
+            grid_y = max(deck.min_y, min(int(y), deck.max_y - 1))
+            # Mouse motion inside the same tile doesn't change the preview
+            if (grid_x, grid_y) == self.drag_end:
+                return
             self.drag_end = (grid_x, grid_y)
             self._update_preview()
     
     def end_drag(self):
         """Place cables based on preview"""
-        for x, y in self.preview_cables:
-            self.add_cable(x, y)
+        self.add_cables(self.preview_cables)
         self.preview_cables.clear()
+        self._placeable = {}
         self.drag_start = None
         self.drag_end = None
     
     def _update_preview(self):
         """Update preview cables based on drag coordinates"""
-        self.preview_cables.clear()
         if not self.drag_start or not self.drag_end:
+            self.preview_cables.clear()
             return
-            
-        x1, y1 = self.drag_start
-        x2, y2 = self.drag_end
+        
+        line = {pos for pos in self._line_positions(self.drag_start, self.drag_end)
+                if self._is_placeable_cached(pos)}
+        
+        # The line is rebuilt whenever the end tile changes; the preview set
+        # itself only gets the tiles that entered or left it
+        preview = self.preview_cables
+        removed = preview - line
+        added = line - preview
+        preview -= removed
+        preview |= added
+    
+    def _is_placeable_cached(self, pos) -> bool:
+        """can_place_cable, remembered for the duration of a drag"""
+        placeable = self._placeable.get(pos)
+        if placeable is None:
+            placeable = self.can_place_cable(*pos)
+            self._placeable[pos] = placeable
+        return placeable
+    
+    def _line_positions(self, start, end):
+        """Yield the 4-connected line of tiles from start to end"""
+        x1, y1 = start
+        x2, y2 = end
         
         # Create a path of coordinates between start and end
         dx = abs(x2 - x1)
@@ -97,9 +169,7 @@ class CableSystem:
         dy *= 2
 
         for _ in range(n):
-            # Only add to preview if cable can be placed here
-            if self.can_place_cable(x, y):
-                self.preview_cables.add((x, y))
+            yield (x, y)
             if error > 0:
                 x += x_inc
                 error -= dy
@@ -112,77 +182,199 @@ class CableSystem:
         self._update_networks()
     
     def _update_networks(self):
-        """Internal method to update connected cable networks and power distribution"""
-        # Clear existing networks and module connections
-        self.networks = []
-        visited_cables = set()
-        
-        # Reset all module power and cable references
-        if self.ship and self.ship.decks:
-            for deck in self.ship.decks:
-                for y in range(deck.height):
-                    for x in range(deck.width):
-                        tile = deck.tiles[y][x]
-                        # Reset module power
-                        if tile.module and not isinstance(tile.module, ReactorModule):
-                            tile.module.power_available = 0
-                        # Update cable reference
-                        if (x, y) in self.cables:
-                            tile.cable = self.cables[(x, y)]
-                        else:
-                            tile.cable = None
-
-        # Find all connected networks
-        for pos, cable in self.cables.items():
-            if pos not in visited_cables:
-                network = self._find_connected_network(pos, visited_cables)
+        """Recompute power only for networks touched since the last update"""
+        self._attach_to_deck()
+        self._read_journal()
+        if self._needs_rebuild:
+            self._rebuild_networks()
+        
+        # Steady state: nothing changed, nothing to do
+        if not self._dirty_networks and not self._released:
+            return
+        
+        for network in self._dirty_networks:
+            self._refresh_network(network)
+        self._dirty_networks.clear()
+        self._reset_released()
+        self.power_revision += 1
+    
+    def _attach_to_deck(self):
+        """Follow the journal of the deck cables are laid on"""
+        if not self.ship or not self.ship.decks:
+            return
+        deck = self.ship.decks[0]
+        if deck is self._deck:
+            return
+        self._deck = deck
+        self._journal = JournalReader(deck.journal)
+        self._needs_rebuild = True
+    
+    def _read_journal(self):
+        """Mark networks next to modules/objects placed or removed since the last update"""
+        if self._journal is None:
+            return
+        events = self._journal.read()
+        if events is None:
+            self._needs_rebuild = True  # Fell behind the journal; start over
+            self.topology_revision += 1
+            return
+        # Resizes need nothing: tiles keep their coordinates, so cables stay valid
+        for event in events:
+            if event.kind not in (MODULE_PLACED, MODULE_REMOVED, OBJECT_PLACED, OBJECT_REMOVED):
+                continue
+            for pos in [event.pos] + self._adjacent(*event.pos):
+                network = self._network_at.get(pos)
                 if network:
-                    self.networks.append(network)
-                    # Set network reference on all cables in the network
-                    for cable_pos in network.cables:
-                        self.cables[cable_pos].powered = network.total_power > 0
-                        self.cables[cable_pos].network = network
-                    self._distribute_power(network)
-    
-    def _find_connected_network(self, start_pos, visited):
-        """Find all connected cables and modules in a network"""
-        network = Network()
+                    self._dirty_networks.add(network)
+            self.topology_revision += 1
+    
+    def _adjacent(self, x, y):
+        return [(x+1, y), (x-1, y), (x, y+1), (x, y-1)]
+    
+    def _insert_cable(self, pos):
+        """Union the new cable with the networks of its neighbouring cables"""
+        neighbours = {self._network_at[adj] for adj in self._adjacent(*pos) if adj in self._network_at}
+        if neighbours:
+            # Keep the largest network and fold the others into it
+            network = max(neighbours, key=lambda n: len(n.cables))
+            for other in neighbours:
+                if other is not network:
+                    self._merge_networks(network, other)
+        else:
+            network = Network()
+            self.networks.append(network)
         
+        network.cables.add(pos)
+        self._network_at[pos] = network
+        self._dirty_networks.add(network)
+        self.topology_revision += 1
+    
+    def _merge_networks(self, network, other):
+        """Move every cable of `other` into `network`"""
+        for pos in other.cables:
+            self._network_at[pos] = network
+        network.cables |= other.cables
+        self._release_network(other)
+    
+    def _delete_cable(self, pos):
+        """Remove a cable and re-flood only the network it belonged to"""
+        network = self._network_at.pop(pos, None)
+        self.topology_revision += 1
+        if not network:
+            return
+        
+        network.cables.discard(pos)
+        remaining = network.cables
+        self._release_network(network)
+        
+        visited = set()
+        for start in remaining:
+            if start not in visited:
+                self._add_network(self._flood_cables(start, visited))
+    
+    def _release_network(self, network):
+        """Drop a network, remembering its members so stale power can be cleared"""
+        if network in self.networks:
+            self.networks.remove(network)
+        self._dirty_networks.discard(network)
+        self._released |= network.modules
+        self._released |= network.objects
+    
+    def _add_network(self, cables):
+        network = Network()
+        network.cables = cables
+        for pos in cables:
+            self._network_at[pos] = network
+        self.networks.append(network)
+        self._dirty_networks.add(network)
+        return network
+    
+    def _flood_cables(self, start_pos, visited):
+        """Collect all cables connected to start_pos"""
+        cables = set()
         to_visit = [start_pos]
         while to_visit:
             pos = to_visit.pop()
             if pos in visited:
                 continue
-                
             visited.add(pos)
-            network.cables.add(pos)
-            x, y = pos
-            
-            # Check adjacent tiles for modules, objects, and cables
-            adjacent = [(x+1,y), (x-1,y), (x,y+1), (x,y-1)]
-            for adj_x, adj_y in adjacent:
-                if (0 <= adj_x < self.ship.decks[0].width and 
-                    0 <= adj_y < self.ship.decks[0].height):
-                    tile = self.ship.decks[0].tiles[adj_y][adj_x]
+            cables.add(pos)
+            for adj_pos in self._adjacent(*pos):
+                if adj_pos in self.cables and adj_pos not in visited:
+                    to_visit.append(adj_pos)
+        return cables
+    
+    def _rebuild_networks(self):
+        """Rebuild every network from scratch (first run or after switching decks)"""
+        for network in list(self.networks):
+            self._release_network(network)
+        self._network_at = {}
+        
+        # Sync tile cable references with the cable map
+        if self._deck:
+            for row in self._deck.tiles:
+                for tile in row:
+                    tile.cable = self.cables.get((tile.x, tile.y))
+        
+        visited = set()
+        for pos in self.cables:
+            if pos not in visited:
+                self._add_network(self._flood_cables(pos, visited))
+        self._needs_rebuild = False
+    
+    def _refresh_network(self, network):
+        """Recompute the modules, objects and power of a single network"""
+        old_members = network.modules | network.objects
+        self._find_connected_network(network)
+        self._released |= old_members - network.modules - network.objects
+        
+        network.available_power = 0
+        has_power = network.total_power > 0
+        for cable_pos in network.cables:
+            self.cables[cable_pos].powered = has_power
+            self.cables[cable_pos].network = network
+        self._distribute_power(network)
+    
+    def _reset_released(self):
+        """Clear power on modules and objects no longer attached to any network"""
+        if not self._released:
+            return
+        attached = set()
+        for network in self.networks:
+            attached |= network.modules
+            attached |= network.objects
+        
+        for entity in self._released - attached:
+            if power_role(entity) == CONSUMER:
+                entity.power_available = 0
+        self._released.clear()
+    
+    def _find_connected_network(self, network):
+        """Find the modules and objects adjacent to a network's cables"""
+        network.modules = set()
+        network.objects = set()
+        deck = self.ship.decks[0]
+        
+        for x, y in network.cables:
+            # Check adjacent tiles for modules and objects
+            for adj_x, adj_y in self._adjacent(x, y):
+                if deck.in_bounds(adj_x, adj_y):
+                    tile = deck.tiles[adj_y][adj_x]
                     
                     # Check for modules
                     if tile.module:
                         network.modules.add(tile.module)
-                        if isinstance(tile.module, ReactorModule):
-                            network.total_power += tile.module.power_output
-                        else:
-                            network.total_required += tile.module.power_required
                     
                     # Check for objects that need power
-                    if tile.object and hasattr(tile.object, 'power_required'):
+                    if tile.object and power_role(tile.object) == CONSUMER:
                         network.objects.add(tile.object)
-                        network.total_required += tile.object.power_required
-                
-                # Check for connected cables
-                adj_pos = (adj_x, adj_y)
-                if adj_pos in self.cables and adj_pos not in visited:
-                    to_visit.append(adj_pos)
         
+        network.total_power = sum(
+            m.power_output for m in network.modules if power_role(m) == PRODUCER
+        )
+        network.total_required = sum(
+            m.power_required for m in network.modules if power_role(m) == CONSUMER
+        ) + sum(o.power_required for o in network.objects)
         return network
     
     def _distribute_power(self, network):
@@ -191,7 +383,7 @@ class CableSystem:
             return
         
         # Count powered entities (excluding reactors)
-        num_powered_entities = len(network.objects) + sum(1 for m in network.modules if not isinstance(m, ReactorModule))
+        num_powered_entities = len(network.objects) + sum(1 for m in network.modules if power_role(m) == CONSUMER)
         
         # Calculate available power per entity
         power_per_entity = min(
@@ -210,7 +402,7 @@ class CableSystem:
         
         # Distribute power to modules
         for module in network.modules:
-            if not isinstance(module, ReactorModule):
+            if power_role(module) == CONSUMER:
                 module.power_available = min(power_per_entity, module.power_required)
         
         # Distribute power to objects
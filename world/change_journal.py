@@ -0,0 +1,72 @@
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+
+# Event kinds
+WALL_SET = "wall_set"
+FLOOR_SET = "floor_set"  # Wall removed
+OBJECT_PLACED = "object_placed"
+OBJECT_REMOVED = "object_removed"
+MODULE_PLACED = "module_placed"
+MODULE_REMOVED = "module_removed"
+CABLE_ADDED = "cable_added"
+CABLE_REMOVED = "cable_removed"
+DECK_RESIZED = "deck_resized"
+
+@dataclass(frozen=True, slots=True)
+class Placement:
+    """What a placed or removed module/object was, without keeping it alive"""
+    cls: type
+    ident: int  # id() of the thing; unique for as long as a consumer still holds it
+    blocks: bool  # Whether it stops movement on its tile
+
+    @classmethod
+    def of(cls, thing):
+        return cls(type(thing), id(thing), bool(getattr(thing, "solid", False) and not thing.walkable))
+
+@dataclass(frozen=True, slots=True)
+class ChangeEvent:
+    seq: int
+    kind: str
+    pos: tuple | None  # (x, y) of the edited tile, None for deck-wide events
+    old: object = None  # Wall flag, cable, or Placement of a module/object
+    new: object = None
+
+class ChangeJournal:
+    """Log of one deck's world edits, numbered by a monotonically increasing seq.
+
+    Subscribers remember the last seq they handled and read only what came
+    after it. Just the newest `capacity` events are kept; a subscriber that
+    falls further behind is told so and must resync from the world itself.
+    """
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self.seq = 0  # seq of the newest event
+        self._events = deque(maxlen=capacity)
+
+    def record(self, kind: str, pos=None, old=None, new=None) -> ChangeEvent:
+        self.seq += 1
+        event = ChangeEvent(self.seq, kind, pos, old, new)
+        self._events.append(event)
+        return event
+
+    def since(self, seq: int):
+        """Events after seq, oldest first; None if some of them were already dropped"""
+        missed = self.seq - seq
+        if missed <= 0:
+            return []
+        if missed > len(self._events):
+            return None
+        return list(islice(self._events, len(self._events) - missed, None))
+
+class JournalReader:
+    """A subscriber's position in a deck's journal"""
+    def __init__(self, journal: ChangeJournal):
+        self.journal = journal
+        self.seq = journal.seq  # Start with nothing unread
+
+    def read(self):
+        """Events since the last read, or None if the reader fell too far behind"""
+        events = self.journal.since(self.seq)
+        self.seq = self.journal.seq
+        return events
@@ -0,0 +1,64 @@
+CHUNK_BITS = 4
+CHUNK_SIZE = 1 << CHUNK_BITS
+CHUNK_MASK = CHUNK_SIZE - 1
+
+class ChunkedGrid:
+    """Tiles stored in fixed-size chunks addressed by world coordinates.
+
+    Coordinates may be negative and never change once a tile exists, so
+    growing a deck in any direction only allocates the chunks the new
+    tiles fall in. Chunks with no tiles are never allocated.
+
+    Indexing mirrors the old list of rows: grid[y][x] is the tile at
+    (x, y), or None where there is none. That builds a row object per
+    read, so hot loops use get(x, y) (deck.tile_at) instead.
+    """
+    def __init__(self, deck):
+        self.deck = deck
+        self.chunks = {}  # (chunk x, chunk y) -> flat list of CHUNK_SIZE * CHUNK_SIZE tiles
+
+    def get(self, x, y):
+        # Shifts and masks floor negative coordinates the same way // and % do
+        chunk = self.chunks.get((x >> CHUNK_BITS, y >> CHUNK_BITS))
+        if chunk is None:
+            return None
+        return chunk[((y & CHUNK_MASK) << CHUNK_BITS) | (x & CHUNK_MASK)]
+
+    def set(self, x, y, tile):
+        key = (x >> CHUNK_BITS, y >> CHUNK_BITS)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            if tile is None:
+                return
+            chunk = self.chunks[key] = [None] * (CHUNK_SIZE * CHUNK_SIZE)
+        chunk[((y & CHUNK_MASK) << CHUNK_BITS) | (x & CHUNK_MASK)] = tile
+
+    def __getitem__(self, y):
+        return GridRow(self, y)
+
+    def __len__(self):
+        return self.deck.height
+
+    def __iter__(self):
+        for y in range(self.deck.min_y, self.deck.max_y):
+            yield GridRow(self, y)
+
+class GridRow:
+    """One row of a ChunkedGrid within the deck's bounds"""
+    def __init__(self, grid, y):
+        self.grid = grid
+        self.y = y
+
+    def __getitem__(self, x):
+        return self.grid.get(x, self.y)
+
+    def __setitem__(self, x, tile):
+        self.grid.set(x, self.y, tile)
+
+    def __len__(self):
+        return self.grid.deck.width
+
+    def __iter__(self):
+        get = self.grid.get
+        for x in range(self.grid.deck.min_x, self.grid.deck.max_x):
+            yield get(x, self.y)
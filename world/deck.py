@@ -1,12 +1,216 @@
+from utils.config_manager import ConfigManager
+from .change_journal import (ChangeJournal, WALL_SET, FLOOR_SET, OBJECT_PLACED, OBJECT_REMOVED,
+                             MODULE_PLACED, MODULE_REMOVED, CABLE_ADDED, CABLE_REMOVED, DECK_RESIZED,
+                             Placement)
+from .chunked_grid import ChunkedGrid
 from .tile import Tile
+from .modules import DockingDoorModule
+from .reachability import ReachabilityIndex
 
 class Deck:
     def __init__(self, width, height, name="Deck"):
         self.name = name
+        # Tiles keep their world coordinates forever; growing left or up lowers the minimum
+        self.min_x = 0
+        self.min_y = 0
         self.width = width
         self.height = height
-        self.tiles = [[Tile(x, y) for x in range(width)] for y in range(height)]
+        self.tiles = self._create_tiles()
+        self.tile_at = self.tiles.get  # tile_at(x, y): the tile, or None outside the deck; use it in hot loops
         self.rooms = []
+        self.listeners = []  # Callables invoked as listener(tile, change) on tile edits
+        self.walkability_revision = 0  # Bumped whenever any tile's walkability may change
+        self.journal = ChangeJournal(ConfigManager.get_instance().get('game.deck.journal_size', 4096))
+        self.reachability = ReachabilityIndex(self)  # Walkable connected components, built on first query
+        self.tile_cables = {}  # (x, y) -> Cable, only for tiles that have one
+        self.connected_modules = {}  # (x, y) -> set, only for tiles that use it
+        
+        # Index of placed entities: concrete class -> {entity: [(x, y), ...]}
+        self._modules_by_type = {}
+        self._objects_by_type = {}
+        self._positions = {}  # entity -> [(x, y), ...] of the tiles it occupies
+
+    def _create_tiles(self):
+        grid = ChunkedGrid(self)
+        for y in range(self.height):
+            for x in range(self.width):
+                grid.set(x, y, Tile(x, y, self))
+        return grid
+
+    @property
+    def max_x(self):
+        """One past the rightmost column"""
+        return self.min_x + self.width
+
+    @property
+    def max_y(self):
+        """One past the bottom row"""
+        return self.min_y + self.height
+
+    def in_bounds(self, x, y) -> bool:
+        return self.min_x <= x < self.max_x and self.min_y <= y < self.max_y
+
+    def walkable_grid(self):
+        """Walkability as rows of bools, indexed from (min_x, min_y)"""
+        tile_at = self.tile_at
+        return [[tile_at(x, y).is_walkable() for x in range(self.min_x, self.max_x)]
+                for y in range(self.min_y, self.max_y)]
+
+    def expand(self, direction: str, index: int):
+        """Grow by one column ("left"/"right") or row ("up"/"down") of floor.
+
+        The new tile at index along the new edge is a wall. Existing tiles
+        keep their coordinates; only the chunks under the new strip are touched.
+        """
+        if direction in ("left", "right"):
+            x = self.max_x if direction == "right" else self.min_x - 1
+            strip = [(x, y) for y in range(self.min_y, self.max_y)]
+            wall_at = (x, index)
+            self.min_x = min(self.min_x, x)
+            self.width += 1
+        else:
+            y = self.max_y if direction == "down" else self.min_y - 1
+            strip = [(x, y) for x in range(self.min_x, self.max_x)]
+            wall_at = (index, y)
+            self.min_y = min(self.min_y, y)
+            self.height += 1
+        for x, y in strip:
+            tile = Tile(x, y)
+            tile.wall = (x, y) == wall_at
+            tile.deck = self  # Attached after setup; resized() announces the new strip
+            self.tiles.set(x, y, tile)
+
+    def add_listener(self, listener):
+        """Register a callable to be told about tile changes on this deck"""
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Stop notifying a previously registered listener"""
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def tile_changed(self, tile, change: str, old=None):
+        """Called by tiles when their wall, module, object or cable changes"""
+        self._record(tile, change, old)
+        was_walkable = None
+        if change == "module":
+            self._unindex(self._modules_by_type, old, tile)
+            self._index(self._modules_by_type, tile.module, tile)
+            if isinstance(old, DockingDoorModule) or isinstance(tile.module, DockingDoorModule):
+                was_walkable = tile.is_walkable()
+        elif change == "object":
+            self._unindex(self._objects_by_type, old, tile)
+            self._index(self._objects_by_type, tile.object, tile)
+            was_walkable = Tile.walkable_with(tile.wall, old)
+        elif change == "wall":
+            was_walkable = Tile.walkable_with(old, tile.object)
+        
+        for listener in self.listeners:
+            listener(tile, change)
+        
+        if was_walkable is not None:
+            self.walkability_revision += 1
+            self.reachability.tile_changed(tile)
+            # "walkable": the tile opened up, "blocked": it closed or stayed closed
+            opened = tile.is_walkable() and not was_walkable
+            for listener in self.listeners:
+                listener(tile, "walkable" if opened else "blocked")
+
+    def _record(self, tile, change, old):
+        """Write a tile edit to the journal as typed events"""
+        pos = (tile.x, tile.y)
+        if change == "wall":
+            self.journal.record(WALL_SET if tile.wall else FLOOR_SET, pos, old, tile.wall)
+            return
+        removed, placed = {
+            "module": (MODULE_REMOVED, MODULE_PLACED),
+            "object": (OBJECT_REMOVED, OBJECT_PLACED),
+            "cable": (CABLE_REMOVED, CABLE_ADDED),
+        }[change]
+        new = getattr(tile, change)
+        if change != "cable":
+            # Events outlive the edit; hold no reference to what left the deck
+            old = Placement.of(old) if old is not None else None
+            new = Placement.of(new) if new is not None else None
+        if old is not None:
+            self.journal.record(removed, pos, old=old)
+        if new is not None:
+            self.journal.record(placed, pos, new=new)
+
+    def resized(self):
+        """Called after the deck grows; existing tiles keep their coordinates"""
+        self.journal.record(DECK_RESIZED, new=(self.min_x, self.min_y, self.max_x, self.max_y))
+        self.walkability_revision += 1
+        self.reachability.invalidate()
+        for listener in self.listeners:
+            listener(None, "resize")
+
+    def _index(self, by_type, entity, tile):
+        if entity is None:
+            return
+        pos = (tile.x, tile.y)
+        by_type.setdefault(type(entity), {}).setdefault(entity, []).append(pos)
+        self._positions.setdefault(entity, []).append(pos)
+
+    def _unindex(self, by_type, entity, tile):
+        if entity is None:
+            return
+        pos = (tile.x, tile.y)
+        entities = by_type.get(type(entity), {})
+        self._discard_position(entities, entity, pos)
+        if not entities:
+            by_type.pop(type(entity), None)
+        self._discard_position(self._positions, entity, pos)
+
+    @staticmethod
+    def _discard_position(positions, entity, pos):
+        if pos in positions.get(entity, ()):
+            positions[entity].remove(pos)
+            if not positions[entity]:
+                del positions[entity]
+
+    def find_objects(self, object_type):
+        """Return [(object, (x, y))] for every placed object of the given type(s)"""
+        return self._find(self._objects_by_type, object_type)
+
+    def find_modules(self, module_type):
+        """Return [(module, (x, y))] for every placed module of the given type(s)"""
+        return self._find(self._modules_by_type, module_type)
+
+    def _find(self, by_type, wanted):
+        found = []
+        for cls, entities in by_type.items():
+            if issubclass(cls, wanted):
+                found.extend((entity, positions[0]) for entity, positions in entities.items())
+        return found
+
+    def is_reachable(self, start, goal) -> bool:
+        """O(1) check whether goal can be walked to from start on this deck"""
+        return self.reachability.can_reach(start, goal)
+
+    def position_of(self, entity):
+        """Get the (x, y) of a placed module or object, or None if not on this deck"""
+        positions = self._positions.get(entity)
+        return positions[0] if positions else None
+
+    def count_floor_tiles(self) -> int:
+        """Number of tiles that are not walls"""
+        return sum(1 for row in self.tiles for tile in row if not tile.wall)
+
+    def seal_edges(self):
+        """Turn empty edge tiles (no wall, module or object) into walls"""
+        for y in range(self.min_y, self.max_y):
+            for x in (self.min_x, self.max_x - 1):
+                self._seal(self.tiles[y][x])
+        for x in range(self.min_x, self.max_x):
+            for y in (self.min_y, self.max_y - 1):
+                self._seal(self.tiles[y][x])
+
+    @staticmethod
+    def _seal(tile):
+        if not tile.wall and not tile.module and not tile.object:
+            tile.wall = True
 
     def update(self, dt):
         # Update each room, and indirectly tiles/modules/objects
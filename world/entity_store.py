@@ -0,0 +1,212 @@
+"""Entity-component store shared by crew, enemies, weapons and modules.
+
+An entity is just a generational id. Its data lives in components, each a
+set of dense columns (one list per field) packed so that a system can walk
+every entity holding a component without touching anything else. Game
+classes such as CrewMember stay as thin facades whose attributes read and
+write their entity's columns.
+"""
+import weakref
+
+# Components and their fields
+POSITION = "position"
+VELOCITY = "velocity"
+PATH = "path"
+NEEDS = "needs"
+HEALTH = "health"
+COOLDOWN = "cooldown"
+POWER = "power"
+
+COMPONENT_FIELDS = {
+    POSITION: ("x", "y"),
+    VELOCITY: ("speed",),
+    PATH: ("path", "pending"),  # pending: a path search is queued for it
+    NEEDS: ("hunger", "sleep", "oxygen", "resting"),
+    HEALTH: ("health", "max_health"),
+    COOLDOWN: ("remaining", "duration"),
+    POWER: ("required", "available"),
+}
+
+INDEX_BITS = 32
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+class Changes(set):
+    """Entities written since its consumer last cleared it; one per consumer, see ComponentArray.subscribe"""
+
+class ComponentArray:
+    """Dense columns of one component, one row per entity that has it"""
+    __slots__ = ("name", "fields", "entities", "rows", "columns", "version", "_subscribers")
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+        self.entities = []  # Row -> entity id
+        self.rows = {}  # Entity id -> row
+        self.columns = {field: [] for field in fields}
+        self.version = 0  # Bumped whenever rows are added, removed or moved
+        self._subscribers = []  # Weak references to each consumer's Changes
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __contains__(self, entity):
+        return entity in self.rows
+
+    def add(self, entity, values):
+        self.version += 1
+        self.rows[entity] = len(self.entities)
+        self.entities.append(entity)
+        for field, column in self.columns.items():
+            column.append(values.get(field))
+
+    def remove(self, entity):
+        """Swap the last row into the removed one so the columns stay packed"""
+        self.version += 1
+        row = self.rows.pop(entity)
+        last = self.entities.pop()
+        for column in self.columns.values():
+            value = column.pop()
+            if last != entity:
+                column[row] = value
+        if last != entity:
+            self.entities[row] = last
+            self.rows[last] = row
+
+    def subscribe(self) -> Changes:
+        """A set of its own that every later write to a tracked field of this component adds to.
+
+        The consumer clears it when it has caught up; it stops filling once
+        the consumer drops it.
+        """
+        changes = Changes()
+        self._subscribers.append(weakref.ref(changes, self._subscribers.remove))
+        return changes
+
+    @property
+    def watched(self) -> bool:
+        """Whether anyone follows writes, so writers can skip marking when no one does"""
+        return bool(self._subscribers)
+
+    def mark(self, entity):
+        """Note a write to entity for every consumer"""
+        for ref in self._subscribers:
+            changes = ref()
+            if changes is not None:
+                changes.add(entity)
+
+    def get(self, entity, field):
+        return self.columns[field][self.rows[entity]]
+
+    def set(self, entity, field, value):
+        self.columns[field][self.rows[entity]] = value
+
+class EntityStore:
+    _instance = None
+
+    def __init__(self):
+        if EntityStore._instance is not None:
+            raise Exception("EntityStore is a singleton!")
+        EntityStore._instance = self
+        self.components = {name: ComponentArray(name, fields) for name, fields in COMPONENT_FIELDS.items()}
+        self._generations = []  # Index -> generation of the id currently using it
+        self._free = []  # Indices of destroyed entities, reused with a bumped generation
+
+    @staticmethod
+    def get_instance():
+        if EntityStore._instance is None:
+            EntityStore()
+        return EntityStore._instance
+
+    def create(self, **components) -> int:
+        """New entity id, with the given components: create(position={'x': 0, 'y': 0})"""
+        if self._free:
+            index = self._free.pop()
+        else:
+            index = len(self._generations)
+            self._generations.append(0)
+        entity = (self._generations[index] << INDEX_BITS) | index
+        for name, values in components.items():
+            self.add(entity, name, values)
+        return entity
+
+    def destroy(self, entity):
+        """Drop an entity and all its components; its id is never valid again"""
+        if not self.alive(entity):
+            return
+        for array in self.components.values():
+            if entity in array.rows:
+                array.remove(entity)
+        index = entity & INDEX_MASK
+        self._generations[index] += 1
+        self._free.append(index)
+
+    def alive(self, entity) -> bool:
+        index = entity & INDEX_MASK
+        return index < len(self._generations) and self._generations[index] == entity >> INDEX_BITS
+
+    def add(self, entity, component, values=None):
+        self.components[component].add(entity, values or {})
+
+    def remove(self, entity, component):
+        if entity in self.components[component].rows:
+            self.components[component].remove(entity)
+
+    def has(self, entity, component) -> bool:
+        return entity in self.components[component].rows
+
+    def query(self, *components):
+        """Ids of entities holding every listed component, walking the smallest one"""
+        arrays = sorted((self.components[name] for name in components), key=len)
+        first, rest = arrays[0], arrays[1:]
+        return [entity for entity in first.entities if all(entity in array.rows for array in rest)]
+
+    def __len__(self):
+        return len(self._generations) - len(self._free)
+
+class ComponentField:
+    """Class attribute exposing one component field of the instance's entity"""
+    __slots__ = ("array", "field")
+
+    def __init__(self, component, field):
+        self.array = EntityStore.get_instance().components[component]
+        self.field = field
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        array = self.array
+        return array.columns[self.field][array.rows[obj.entity]]
+
+    def __set__(self, obj, value):
+        array = self.array
+        array.columns[self.field][array.rows[obj.entity]] = value
+
+class TrackedField(ComponentField):
+    """ComponentField that also notes which entities were written, for batch systems caching it"""
+    __slots__ = ()
+
+    def __set__(self, obj, value):
+        array = self.array
+        array.columns[self.field][array.rows[obj.entity]] = value
+        if array.watched:
+            array.mark(obj.entity)
+
+class Entity:
+    """Base for facades over an entity; subclasses declare an `entity` slot"""
+    __slots__ = ()
+
+    def destroy(self):
+        """Free the entity's components now; call it where the facade leaves the world"""
+        EntityStore.get_instance().destroy(self.entity)
+
+    @property
+    def destroyed(self) -> bool:
+        return not EntityStore.get_instance().alive(self.entity)
+
+    def __del__(self):
+        # Fallback for facades dropped without destroy()
+        try:
+            entity = self.entity
+        except AttributeError:  # __init__ never got as far as creating it
+            return
+        EntityStore.get_instance().destroy(entity)
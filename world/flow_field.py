@@ -0,0 +1,109 @@
+from collections import deque
+
+from world.pathfinding import access_tiles
+
+DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # Same order as pathfinding.get_neighbors
+
+class FlowField:
+    """Walking distance from every tile to the nearest of a set of targets.
+
+    Built with one multi-source BFS from the access tiles of all targets.
+    Agents then walk downhill from their own tile instead of searching.
+    With build=False the BFS is left to build_steps, so it can be spread
+    over several frames.
+    """
+    def __init__(self, deck, targets, build=True):
+        self.deck = deck
+        self.targets = targets  # [(entity, (x, y))]
+        self.revision = deck.walkability_revision
+        self.origin = (deck.min_x, deck.min_y)  # distances[0][0] is this tile
+        self.width = deck.width
+        self.height = deck.height
+        self.distances = [[None] * deck.width for _ in range(deck.height)]
+        self.nearest = [[None] * deck.width for _ in range(deck.height)]  # index into targets
+        self._frontier = deque()
+        self._seed()
+        if build:
+            for _ in self.build_steps():
+                pass
+
+    @property
+    def complete(self) -> bool:
+        return not self._frontier
+
+    def _seed(self):
+        ox, oy = self.origin
+        for index, (_, pos) in enumerate(self.targets):
+            for x, y in target_tiles(self.deck, pos):
+                gx, gy = x - ox, y - oy
+                if self.distances[gy][gx] is None:
+                    self.distances[gy][gx] = 0
+                    self.nearest[gy][gx] = index
+                    self._frontier.append((gx, gy))
+
+    def build_steps(self):
+        """Run the BFS, yielding after each tile; any number of callers may drive it"""
+        frontier = self._frontier  # Grid-relative (x - min_x, y - min_y) positions
+        ox, oy = self.origin
+        width, height = self.width, self.height
+        distances, nearest = self.distances, self.nearest
+        tile_at = self.deck.tile_at
+        while frontier:
+            x, y = frontier.popleft()
+            next_distance = distances[y][x] + 1
+            for dx, dy in DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if (0 <= nx < width and 0 <= ny < height and
+                        distances[ny][nx] is None and
+                        tile_at(nx + ox, ny + oy).is_walkable()):
+                    distances[ny][nx] = next_distance
+                    nearest[ny][nx] = nearest[y][x]
+                    frontier.append((nx, ny))
+            yield
+
+    def distance(self, pos):
+        """Steps from pos to the nearest target access tile, or None if unreachable"""
+        x, y = pos[0] - self.origin[0], pos[1] - self.origin[1]
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.distances[y][x]
+        return None
+
+    def next_step(self, pos):
+        """The neighbouring tile one step closer to a target, or None"""
+        x, y = pos
+        best = None
+        best_distance = self.distance(pos)
+        for dx, dy in DIRECTIONS:
+            step_distance = self.distance((x + dx, y + dy))
+            if step_distance is not None and (best_distance is None or step_distance < best_distance):
+                best = (x + dx, y + dy)
+                best_distance = step_distance
+        return best
+
+    def target_for(self, pos):
+        """The (entity, (x, y)) nearest to pos by walking distance, or None"""
+        x, y = pos
+        if self.distance(pos) is None:
+            # Standing off the walkable area: use the best neighbour
+            pos = self.next_step(pos)
+            if pos is None:
+                return None
+            x, y = pos
+        return self.targets[self.nearest[y - self.origin[1]][x - self.origin[0]]]
+
+    def path_from(self, start):
+        """Follow the gradient from start; returns [start, ..., access tile] or []"""
+        path = [start]
+        current = start
+        while self.distance(current) != 0:
+            current = self.next_step(current)
+            if current is None:
+                return []
+            path.append(current)
+        return path
+
+def target_tiles(deck, pos):
+    """Tiles an agent can stand on to use whatever is at pos"""
+    if deck.tile_at(*pos).is_walkable():
+        return [pos]
+    return access_tiles(deck, pos)
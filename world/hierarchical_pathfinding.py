@@ -0,0 +1,291 @@
+from collections import deque
+from heapq import heappush, heappop
+
+from utils.config_manager import ConfigManager
+from world.change_journal import JournalReader, CABLE_ADDED, CABLE_REMOVED, DECK_RESIZED
+
+DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+MAX_SINGLE_ENTRANCE = 6  # Border openings this long or longer get an entrance at each end
+
+class HierarchicalPathfinder:
+    """HPA* over fixed-size square clusters of a deck.
+
+    Entrances are placed on the walkable openings between neighbouring
+    clusters and linked by precomputed intra-cluster distances. Queries are
+    answered on that small abstract graph, then only the segments actually
+    walked are refined into tiles. Paths are near-optimal, not exact.
+    Clusters are aligned to deck coordinates, so they stay put as the deck
+    grows; the clusters on the deck's rim are clipped to its bounds.
+    """
+    def __init__(self, deck, cluster_size: int = 10):
+        self.deck = deck
+        self.cluster_size = cluster_size
+        self.borders = {}  # (cluster, cluster) -> [(node, node)] transitions across that border
+        self.links = {}  # node -> set of nodes one step away in the neighbouring cluster
+        self.intra = {}  # cluster -> {node: {node: distance}} inside the cluster
+        self._dirty = set()
+        self._journal = JournalReader(deck.journal)
+        self.rebuild()
+
+    # ---- building ----
+
+    def rebuild(self):
+        """Recompute every cluster (first use or after a deck resize)"""
+        self.borders = {}
+        self.links = {}
+        self.intra = {}
+        self._dirty = set()
+        self.extent = self._deck_extent()
+        clusters = self._all_clusters()
+        for cluster in clusters:
+            for neighbour in self._cluster_neighbours(cluster):
+                if neighbour > cluster:
+                    self._build_border(cluster, neighbour)
+        for cluster in clusters:
+            self._build_intra(cluster)
+
+    def _read_journal(self):
+        """Mark the clusters of tiles edited since the last query as dirty"""
+        events = self._journal.read()
+        if events is None:
+            self._dirty.add(None)  # Fell behind the journal; rebuild everything
+            return
+        for event in events:
+            if event.kind == DECK_RESIZED:
+                self._dirty.add(None)
+            elif event.kind not in (CABLE_ADDED, CABLE_REMOVED):
+                self._dirty.add(self.cluster_of(event.pos))
+
+    def refresh(self):
+        """Recompute only the clusters whose tiles changed (and their borders)"""
+        self._read_journal()
+        if not self._dirty:
+            return
+        if None in self._dirty or self.extent != self._deck_extent():
+            self.rebuild()
+            return
+
+        affected = set()
+        for cluster in self._dirty:
+            affected.add(cluster)
+            for neighbour in self._cluster_neighbours(cluster):
+                self._build_border(min(cluster, neighbour), max(cluster, neighbour))
+                affected.add(neighbour)
+        for cluster in affected:
+            self._build_intra(cluster)
+        self._dirty = set()
+
+    def _deck_extent(self):
+        deck = self.deck
+        return deck.min_x, deck.min_y, deck.max_x, deck.max_y
+
+    def cluster_of(self, pos):
+        return (pos[0] // self.cluster_size, pos[1] // self.cluster_size)
+
+    def _cluster_range(self):
+        """(min cx, min cy, max cx, max cy) of the clusters covering the deck"""
+        min_x, min_y, max_x, max_y = self.extent
+        size = self.cluster_size
+        return min_x // size, min_y // size, (max_x - 1) // size, (max_y - 1) // size
+
+    def _all_clusters(self):
+        min_cx, min_cy, max_cx, max_cy = self._cluster_range()
+        return [(cx, cy) for cy in range(min_cy, max_cy + 1) for cx in range(min_cx, max_cx + 1)]
+
+    def _cluster_neighbours(self, cluster):
+        cx, cy = cluster
+        min_cx, min_cy, max_cx, max_cy = self._cluster_range()
+        return [(nx, ny) for nx, ny in [(cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)]
+                if min_cx <= nx <= max_cx and min_cy <= ny <= max_cy]
+
+    def _bounds(self, cluster):
+        cx, cy = cluster
+        min_x, min_y, max_x, max_y = self.extent
+        x0, y0 = cx * self.cluster_size, cy * self.cluster_size
+        return (max(x0, min_x), max(y0, min_y),
+                min(x0 + self.cluster_size, max_x), min(y0 + self.cluster_size, max_y))
+
+    def _walkable(self, x, y):
+        return self.deck.tile_at(x, y).is_walkable()
+
+    def _build_border(self, cluster, neighbour):
+        """Place entrances on the walkable openings between two clusters"""
+        for a, b in self.borders.pop((cluster, neighbour), []):
+            self.links[a].discard(b)
+            self.links[b].discard(a)
+
+        x0, y0, x1, y1 = self._bounds(cluster)
+        if neighbour[0] != cluster[0]:
+            # Vertical border: (x1 - 1, y) | (x1, y)
+            pairs = [((x1 - 1, y), (x1, y)) for y in range(y0, y1)]
+        else:
+            # Horizontal border: (x, y1 - 1) over (x, y1)
+            pairs = [((x, y1 - 1), (x, y1)) for x in range(x0, x1)]
+
+        transitions = []
+        run = []
+        for pair in pairs + [None]:
+            if pair is not None and self._walkable(*pair[0]) and self._walkable(*pair[1]):
+                run.append(pair)
+                continue
+            if run:
+                if len(run) < MAX_SINGLE_ENTRANCE:
+                    transitions.append(run[len(run) // 2])
+                else:
+                    transitions.extend([run[0], run[-1]])
+                run = []
+
+        for a, b in transitions:
+            self.links.setdefault(a, set()).add(b)
+            self.links.setdefault(b, set()).add(a)
+        self.borders[(cluster, neighbour)] = transitions
+
+    def _cluster_nodes(self, cluster):
+        nodes = set()
+        for neighbour in self._cluster_neighbours(cluster):
+            for a, b in self.borders.get((min(cluster, neighbour), max(cluster, neighbour)), []):
+                nodes.add(a if self.cluster_of(a) == cluster else b)
+        return nodes
+
+    def _build_intra(self, cluster):
+        """Distances between every pair of entrances inside a cluster"""
+        nodes = self._cluster_nodes(cluster)
+        bounds = self._bounds(cluster)
+        self.intra[cluster] = {}
+        for node in nodes:
+            distances, _ = self._local_search(node, bounds)
+            self.intra[cluster][node] = {
+                other: distances[other] for other in nodes
+                if other != node and other in distances
+            }
+
+    def _local_search(self, origin, bounds, target=None):
+        """BFS from origin restricted to a cluster; returns (distances, came_from)"""
+        x0, y0, x1, y1 = bounds
+        distances = {origin: 0}
+        came_from = {origin: None}
+        frontier = deque([origin])
+        while frontier:
+            current = frontier.popleft()
+            if current == target:
+                break
+            x, y = current
+            for dx, dy in DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if (x0 <= nx < x1 and y0 <= ny < y1 and (nx, ny) not in distances and
+                        self._walkable(nx, ny)):
+                    distances[(nx, ny)] = distances[current] + 1
+                    came_from[(nx, ny)] = current
+                    frontier.append((nx, ny))
+        return distances, came_from
+
+    # ---- querying ----
+
+    def find_abstract_path(self, start, goal, stats=None):
+        """Waypoints [start, entrance, ..., goal] through the cluster graph, or []"""
+        self.refresh()
+        if not (self.deck.in_bounds(*goal) and self._walkable(*goal)):
+            return []
+
+        if not (self.deck.in_bounds(*start) and self._walkable(*start)):
+            # Standing somewhere blocked: step onto the best walkable neighbour first
+            best = []
+            for dx, dy in DIRECTIONS:
+                step = (start[0] + dx, start[1] + dy)
+                if self.deck.in_bounds(*step) and self._walkable(*step):
+                    waypoints = self._search_abstract(step, goal, stats)
+                    if waypoints and (not best or self._length(waypoints) < self._length(best)):
+                        best = waypoints
+            return [start] + best if best else []
+        return self._search_abstract(start, goal, stats)
+
+    @staticmethod
+    def _length(waypoints):
+        return sum(abs(a[0] - b[0]) + abs(a[1] - b[1]) for a, b in zip(waypoints, waypoints[1:]))
+
+    def _search_abstract(self, start, goal, stats):
+        start_cluster = self.cluster_of(start)
+        goal_cluster = self.cluster_of(goal)
+        start_edges, _ = self._local_search(start, self._bounds(start_cluster))
+        if start_cluster == goal_cluster and goal in start_edges:
+            return [start, goal]
+        goal_edges, _ = self._local_search(goal, self._bounds(goal_cluster))
+
+        start_nodes = self._cluster_nodes(start_cluster)
+        goal_nodes = self._cluster_nodes(goal_cluster)
+
+        def neighbours(node):
+            result = []
+            if node == start:
+                result.extend((n, start_edges[n]) for n in start_nodes if n in start_edges)
+            result.extend(self.intra[self.cluster_of(node)].get(node, {}).items())
+            result.extend((linked, 1) for linked in self.links.get(node, ()))
+            if node in goal_nodes and node in goal_edges:
+                result.append((goal, goal_edges[node]))
+            return result
+
+        frontier = [(0, start)]
+        came_from = {start: None}
+        cost_so_far = {start: 0}
+        expanded = 0
+        while frontier:
+            current = heappop(frontier)[1]
+            expanded += 1
+            if current == goal:
+                break
+            for next_node, cost in neighbours(current):
+                new_cost = cost_so_far[current] + cost
+                if next_node not in cost_so_far or new_cost < cost_so_far[next_node]:
+                    cost_so_far[next_node] = new_cost
+                    priority = new_cost + abs(goal[0] - next_node[0]) + abs(goal[1] - next_node[1])
+                    heappush(frontier, (priority, next_node))
+                    came_from[next_node] = current
+
+        if stats is not None:
+            stats['expanded'] = stats.get('expanded', 0) + expanded
+        if goal not in came_from:
+            return []
+
+        waypoints = []
+        current = goal
+        while current is not None:
+            waypoints.append(current)
+            current = came_from[current]
+        waypoints.reverse()
+        return waypoints
+
+    def refine(self, waypoints):
+        """Yield the tiles between waypoints, refining one segment at a time"""
+        if not waypoints:
+            return
+        yield waypoints[0]
+        for a, b in zip(waypoints, waypoints[1:]):
+            if abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1:
+                yield b
+                continue
+            _, came_from = self._local_search(a, self._bounds(self.cluster_of(a)), target=b)
+            segment = []
+            current = b
+            while current is not None and current != a:
+                segment.append(current)
+                current = came_from.get(current)
+            yield from reversed(segment)
+
+    def find_path(self, start, goal, stats=None):
+        """Full tile path in find_path format (near-optimal)"""
+        return list(self.refine(self.find_abstract_path(start, goal, stats)))
+
+_planners = {}  # deck -> HierarchicalPathfinder
+
+def hierarchical_planner(deck) -> HierarchicalPathfinder:
+    """Get (or create) the HPA* planner for a deck"""
+    planner = _planners.get(deck)
+    if planner is None:
+        cluster_size = ConfigManager.get_instance().get('game.pathfinding.cluster_size', 10)
+        planner = HierarchicalPathfinder(deck, cluster_size)
+        _planners[deck] = planner
+    return planner
+
+def find_path_hierarchical(deck, start, goal, stats=None):
+    """find_path-compatible entry point for the HPA* planner"""
+    return hierarchical_planner(deck).find_path(start, goal, stats)
@@ -8,24 +8,32 @@ class ItemType(Enum):
     OXYGEN = auto()
     # Add more types as needed
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     type: ItemType
     name: str
     quantity: int = 1
     
 class FoodItem(Item):
+    __slots__ = ()
+
     def __init__(self, quantity=1):
         super().__init__(ItemType.FOOD, "Food Ration", quantity) 
 
 class MetalItem(Item):
+    __slots__ = ()
+
     def __init__(self, quantity=1):
         super().__init__(ItemType.METAL, "Metal", quantity)
 
 class WaterItem(Item):
+    __slots__ = ()
+
     def __init__(self, quantity=1):
         super().__init__(ItemType.WATER, "Water", quantity)
 
 class OxygenItem(Item):
+    __slots__ = ()
+
     def __init__(self, quantity=1):
         super().__init__(ItemType.OXYGEN, "Oxygen", quantity)
\ No newline at end of file
@@ -0,0 +1,203 @@
+from heapq import heappush, heappop
+
+class JumpTables:
+    """Precomputed jumps for one deck at one walkability revision.
+
+    For every tile and direction we store the next jump point reached by a
+    straight scan (ignoring the goal) and the first blocked tile, so a jump
+    during search is a table lookup plus a check for the goal lying on the
+    scanned segment. Tables are indexed from the deck's (min_x, min_y).
+    """
+    def __init__(self, deck):
+        self.revision = deck.walkability_revision
+        self.origin = (deck.min_x, deck.min_y)
+        width, height = deck.width, deck.height
+        self.width = width
+        self.height = height
+        walk = deck.walkable_grid()
+        self.walk = walk
+
+        def walkable(x, y):
+            return 0 <= x < width and 0 <= y < height and walk[y][x]
+
+        # Horizontal scans: next jump x / first blocked x, to the right and left
+        self.jump_right = [[None] * width for _ in range(height)]
+        self.wall_right = [[width] * width for _ in range(height)]
+        self.jump_left = [[None] * width for _ in range(height)]
+        self.wall_left = [[-1] * width for _ in range(height)]
+        for y in range(height):
+            next_jump, next_wall = None, width
+            for x in range(width - 1, -1, -1):
+                self.jump_right[y][x] = next_jump
+                self.wall_right[y][x] = next_wall
+                if not walk[y][x]:
+                    next_jump, next_wall = None, x
+                elif ((walkable(x, y - 1) and not walkable(x - 1, y - 1)) or
+                        (walkable(x, y + 1) and not walkable(x - 1, y + 1))):
+                    next_jump = x
+
+            next_jump, next_wall = None, -1
+            for x in range(width):
+                self.jump_left[y][x] = next_jump
+                self.wall_left[y][x] = next_wall
+                if not walk[y][x]:
+                    next_jump, next_wall = None, x
+                elif ((walkable(x, y - 1) and not walkable(x + 1, y - 1)) or
+                        (walkable(x, y + 1) and not walkable(x + 1, y + 1))):
+                    next_jump = x
+
+        # Vertical scans also stop wherever a horizontal scan would find a jump point
+        def stops_vertical(x, y, dy):
+            return ((walkable(x - 1, y) and not walkable(x - 1, y - dy)) or
+                    (walkable(x + 1, y) and not walkable(x + 1, y - dy)) or
+                    self.jump_right[y][x] is not None or
+                    self.jump_left[y][x] is not None)
+
+        self.jump_down = [[None] * width for _ in range(height)]
+        self.wall_down = [[height] * width for _ in range(height)]
+        self.jump_up = [[None] * width for _ in range(height)]
+        self.wall_up = [[-1] * width for _ in range(height)]
+        for x in range(width):
+            next_jump, next_wall = None, height
+            for y in range(height - 1, -1, -1):
+                self.jump_down[y][x] = next_jump
+                self.wall_down[y][x] = next_wall
+                if not walk[y][x]:
+                    next_jump, next_wall = None, y
+                elif stops_vertical(x, y, 1):
+                    next_jump = y
+
+            next_jump, next_wall = None, -1
+            for y in range(height):
+                self.jump_up[y][x] = next_jump
+                self.wall_up[y][x] = next_wall
+                if not walk[y][x]:
+                    next_jump, next_wall = None, y
+                elif stops_vertical(x, y, -1):
+                    next_jump = y
+
+    def _reaches_horizontally(self, x, y, goal_x):
+        """True if a straight scan from (x, y) along the row passes goal_x"""
+        if goal_x > x:
+            return goal_x < self.wall_right[y][x]
+        if goal_x < x:
+            return goal_x > self.wall_left[y][x]
+        return False
+
+    def jump(self, pos, direction, goal):
+        """Jump point reached from pos in direction, or None"""
+        x, y = pos
+        dx, dy = direction
+        goal_x, goal_y = goal
+
+        if dx > 0:
+            if goal_y == y and self._reaches_horizontally(x, y, goal_x):
+                found = self.jump_right[y][x]
+                if found is None or goal_x <= found:
+                    return goal
+            found = self.jump_right[y][x]
+            return None if found is None else (found, y)
+        if dx < 0:
+            if goal_y == y and self._reaches_horizontally(x, y, goal_x):
+                found = self.jump_left[y][x]
+                if found is None or goal_x >= found:
+                    return goal
+            found = self.jump_left[y][x]
+            return None if found is None else (found, y)
+
+        if dy > 0:
+            found, wall = self.jump_down[y][x], self.wall_down[y][x]
+            ahead = y < goal_y < wall and (found is None or goal_y < found)
+        else:
+            found, wall = self.jump_up[y][x], self.wall_up[y][x]
+            ahead = wall < goal_y < y and (found is None or goal_y > found)
+
+        # Reaching the goal's row stops the scan if the goal is in sight from there
+        if ahead and (goal_x == x or self._reaches_horizontally(x, goal_y, goal_x)):
+            return (x, goal_y)
+        return None if found is None else (x, found)
+
+_tables = {}  # deck -> JumpTables for its current walkability revision
+
+def jump_tables(deck) -> JumpTables:
+    """Get the jump tables for a deck, rebuilding them after walkability changes"""
+    tables = _tables.get(deck)
+    if (tables is None or tables.revision != deck.walkability_revision or
+            tables.origin != (deck.min_x, deck.min_y) or
+            tables.width != deck.width or tables.height != deck.height):
+        tables = JumpTables(deck)
+        _tables[deck] = tables
+    return tables
+
+def _directions(pos, parent):
+    """Pruned search directions for a node reached from parent"""
+    if parent is None:
+        return [(0, 1), (1, 0), (0, -1), (-1, 0)]
+    x, y = pos
+    dx = (x > parent[0]) - (x < parent[0])
+    dy = (y > parent[1]) - (y < parent[1])
+    if dx:
+        return [(0, -1), (0, 1), (dx, 0)]
+    return [(-1, 0), (1, 0), (0, dy)]
+
+def find_path_jps(deck, start, goal, stats=None):
+    """Jump Point Search for 4-connected, uniform-cost decks.
+
+    Returns the same tile-by-tile path format (and length) as A*.
+    """
+    if not deck.tile_at(*goal).is_walkable():
+        return []
+    tables = jump_tables(deck)
+    ox, oy = tables.origin
+    start = (start[0] - ox, start[1] - oy)
+    goal = (goal[0] - ox, goal[1] - oy)
+
+    frontier = []
+    heappush(frontier, (0, start))
+    came_from = {start: None}
+    cost_so_far = {start: 0}
+    expanded = 0
+
+    while frontier:
+        current = heappop(frontier)[1]
+        expanded += 1
+
+        if current == goal:
+            break
+
+        for direction in _directions(current, came_from[current]):
+            jump_point = tables.jump(current, direction, goal)
+            if jump_point is None:
+                continue
+            new_cost = (cost_so_far[current] + abs(jump_point[0] - current[0]) +
+                        abs(jump_point[1] - current[1]))
+            if jump_point not in cost_so_far or new_cost < cost_so_far[jump_point]:
+                cost_so_far[jump_point] = new_cost
+                priority = new_cost + abs(goal[0] - jump_point[0]) + abs(goal[1] - jump_point[1])
+                heappush(frontier, (priority, jump_point))
+                came_from[jump_point] = current
+
+    if stats is not None:
+        stats['expanded'] = stats.get('expanded', 0) + expanded
+
+    if goal not in came_from:
+        return []
+
+    # Expand the straight segments between jump points into single tiles
+    jump_points = []
+    current = goal
+    while current is not None:
+        jump_points.append(current)
+        current = came_from[current]
+    jump_points.reverse()
+
+    px, py = start
+    path = [(px + ox, py + oy)]
+    for x, y in jump_points[1:]:
+        step_x = (x > px) - (x < px)
+        step_y = (y > py) - (y < py)
+        while (px, py) != (x, y):
+            px += step_x
+            py += step_y
+            path.append((px + ox, py + oy))
+    return path
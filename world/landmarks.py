@@ -0,0 +1,95 @@
+from collections import deque
+
+from utils.config_manager import ConfigManager
+
+DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+
+class LandmarkTables:
+    """BFS distances from a few landmark tiles, for the ALT heuristic.
+
+    By the triangle inequality |d(L, goal) - d(L, pos)| never overestimates
+    the walking distance from pos to goal, and around walls and corridors
+    it is far tighter than Manhattan distance. Grids are indexed from the
+    deck's (min_x, min_y); landmarks and queries use deck coordinates.
+    """
+    def __init__(self, deck, count: int = 8):
+        self.revision = deck.walkability_revision
+        self.origin = (deck.min_x, deck.min_y)
+        self.width = deck.width
+        self.height = deck.height
+        self.walk = deck.walkable_grid()
+        self.landmarks = []
+        self.distances = []  # One distances[y][x] grid (None = unreachable) per landmark
+        self._select(count)
+
+    def _select(self, count):
+        """Farthest-point selection: each landmark is the tile farthest from those already chosen"""
+        floor = [(x, y) for y in range(self.height) for x in range(self.width) if self.walk[y][x]]
+        if not floor:
+            return
+        # Seed with the tile farthest from an arbitrary one, which lands on the deck's rim
+        seed = self._bfs(floor[0])
+        candidate = max(floor, key=lambda pos: seed[pos[1]][pos[0]] or 0)
+        closest = {pos: None for pos in floor}
+
+        while len(self.landmarks) < count:
+            distances = self._bfs(candidate)
+            self.landmarks.append((candidate[0] + self.origin[0], candidate[1] + self.origin[1]))
+            self.distances.append(distances)
+            for pos in floor:
+                distance = distances[pos[1]][pos[0]]
+                if distance is not None and (closest[pos] is None or distance < closest[pos]):
+                    closest[pos] = distance
+            # Tiles no landmark reaches yet (another component) go first
+            candidate = max(floor, key=lambda pos: (closest[pos] is None, closest[pos] or 0))
+            if (candidate[0] + self.origin[0], candidate[1] + self.origin[1]) in self.landmarks:
+                break
+
+    def _bfs(self, origin):
+        distances = [[None] * self.width for _ in range(self.height)]
+        distances[origin[1]][origin[0]] = 0
+        frontier = deque([origin])
+        while frontier:
+            x, y = frontier.popleft()
+            next_distance = distances[y][x] + 1
+            for dx, dy in DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if (0 <= nx < self.width and 0 <= ny < self.height and
+                        distances[ny][nx] is None and self.walk[ny][nx]):
+                    distances[ny][nx] = next_distance
+                    frontier.append((nx, ny))
+        return distances
+
+    def heuristic_to(self, goal):
+        """Admissible, consistent heuristic towards goal: max of Manhattan and landmark bounds"""
+        ox, oy = self.origin
+        goal_x, goal_y = goal[0] - ox, goal[1] - oy
+        if not (0 <= goal_x < self.width and 0 <= goal_y < self.height):
+            return lambda pos: abs(goal[0] - pos[0]) + abs(goal[1] - pos[1])
+        goal_distances = [(distances, distances[goal_y][goal_x]) for distances in self.distances
+                          if distances[goal_y][goal_x] is not None]
+
+        def heuristic(pos):
+            x, y = pos[0] - ox, pos[1] - oy
+            best = abs(goal_x - x) + abs(goal_y - y)
+            for distances, to_goal in goal_distances:
+                from_pos = distances[y][x]
+                if from_pos is not None:
+                    bound = abs(to_goal - from_pos)
+                    if bound > best:
+                        best = bound
+            return best
+        return heuristic
+
+_tables = {}  # deck -> LandmarkTables for its current walkability revision
+
+def landmark_tables(deck) -> LandmarkTables:
+    """Get the landmark tables for a deck, recomputing them after walkability changes"""
+    tables = _tables.get(deck)
+    if (tables is None or tables.revision != deck.walkability_revision or
+            tables.origin != (deck.min_x, deck.min_y) or
+            tables.width != deck.width or tables.height != deck.height):
+        count = ConfigManager.get_instance().get('game.pathfinding.landmarks', 8)
+        tables = LandmarkTables(deck, count)
+        _tables[deck] = tables
+    return tables
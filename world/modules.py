@@ -1,17 +1,32 @@
-class BaseModule:
+from world.entity_store import ComponentField, Entity, EntityStore, POWER
+from world.systems.update_scheduler import Sleep
+from world.type_registry import CONSUMER, MODULE, PRODUCER, register
+
+@register(MODULE, power_role=CONSUMER)
+class BaseModule(Entity):
+    __slots__ = ("entity", "name", "connected_cables")
+
+    # Stored in the entity store
+    power_required = ComponentField(POWER, "required")
+    power_available = ComponentField(POWER, "available")
+
     def __init__(self, name):
+        self.entity = EntityStore.get_instance().create(power={})
         self.name = name
         self.power_required = 0
         self.power_available = 0
         self.connected_cables = set()  # Store connected cable coordinates
 
     def update(self, dt):
-        pass
+        return Sleep()  # Nothing to do until something wakes it
 
     def is_powered(self):
         return self.power_available >= self.power_required
 
+@register(MODULE, sprite='life_support', power_role=CONSUMER, build_name="Life Support")
 class LifeSupportModule(BaseModule):
+    __slots__ = ("oxygen_rate", "active")
+
     def __init__(self, name="Life Support Unit", oxygen_rate=1):
         super().__init__(name)
         self.oxygen_rate = oxygen_rate
@@ -23,13 +38,19 @@ class LifeSupportModule(BaseModule):
         # Only produce oxygen if powered
         return self.oxygen_rate if self.active and self.is_powered() else 0
 
+@register(MODULE, sprite='reactor', power_role=PRODUCER, build_name="Reactor")
 class ReactorModule(BaseModule):
+    __slots__ = ("power_output",)
+
     def __init__(self, name="Basic Reactor", power_output=10):
         super().__init__(name)
         self.power_output = power_output
         self.power_available = power_output  # Reactors generate their own power
 
+@register(MODULE, sprite='engine', power_role=CONSUMER, build_name="Engine")
 class EngineModule(BaseModule):
+    __slots__ = ("thrust_power", "active")
+
     def __init__(self, name="Basic Engine", thrust_power=5):
         super().__init__(name)
         self.thrust_power = thrust_power
@@ -41,7 +62,32 @@ class EngineModule(BaseModule):
         # Only produce thrust if powered
         return self.thrust_power if self.active and self.is_powered() else 0
 
+def build_docking_door(ship, deck, x, y) -> bool:
+    """Place a docking door across two wall tiles, horizontally if possible"""
+    module = DockingDoorModule()
+    module.primary_position = (x, y)
+    
+    # Check horizontal placement
+    if deck.in_bounds(x + 1, y) and deck.tiles[y][x + 1].wall:
+        module.direction = 'horizontal'
+        module.secondary_position = (x + 1, y)
+    # Check vertical placement
+    elif deck.in_bounds(x, y + 1) and deck.tiles[y + 1][x].wall:
+        module.direction = 'vertical'
+        module.secondary_position = (x, y + 1)
+    else:
+        return False
+    
+    deck.tiles[y][x].module = module
+    second_x, second_y = module.secondary_position
+    deck.tiles[second_y][second_x].module = module
+    return True
+
+@register(MODULE, updates=True, sprite='docking_door', power_role=CONSUMER, builder=build_docking_door,
+          build_name="Docking Door")
 class DockingDoorModule(BaseModule):
+    __slots__ = ("active", "is_open", "direction", "primary_position", "secondary_position")
+
     def __init__(self, name="Docking Door"):
         super().__init__(name)
         self.power_required = 2  # Requires 2 power to operate
@@ -55,6 +101,7 @@ class DockingDoorModule(BaseModule):
         # Update door state based on power
         if not self.is_powered():
             self.is_open = False
+        return Sleep(power=True)
 
     @property
     def can_open(self):
@@ -0,0 +1,123 @@
+from array import array
+
+from utils.config_manager import ConfigManager
+
+class Path:
+    """Waypoints stored in a flat int array with a cursor.
+
+    Walking a path advances the cursor instead of popping from a list, and
+    iteration or indexing only sees the waypoints still ahead.
+    """
+    __slots__ = ("_coords", "_cursor")
+
+    def __init__(self, positions=()):
+        self._coords = array('i')
+        for x, y in positions:
+            self._coords.append(x)
+            self._coords.append(y)
+        self._cursor = 0
+
+    def __len__(self):
+        return len(self._coords) // 2 - self._cursor
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self):
+            raise IndexError("path index out of range")
+        i = (self._cursor + index) * 2
+        return self._coords[i], self._coords[i + 1]
+
+    def __iter__(self):
+        coords = self._coords
+        for i in range(self._cursor * 2, len(coords), 2):
+            yield coords[i], coords[i + 1]
+
+    def __repr__(self):
+        return f"Path({list(self)})"
+
+    def current(self):
+        """The next waypoint to walk to"""
+        return self[0]
+
+    def advance(self):
+        """Mark the current waypoint as reached"""
+        if self._cursor < len(self._coords) // 2:
+            self._cursor += 1
+
+    def clear(self):
+        self._cursor = len(self._coords) // 2
+
+    def corners(self):
+        """Waypoints ahead with straight runs collapsed to their end points"""
+        points = list(self)
+        if len(points) <= 2:
+            return points
+        corners = [points[0]]
+        for before, point, after in zip(points, points[1:], points[2:]):
+            if (point[0] - before[0], point[1] - before[1]) != (after[0] - point[0], after[1] - point[1]):
+                corners.append(point)
+        corners.append(points[-1])
+        return corners
+
+    def smoothed(self, deck):
+        """String-pulled copy: each waypoint is the farthest corner in line of sight"""
+        corners = self.corners()
+        if len(corners) <= 2:
+            return Path(corners)
+        waypoints = [corners[0]]
+        anchor = 0
+        while anchor < len(corners) - 1:
+            reach = anchor + 1
+            for candidate in range(anchor + 2, len(corners)):
+                if not line_of_sight(deck, corners[anchor], corners[candidate]):
+                    break
+                reach = candidate
+            waypoints.append(corners[reach])
+            anchor = reach
+        return Path(waypoints)
+
+def line_of_sight(deck, a, b):
+    """True if the segment between tile centres a and b only crosses walkable tiles.
+
+    Where the segment passes exactly through a tile corner both tiles beside
+    it must be walkable, so agents never cut a wall corner.
+    """
+    x, y = a
+    dx, dy = b[0] - x, b[1] - y
+    nx, ny = abs(dx), abs(dy)
+    sx = 1 if dx > 0 else -1
+    sy = 1 if dy > 0 else -1
+
+    def walkable(tx, ty):
+        tile = deck.tile_at(tx, ty)
+        return tile is not None and tile.is_walkable()
+
+    ix = iy = 0
+    while ix < nx or iy < ny:
+        decision = (1 + 2 * ix) * ny - (1 + 2 * iy) * nx
+        if decision == 0:
+            if not walkable(x + sx, y) or not walkable(x, y + sy):
+                return False
+            x += sx
+            y += sy
+            ix += 1
+            iy += 1
+        elif decision < 0:
+            x += sx
+            ix += 1
+        else:
+            y += sy
+            iy += 1
+        if not walkable(x, y):
+            return False
+    return True
+
+def walking_path(positions, deck=None) -> Path:
+    """Path for an agent standing on positions[0]: smoothed if enabled, first tile skipped"""
+    path = Path(positions)
+    if deck is not None and ConfigManager.get_instance().get('game.pathfinding.smooth_paths', False):
+        path = path.smoothed(deck)
+    path.advance()  # Skip first position (current position)
+    return path
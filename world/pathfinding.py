@@ -1,7 +1,114 @@
+from collections import OrderedDict
 from heapq import heappush, heappop
 
+from utils.config_manager import ConfigManager
+from world.change_journal import (JournalReader, WALL_SET, FLOOR_SET, OBJECT_PLACED, OBJECT_REMOVED,
+                                  MODULE_PLACED, MODULE_REMOVED, DECK_RESIZED)
+from world.hierarchical_pathfinding import find_path_hierarchical
+from world.jump_point_search import find_path_jps
+from world.landmarks import landmark_tables
 from world.objects import StorageContainer
 
+class PathCache:
+    """LRU cache of tile-to-tile paths per deck.
+
+    Entries are dropped when a tile they cross gets blocked, and every entry
+    of a deck is dropped when a tile opens up (a shorter or previously
+    impossible path may now exist) or the deck is resized. Edits are read
+    from each deck's change journal on the next lookup.
+    """
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._paths = OrderedDict()  # (deck, start, goal) -> tuple of positions
+        self._keys_by_tile = {}  # (deck, (x, y)) -> set of keys whose path crosses it
+        self._readers = {}  # deck -> JournalReader
+
+    def get(self, deck, start, goal):
+        """Return a copy of the cached path, or None on a miss"""
+        self._sync(deck)
+        key = (deck, start, goal)
+        path = self._paths.get(key)
+        if path is None:
+            self.misses += 1
+            return None
+        self._paths.move_to_end(key)
+        self.hits += 1
+        return list(path)
+
+    def put(self, deck, start, goal, path):
+        self._sync(deck)
+        key = (deck, start, goal)
+        if key in self._paths:
+            self._discard(key)
+        self._paths[key] = tuple(path)
+        # Failed searches are indexed by their endpoints only
+        for pos in path or (start, goal):
+            self._keys_by_tile.setdefault((deck, pos), set()).add(key)
+        while len(self._paths) > self.maxsize:
+            self._discard(next(iter(self._paths)))
+
+    def invalidate_tile(self, deck, pos):
+        """Drop every cached path that crosses the given tile"""
+        for key in self._keys_by_tile.pop((deck, pos), ()):
+            if key in self._paths:
+                self._discard(key)
+                self.invalidations += 1
+
+    def invalidate_deck(self, deck):
+        """Drop every cached path on a deck"""
+        for key in [key for key in self._paths if key[0] is deck]:
+            self._discard(key)
+            self.invalidations += 1
+
+    def clear(self):
+        self._paths.clear()
+        self._keys_by_tile.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'invalidations': self.invalidations,
+            'size': len(self._paths),
+        }
+
+    def _discard(self, key):
+        deck, start, goal = key
+        path = self._paths.pop(key)
+        for pos in path or (start, goal):
+            keys = self._keys_by_tile.get((deck, pos))
+            if keys:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tile[(deck, pos)]
+
+    def _sync(self, deck):
+        """Apply the deck's journaled edits since the last lookup"""
+        reader = self._readers.get(deck)
+        if reader is None:
+            self._readers[deck] = JournalReader(deck.journal)
+            return
+        events = reader.read()
+        if events is None:
+            self.invalidate_deck(deck)
+            return
+        for event in events:
+            if event.kind in (WALL_SET, MODULE_PLACED, MODULE_REMOVED) or (
+                    event.kind == OBJECT_PLACED and event.new.blocks):
+                self.invalidate_tile(deck, event.pos)
+            elif event.kind in (FLOOR_SET, DECK_RESIZED) or (
+                    event.kind == OBJECT_REMOVED and event.old.blocks):
+                self.invalidate_deck(deck)
+
+MAX_HEURISTIC_GOALS = 16
+
+path_cache = PathCache(ConfigManager.get_instance().get('game.pathfinding.cache_size', 2048))
+
 def manhattan_distance(a, b):
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
@@ -9,28 +116,43 @@ def get_neighbors(deck, pos):
     x, y = pos
     neighbors = []
     directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # Right, Down, Left, Up
+    tile_at = deck.tile_at
     
     for dx, dy in directions:
         new_x, new_y = x + dx, y + dy
-        if (0 <= new_x < deck.width and 
-            0 <= new_y < deck.height and 
-            deck.tiles[new_y][new_x].is_walkable()):
+        tile = tile_at(new_x, new_y)  # None outside the deck
+        if tile is not None and tile.is_walkable():
             neighbors.append((new_x, new_y))
     
     return neighbors
 
 def find_path_to_tile(deck, start, goal):
+    """Tile-to-tile path, served from the path cache when possible"""
+    if not deck.is_reachable(start, goal):
+        return []
+    path = path_cache.get(deck, start, goal)
+    if path is None:
+        path = PATH_ENGINES[_path_engine](deck, start, goal)
+        path_cache.put(deck, start, goal, path)
+    return path
+
+def _search_path_to_tile(deck, start, goal, stats=None, heuristic=None):
     """Original pathfinding logic for direct tile-to-tile paths"""
-    if not (deck.tiles[goal[1]][goal[0]].is_walkable()):
+    if not deck.tile_at(*goal).is_walkable():
         return []
+    if heuristic is None:
+        def heuristic(pos):
+            return manhattan_distance(goal, pos)
 
     frontier = []
     heappush(frontier, (0, start))
     came_from = {start: None}
     cost_so_far = {start: 0}
+    expanded = 0
 
     while frontier:
         current = heappop(frontier)[1]
+        expanded += 1
 
         if current == goal:
             break
@@ -39,10 +161,13 @@ def find_path_to_tile(deck, start, goal):
             new_cost = cost_so_far[current] + 1
             if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
                 cost_so_far[next_pos] = new_cost
-                priority = new_cost + manhattan_distance(goal, next_pos)
+                priority = new_cost + heuristic(next_pos)
                 heappush(frontier, (priority, next_pos))
                 came_from[next_pos] = current
 
+    if stats is not None:
+        stats['expanded'] = stats.get('expanded', 0) + expanded
+
     # Reconstruct path
     if goal not in came_from:
         return []
@@ -56,25 +181,174 @@ def find_path_to_tile(deck, start, goal):
     
     return path
 
+def _search_path_alt(deck, start, goal, stats=None):
+    """A* with the landmark (ALT) heuristic; same paths, fewer expansions on mazes"""
+    if not deck.tile_at(*goal).is_walkable():
+        return []
+    heuristic = landmark_tables(deck).heuristic_to(goal)
+    return _search_path_to_tile(deck, start, goal, stats, heuristic)
+
+# Tile-to-tile search engines selectable behind find_path
+PATH_ENGINES = {
+    'astar': _search_path_to_tile,
+    'alt': _search_path_alt,
+    'jps': find_path_jps,
+    'hpa': find_path_hierarchical,
+}
+
+_path_engine = ConfigManager.get_instance().get('game.pathfinding.engine', 'astar')
+
+def set_path_engine(name: str):
+    """Choose the tile-to-tile search used by find_path ('astar', 'alt', 'jps' or 'hpa')"""
+    global _path_engine
+    if name not in PATH_ENGINES:
+        raise ValueError(f"Unknown path engine: {name}")
+    _path_engine = name
+    path_cache.clear()
+
+def find_path_to_any(deck, start, goals):
+    """Single search towards several goal tiles at once.
+
+    Stops at the first goal reached, which is the closest by walking
+    distance. Returns (goal, path), or (None, []) when none is reachable.
+    """
+    # Goals outside the start's connected component can never be reached
+    goals = frozenset(goal for goal in goals if deck.is_reachable(start, goal))
+    if not goals:
+        return None, []
+
+    path = path_cache.get(deck, start, goals)
+    if path is None:
+        path = _search_path_to_any(deck, start, goals)
+        path_cache.put(deck, start, goals, path)
+    return (path[-1] if path else None), path
+
+def _search_path_to_any(deck, start, goals):
+    return run_steps(search_steps(deck, start, goals))
+
+def search_steps(deck, start, goals, heuristic=None):
+    """Resumable multi-goal A*: yields once per expanded node and returns the path (or [])"""
+    # The min-Manhattan heuristic costs O(goals) per node; with many goals
+    # plain uniform-cost search is cheaper
+    if heuristic is None and len(goals) <= MAX_HEURISTIC_GOALS:
+        def heuristic(pos):
+            return min(manhattan_distance(goal, pos) for goal in goals)
+    elif heuristic is None:
+        def heuristic(pos):
+            return 0
+
+    frontier = []
+    heappush(frontier, (0, start))
+    came_from = {start: None}
+    cost_so_far = {start: 0}
+    reached = None
+
+    while frontier:
+        current = heappop(frontier)[1]
+
+        if current in goals:
+            reached = current
+            break
+
+        for next_pos in get_neighbors(deck, current):
+            new_cost = cost_so_far[current] + 1
+            if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
+                cost_so_far[next_pos] = new_cost
+                priority = new_cost + heuristic(next_pos)
+                heappush(frontier, (priority, next_pos))
+                came_from[next_pos] = current
+        yield
+
+    if reached is None:
+        return []
+
+    path = []
+    current = reached
+    while current is not None:
+        path.append(current)
+        current = came_from[current]
+    path.reverse()
+    return path
+
+def run_steps(steps):
+    """Drive a resumable search to completion and return its result"""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as finished:
+            return finished.value
+
+def access_tiles(deck, pos):
+    """Walkable tiles adjacent to pos, from which an object there can be used"""
+    x, y = pos
+    tiles = []
+    for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+        tile = deck.tile_at(x + dx, y + dy)
+        if tile is not None and tile.is_walkable():
+            tiles.append((x + dx, y + dy))
+    return tiles
+
+def find_nearest_target(deck, start, targets):
+    """Pick the target closest by walking distance with a single search.
+
+    targets is an iterable of (target, (x, y)) for objects that are used
+    from an adjacent tile. Returns (target, (x, y), path) or None.
+    """
+    owners = {}  # access tile -> (target, pos)
+    for target, pos in targets:
+        for goal in access_tiles(deck, pos):
+            owners.setdefault(goal, (target, pos))
+
+    goal, path = find_path_to_any(deck, start, owners)
+    if goal is None:
+        return None
+    target, pos = owners[goal]
+    return target, pos, path
+
+def path_goals(deck, start, goal):
+    """The reachable tiles that satisfy a find_path request (around a container, or the goal itself)"""
+    tile = deck.tile_at(*goal)
+    if tile.object and isinstance(tile.object, StorageContainer):
+        goals = access_tiles(deck, goal)
+    else:
+        goals = [goal]
+    return frozenset(goal for goal in goals if deck.is_reachable(start, goal))
+
+def path_cache_key(goals):
+    return next(iter(goals)) if len(goals) == 1 else goals
+
+def find_path_steps(deck, start, goal):
+    """Resumable find_path: yields once per expanded node and returns the path.
+
+    Used by the path scheduler to spread searches over several frames.
+    """
+    goals = path_goals(deck, start, goal)
+    if not goals:
+        return []
+
+    key = path_cache_key(goals)
+    path = path_cache.get(deck, start, key)
+    if path is None:
+        path = yield from _engine_steps(deck, start, goals)
+        path_cache.put(deck, start, key, path)
+    return path
+
+def _engine_steps(deck, start, goals):
+    """Resumable search with the selected path engine; only A* handles several goals"""
+    if len(goals) > 1 or _path_engine == 'astar':
+        return (yield from search_steps(deck, start, goals))
+    goal = next(iter(goals))
+    if _path_engine == 'alt':
+        return (yield from search_steps(deck, start, goals, landmark_tables(deck).heuristic_to(goal)))
+    # JPS and HPA* don't expand tile by tile, so they run as a single step
+    return PATH_ENGINES[_path_engine](deck, start, goal)
+
 def find_path(deck, start, goal):
     """New wrapper function that handles paths to objects"""
-    # If goal is a storage container, find adjacent walkable tiles
-    tile = deck.tiles[goal[1]][goal[0]]
+    # If goal is a storage container, search to all its adjacent walkable tiles at once
+    tile = deck.tile_at(*goal)
     if tile.object and isinstance(tile.object, StorageContainer):
-        possible_goals = []
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            new_x, new_y = goal[0] + dx, goal[1] + dy
-            if (0 <= new_x < deck.width and 
-                0 <= new_y < deck.height and 
-                deck.tiles[new_y][new_x].is_walkable()):
-                possible_goals.append((new_x, new_y))
-        
-        # Find shortest path to any adjacent tile
-        shortest_path = []
-        for possible_goal in possible_goals:
-            path = find_path_to_tile(deck, start, possible_goal)
-            if path and (not shortest_path or len(path) < len(shortest_path)):
-                shortest_path = path
-        return shortest_path
+        _, path = find_path_to_any(deck, start, access_tiles(deck, goal))
+        return path
     
     return find_path_to_tile(deck, start, goal)
@@ -0,0 +1,146 @@
+from collections import deque
+
+DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+
+class ReachabilityIndex:
+    """Connected-component labels for the walkable tiles of a deck.
+
+    Opening a tile merges the components around it; blocking one re-floods
+    only as far as needed to tell whether its neighbours are still
+    connected. Lets callers reject unreachable goals before searching.
+    """
+    def __init__(self, deck):
+        self.deck = deck
+        self.labels = None  # labels[y - min_y][x - min_x] -> component id, None if not walkable
+        self.origin = (0, 0)  # Deck (min_x, min_y) when the labels were built
+        self.members = {}  # component id -> set of (x, y)
+        self._next_label = 0
+
+    def rebuild(self):
+        """Label every walkable tile from scratch"""
+        deck = self.deck
+        self.origin = ox, oy = (deck.min_x, deck.min_y)
+        self.labels = [[None] * deck.width for _ in range(deck.height)]
+        self.members = {}
+        tile_at = deck.tile_at
+        for row, labels in enumerate(self.labels):
+            for column in range(deck.width):
+                if labels[column] is None and tile_at(column + ox, row + oy).is_walkable():
+                    self._flood((column + ox, row + oy), self._new_label())
+
+    def invalidate(self):
+        """Drop all labels; they are rebuilt on the next query (e.g. after a resize)"""
+        self.labels = None
+        self.members = {}
+
+    def component(self, pos):
+        """Component id of a walkable tile, or None"""
+        if self.labels is None:
+            self.rebuild()
+        x, y = pos
+        if self.deck.in_bounds(x, y):
+            return self.labels[y - self.origin[1]][x - self.origin[0]]
+        return None
+
+    def start_components(self, pos):
+        """Components an agent at pos can walk into (its own, or its neighbours' if blocked)"""
+        label = self.component(pos)
+        if label is not None:
+            return {label}
+        x, y = pos
+        return {label for label in (self.component((x + dx, y + dy)) for dx, dy in DIRECTIONS)
+                if label is not None}
+
+    def can_reach(self, start, goal) -> bool:
+        """O(1) check whether a path from start to goal can exist"""
+        goal_label = self.component(goal)
+        return goal_label is not None and goal_label in self.start_components(start)
+
+    def tile_changed(self, tile):
+        """Update labels after a tile's walkability may have changed"""
+        if self.labels is None:
+            return
+        pos = (tile.x, tile.y)
+        label = self.component(pos)
+        if tile.is_walkable() and label is None:
+            self._open(pos)
+        elif not tile.is_walkable() and label is not None:
+            self._block(pos, label)
+
+    def _set(self, pos, label):
+        self.labels[pos[1] - self.origin[1]][pos[0] - self.origin[0]] = label
+
+    def _new_label(self):
+        self._next_label += 1
+        self.members[self._next_label] = set()
+        return self._next_label
+
+    def _walkable_neighbours(self, pos):
+        x, y = pos
+        return [(x + dx, y + dy) for dx, dy in DIRECTIONS
+                if self.component((x + dx, y + dy)) is not None]
+
+    def _open(self, pos):
+        """A tile became walkable: join it with its neighbours' components"""
+        labels = {self.component(n) for n in self._walkable_neighbours(pos)}
+        if not labels:
+            label = self._new_label()
+        else:
+            # Keep the largest component and relabel the others into it
+            label = max(labels, key=lambda l: len(self.members[l]))
+            for other in labels - {label}:
+                for member in self.members.pop(other):
+                    self._set(member, label)
+                    self.members[label].add(member)
+        self._set(pos, label)
+        self.members[label].add(pos)
+
+    def _block(self, pos, label):
+        """A tile became blocked: split its component if it no longer holds together"""
+        self._set(pos, None)
+        self.members[label].discard(pos)
+        if not self.members[label]:
+            del self.members[label]
+            return
+
+        pending = self._walkable_neighbours(pos)
+        while len(pending) > 1:
+            # Search from one neighbour until the others are found or its region is exhausted
+            origin = pending[0]
+            targets = set(pending[1:])
+            visited = {origin}
+            frontier = deque([origin])
+            while frontier and targets:
+                current = frontier.popleft()
+                targets.discard(current)
+                for neighbour in self._walkable_neighbours(current):
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        frontier.append(neighbour)
+            if not targets:
+                return  # Everything left is still connected
+            # The region around origin is cut off: give it its own label
+            new_label = self._new_label()
+            for member in visited:
+                self._set(member, new_label)
+            self.members[label] -= visited
+            self.members[new_label] = visited
+            pending = [n for n in pending if n not in visited]
+
+    def _flood(self, origin, label):
+        tile_at = self.deck.tile_at
+        labels = self.labels
+        ox, oy = self.origin
+        members = self.members[label]
+        self._set(origin, label)
+        members.add(origin)
+        frontier = deque([origin])
+        while frontier:
+            x, y = frontier.popleft()
+            for dx, dy in DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                tile = tile_at(nx, ny)  # None outside the deck, so the label lookup stays in range
+                if tile is not None and labels[ny - oy][nx - ox] is None and tile.is_walkable():
+                    labels[ny - oy][nx - ox] = label
+                    members.add((nx, ny))
+                    frontier.append((nx, ny))
@@ -1,9 +1,18 @@
 from world.objects import StorageContainer
 from world.weapons import Weapon
+from world.type_registry import WEAPON, info_of
 from world.systems.resource_manager import ResourceManager
 from world.systems.inventory_system import InventorySystem
 from world.systems.crew_manager import CrewManager
 from world.systems.deck_manager import DeckManager
+from world.systems.flow_field_system import FlowFieldSystem
+from world.systems.path_scheduler import PathScheduler
+from world.systems.timer_wheel import TimerWheel
+from world.systems.update_scheduler import UpdateScheduler
+from world.spatial_hash import ENEMIES, SpatialHash
+from utils.tracing import get_channel
+
+_trace = get_channel("ship")
 
 class Ship:
     def __init__(self, name="Unnamed Ship"):
@@ -11,12 +20,18 @@ class Ship:
         self.cable_system = None
         
         # Initialize systems
+        self.timers = TimerWheel()  # Cooldowns, timed sleeps and scheduled events, in game seconds
         self.resource_manager = ResourceManager()
         self.inventory_system = InventorySystem()
         self.inventory_system.ship = self
-        self.crew_manager = CrewManager()
+        self.crew_manager = CrewManager(self.timers)
         self.deck_manager = DeckManager()
+        self.flow_field_system = FlowFieldSystem()
+        self.path_scheduler = PathScheduler()
+        self.update_scheduler = UpdateScheduler(self.timers, on_added=self._mount)
+        self._power_revision = None  # cable_system.power_revision the sleepers last saw
         self.enemies = []  # List to store enemies
+        self.spatial_hash = SpatialHash()  # Where crew and enemies stand
 
     # Properties to maintain backward compatibility
     @property
@@ -58,44 +73,49 @@ class Ship:
         if dt == 0:  # Skip updates when paused
             return
             
-        print("\n--- Ship Update ---")
-        print(f"Number of enemies: {len(self.enemies)}")
+        if _trace.debug_enabled:
+            _trace.debug("Ship update: %s enemies", len(self.enemies))
         
         # Update cable system FIRST to ensure power state is current
         if self.cable_system:
             self.cable_system.update_networks()
         
-        # Update weapons BEFORE other systems
-        print("\n--- Weapon Update Loop ---")
-        for deck in self.decks:
-            print(f"Checking deck: {deck.name}")
-            for y in range(deck.height):
-                for x in range(deck.width):
-                    tile = deck.tiles[y][x]
-                    if tile.object and (isinstance(tile.object, Weapon) or 
-                                      type(tile.object).__bases__[0].__name__ == 'Weapon'):
-                        print(f"\nFound weapon at ({x}, {y})")
-                        weapon = tile.object
-                        # Re-establish ship reference
-                        if weapon.ship is None:
-                            print("Restoring ship reference")
-                            weapon.set_ship(self)
-                        weapon.set_position(x, y)
-                        weapon.tile = tile
-                        print(f"Updating weapon: {weapon.name}")
-                        weapon.update(dt)
+        # Wake whatever was waiting for power to change
+        if self.cable_system and self.cable_system.power_revision != self._power_revision:
+            self._power_revision = self.cable_system.power_revision
+            self.update_scheduler.power_changed()
+        
+        # Fire whatever timers came due: expired cooldowns, timed wake-ups, scheduled events
+        self.timers.advance(dt)
+
+        # Update modules and objects with work to do (weapons included) BEFORE other systems
+        self.update_scheduler.update(dt, self.spatial_hash)
+
+        # Advance queued path searches within this tick's budget
+        self.path_scheduler.update()
+
+    def _mount(self, entity, deck, pos):
+        """Hook a newly scheduled weapon up to this ship and the tile it sits on"""
+        info = info_of(entity)
+        if info is None or info.category != WEAPON:
+            return
+        x, y = pos
+        entity.set_position(x, y)
+        if entity.ship is None:
+            if _trace.info_enabled:
+                _trace.info("Restoring ship reference for %s at (%s, %s)", entity.name, x, y)
+            entity.set_ship(self)
+        entity.tile = deck.tiles[y][x]
 
     def add_deck(self, deck):
         """Add a new deck to the ship"""
         self.deck_manager.add_deck(deck)
+        self.update_scheduler.watch(deck)
         self.calculate_oxygen_capacity()
         
         # Register all storage containers in the deck
-        for y in range(deck.height):
-            for x in range(deck.width):
-                tile = deck.tiles[y][x]
-                if tile.object and isinstance(tile.object, StorageContainer):
-                    self.inventory_system.register_container(tile.object)
+        for container, _ in deck.find_objects(StorageContainer):
+            self.inventory_system.register_container(container)
 
     def add_crew_member(self, crew_member):
         """Add a new crew member to the ship"""
@@ -122,16 +142,18 @@ class Ship:
         """Add a new enemy to the ship"""
         enemy.ship = self
         self.enemies.append(enemy)
-        
+        self.spatial_hash.insert(enemy, ENEMIES)
+
     def remove_enemy(self, enemy):
         """Remove an enemy from the ship"""
         if enemy in self.enemies:
             self.enemies.remove(enemy)
+            self.spatial_hash.remove(enemy)
+            enemy.destroy()
 
     def add_weapon(self, weapon: Weapon, deck, x: int, y: int):
         """Add a weapon to the ship"""
-        print(f"\n--- Adding Weapon to Ship ---")
-        print(f"Adding {weapon.name} at ({x}, {y})")
+        if _trace.info_enabled:
+            _trace.info("Adding %s at (%s, %s)", weapon.name, x, y)
         weapon.set_ship(self)  # Set ship reference
         deck.tiles[y][x].object = weapon
-        print(f"Weapon added to tile: {type(deck.tiles[y][x].object).__name__}")
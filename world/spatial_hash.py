@@ -0,0 +1,159 @@
+from math import floor
+
+from world.entity_store import EntityStore, POSITION
+
+# Layers
+CREW = "crew"
+ENEMIES = "enemies"
+
+class SpatialHash:
+    """Crew and enemies bucketed by the tile they stand on, for point, radius and nearest queries.
+
+    Positions live in the entity store. Each hash subscribes to POSITION
+    writes, and moves just the entities written since then between buckets
+    before answering the next query, so keeping it current costs the
+    entities that moved rather than everyone. Queries
+    measure exact positions; distance ties go to whoever was inserted first.
+    """
+    def __init__(self):
+        self._moved = EntityStore.get_instance().components[POSITION].subscribe()  # Written since the last query
+        self._cells = {}  # (x, y) tile -> {obj: None} standing on it
+        self._cell_of = {}  # obj -> its tile
+        self._layer_of = {}
+        self._order = {}  # obj -> insertion number
+        self._by_entity = {}  # Entity id -> obj
+        self._inserted = 0
+        self._bounds = None  # (min x, min y, max x, max y) of every tile occupied so far
+
+    def __len__(self):
+        return len(self._cell_of)
+
+    def __contains__(self, obj):
+        return obj in self._cell_of
+
+    def insert(self, obj, layer):
+        if obj in self._cell_of:
+            return
+        self._layer_of[obj] = layer
+        self._order[obj] = self._inserted
+        self._inserted += 1
+        self._by_entity[obj.entity] = obj
+        self._place(obj, _tile(obj.x, obj.y))
+
+    def remove(self, obj):
+        cell = self._cell_of.pop(obj, None)
+        if cell is None:
+            return
+        self._unlink(obj, cell)
+        del self._layer_of[obj], self._order[obj], self._by_entity[obj.entity]
+
+    def find(self, entity, layer=None):
+        """The object inserted for an entity id, or None (also when it is on another layer)"""
+        obj = self._by_entity.get(entity)
+        if obj is None or (layer is not None and self._layer_of[obj] != layer):
+            return None
+        return obj
+
+    def refresh(self):
+        """Move whatever changed tile since the last query to its new bucket"""
+        changed = self._moved
+        for entity in changed:
+            obj = self._by_entity.get(entity)
+            if obj is None:
+                continue
+            cell = _tile(obj.x, obj.y)
+            if cell != self._cell_of[obj]:
+                self._unlink(obj, self._cell_of[obj])
+                self._place(obj, cell)
+        changed.clear()
+
+    def at(self, x, y, layer=None):
+        """Everything standing on tile (x, y)"""
+        self.refresh()
+        found = [obj for obj in self._cells.get((x, y), ()) if layer is None or self._layer_of[obj] == layer]
+        found.sort(key=self._order.__getitem__)
+        return found
+
+    def pick(self, x, y, layer=None):
+        """First one standing on tile (x, y), or None"""
+        found = self.at(x, y, layer)
+        return found[0] if found else None
+
+    def within(self, x, y, radius, layer=None, predicate=None):
+        """Everything within radius of (x, y), nearest first"""
+        self.refresh()
+        cells = self._cells_near(x, y, floor(x - radius), floor(y - radius), floor(x + radius), floor(y + radius))
+        return [obj for distance, _, obj in self._measure(cells, x, y, layer, predicate) if distance <= radius]
+
+    def nearest(self, x, y, k=1, radius=None, layer=None, predicate=None):
+        """Up to k nearest to (x, y), optionally no further than radius, nearest first"""
+        self.refresh()
+        if not self._cells or k <= 0:
+            return []
+        cx, cy = floor(x), floor(y)
+        min_x, min_y, max_x, max_y = self._bounds
+        reach = max(cx - min_x, max_x - cx, cy - min_y, max_y - cy, 0)
+        if radius is not None:
+            reach = min(reach, floor(radius) + 1)
+        if (2 * reach + 1) ** 2 > 4 * len(self._cells):
+            # Rings would mostly be empty tiles: measure every occupied one instead
+            found = self._measure(self._cells_near(x, y, cx - reach, cy - reach, cx + reach, cy + reach),
+                                  x, y, layer, predicate)
+        else:
+            # Grow rings of tiles until nothing further out can beat the k best
+            found = []
+            for ring in range(reach + 1):
+                if len(found) >= k and found[k - 1][0] <= ring - 1:
+                    break
+                found += self._measure(_ring(cx, cy, ring), x, y, layer, predicate)
+                found.sort()
+        return [obj for distance, _, obj in found[:k] if radius is None or distance <= radius]
+
+    def _cells_near(self, x, y, x0, y0, x1, y1):
+        """Tile keys in the box, or just the occupied ones when those are fewer"""
+        if (x1 - x0 + 1) * (y1 - y0 + 1) <= len(self._cells):
+            return [(cx, cy) for cy in range(y0, y1 + 1) for cx in range(x0, x1 + 1)]
+        return [cell for cell in self._cells if x0 <= cell[0] <= x1 and y0 <= cell[1] <= y1]
+
+    def _measure(self, cells, x, y, layer, predicate):
+        """(distance, insertion number, obj) for everything matching in the given tiles, sorted"""
+        found = []
+        for cell in cells:
+            for obj in self._cells.get(cell, ()):
+                if layer is not None and self._layer_of[obj] != layer:
+                    continue
+                if predicate is not None and not predicate(obj):
+                    continue
+                distance = ((obj.x - x) ** 2 + (obj.y - y) ** 2) ** 0.5
+                found.append((distance, self._order[obj], obj))
+        found.sort()
+        return found
+
+    def _place(self, obj, cell):
+        self._cell_of[obj] = cell
+        self._cells.setdefault(cell, {})[obj] = None
+        x, y = cell
+        if self._bounds is None:
+            self._bounds = (x, y, x, y)
+        else:
+            min_x, min_y, max_x, max_y = self._bounds
+            self._bounds = (min(min_x, x), min(min_y, y), max(max_x, x), max(max_y, y))
+
+    def _unlink(self, obj, cell):
+        bucket = self._cells[cell]
+        del bucket[obj]
+        if not bucket:
+            del self._cells[cell]
+
+def _tile(x, y):
+    return floor(x), floor(y)
+
+def _ring(cx, cy, ring):
+    """Tiles at exactly `ring` steps (Chebyshev) from (cx, cy)"""
+    if ring == 0:
+        return [(cx, cy)]
+    cells = [(cx + dx, cy - ring) for dx in range(-ring, ring + 1)]
+    cells += [(cx + dx, cy + ring) for dx in range(-ring, ring + 1)]
+    cells += [(cx - ring, cy + dy) for dy in range(-ring + 1, ring)]
+    cells += [(cx + ring, cy + dy) for dy in range(-ring + 1, ring)]
+    return cells
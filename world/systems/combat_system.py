@@ -0,0 +1,143 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; turrets then update one by one
+    np = None
+
+from utils.tracing import get_channel
+from world.systems.update_scheduler import Sleep
+
+_trace = get_channel("weapons")
+
+def update_turrets(turrets, dt):
+    """LaserTurret.update for many turrets in one pass; returns each turret's result.
+
+    Turrets on the same ship are matched against its enemies with one
+    turret x enemy distance matrix. Shots are then resolved in turret
+    order, so an enemy killed by one turret is not picked by the next,
+    exactly as when the turrets update one after another.
+    """
+    # Debug tracing wants every per-turret step, so keep the scalar path for it
+    if np is None or _trace.debug_enabled:
+        return [turret.update(dt) for turret in turrets]
+
+    results = [None] * len(turrets)
+    by_ship = {}
+    for i, turret in enumerate(turrets):
+        by_ship.setdefault(turret.ship, []).append(i)
+    for ship, rows in by_ship.items():
+        group = [turrets[i] for i in rows]
+        if ship is None or not ship.enemies:
+            group_results = [turret.update(dt) for turret in group]
+        else:
+            group_results = _engage(group, ship.enemies, dt)
+        for i, result in zip(rows, group_results):
+            results[i] = result
+    return results
+
+def _engage(turrets, enemies, dt):
+    count = len(turrets)
+    results = [None] * count
+
+    # Power, as Weapon.update checks it
+    powered = np.zeros(count, dtype=bool)
+    for i, turret in enumerate(turrets):
+        turret.powered = turret.tile.has_power(turret.power_required) if turret.tile else False
+        if turret.powered:
+            powered[i] = True
+        else:
+            results[i] = Sleep(power=True)
+
+    cooldown = np.array([turret.current_cooldown for turret in turrets], dtype=float)
+    counting = powered & np.array([turret.cooldown_timer is None for turret in turrets], dtype=bool)
+    cooldown = np.where(counting & (cooldown > 0), np.maximum(0, cooldown - dt), cooldown)
+    firing = np.flatnonzero(powered).tolist()
+
+    # Every turret without a live target against every enemy at once
+    searching = [i for i in firing if turrets[i].target is None or turrets[i].target.is_dead()]
+    targets = _Targets(turrets, searching, enemies) if searching else None
+
+    # Resolve shots in turret order, so kills made this tick are seen by the turrets after
+    for i in firing:
+        turret = turrets[i]
+        target = turret.target
+        if target is not None and target.is_dead():
+            if _trace.info_enabled:
+                _trace.info("%s target %s is dead - resetting target", turret.name, target.name)
+            target = turret.target = None
+
+        if target is None:
+            if targets is None:  # Its target was killed by an earlier turret
+                targets = _Targets(turrets, [], enemies)
+            target = turret.target = targets.nearest(i)
+            if target is None:
+                if cooldown[i] == 0:
+                    # Idle until an enemy comes in range or power changes
+                    results[i] = Sleep(power=True, enemy_range=turret.range)
+                elif turret.cooldown_timer is not None:
+                    results[i] = Sleep()  # The cooldown timer wakes it
+                continue
+            if _trace.info_enabled:
+                _trace.info("%s acquired target %s", turret.name, target.name)
+
+        if cooldown[i] == 0 and ((target.x - turret.x) ** 2 + (target.y - turret.y) ** 2) ** 0.5 <= turret.range:
+            target.take_damage(turret.damage)
+            turret.start_cooldown()
+            cooldown[i] = turret.attack_cooldown
+            if targets is not None and target.is_dead():
+                targets.killed(target)
+            if _trace.info_enabled:
+                _trace.info("%s fired at %s, health now %s", turret.name, target.name, target.health)
+
+        if turret.cooldown_timer is not None:
+            results[i] = Sleep()  # The cooldown timer wakes it
+
+    for i in firing:
+        turrets[i].current_cooldown = float(cooldown[i])
+    return results
+
+class _Targets:
+    """Nearest live enemy in range of each turret, from a turret x enemy distance matrix"""
+    def __init__(self, turrets, searching, enemies):
+        self.turrets = turrets
+        self.enemies = enemies
+        self.x = np.array([enemy.x for enemy in enemies], dtype=float)
+        self.y = np.array([enemy.y for enemy in enemies], dtype=float)
+        self.alive = np.array([not enemy.is_dead() for enemy in enemies], dtype=bool)
+        self.column = {enemy: j for j, enemy in enumerate(enemies)}
+        self._rows = {i: row for row, i in enumerate(searching)}
+        self._nearest = None
+        if searching:
+            distance = self._distance(searching)
+            self._in_range = distance <= np.array([turrets[i].range for i in searching], dtype=float)[:, None]
+            self._distance_rows = distance
+            candidates = np.where(self._in_range & self.alive, distance, np.inf)
+            nearest = candidates.argmin(axis=1)  # First enemy on ties, like find_target
+            self._nearest = np.where(np.isfinite(candidates[np.arange(len(searching)), nearest]), nearest, -1)
+
+    def _distance(self, indices):
+        turret_x = np.array([self.turrets[i].x for i in indices], dtype=float)
+        turret_y = np.array([self.turrets[i].y for i in indices], dtype=float)
+        dx = self.x[None, :] - turret_x[:, None]
+        dy = self.y[None, :] - turret_y[:, None]
+        return np.sqrt(dx ** 2 + dy ** 2)  # Rounded as in find_target, so range edges agree
+
+    def nearest(self, i):
+        """Closest live enemy in range of turret i, or None"""
+        row = self._rows.get(i)
+        if row is not None:
+            j = int(self._nearest[row])
+            if j < 0 or self.alive[j]:
+                return self.enemies[j] if j >= 0 else None
+            # Killed earlier this tick: look again
+            distance, in_range = self._distance_rows[row], self._in_range[row]
+        else:
+            distance = self._distance([i])[0]
+            in_range = distance <= self.turrets[i].range
+        candidates = np.where(in_range & self.alive, distance, np.inf)
+        j = int(candidates.argmin())
+        return self.enemies[j] if np.isfinite(candidates[j]) else None
+
+    def killed(self, enemy):
+        j = self.column.get(enemy)
+        if j is not None:
+            self.alive[j] = False
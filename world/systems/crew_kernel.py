@@ -0,0 +1,152 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; CrewManager falls back to the per-entity systems
+    np = None
+
+from world.entity_store import EntityStore, NEEDS, PATH, POSITION, VELOCITY
+from world.systems.entity_systems import HUNGER_DECAY, HUNGER_THRESHOLD, SLEEP_DECAY
+
+class CrewKernel:
+    """Needs decay and waypoint movement for a whole crew as a few NumPy array operations.
+
+    Each tick positions, speeds, hunger and sleep are gathered from the
+    entity store into arrays, stepped together and written back. Only the
+    members that need a decision reach the scalar AI on CrewMember: those
+    asleep or waiting on a path search, those hungry with nowhere to go,
+    and those at the end of their path. The next waypoint of every walking
+    member is cached and refreshed only when its path changes.
+    """
+    def __init__(self):
+        store = EntityStore.get_instance()
+        self._position = store.components[POSITION]
+        self._velocity = store.components[VELOCITY]
+        self._needs = store.components[NEEDS]
+        self._path = store.components[PATH]
+        self._path_changes = self._path.subscribe()  # Members whose path was replaced or advanced
+        self.members = []  # Row -> CrewMember
+        self._index = {}  # Entity -> row
+        self._rows = {}  # Component name -> [row of each member in its columns] (None: the whole column)
+        self._layout = None  # Component versions the rows were built for
+        self.target_x = np.zeros(0)
+        self.target_y = np.zeros(0)
+        self.walking = np.zeros(0, dtype=bool)  # Has a waypoint to walk to
+        self._paths = []  # Row -> Path the cached waypoint came from
+        self.decisions = 0  # Members handed to the scalar AI on the last tick
+
+    def update(self, crew, dt):
+        self._sync(crew)
+        if not self.members:
+            return
+        needs, path = self._needs, self._path
+        self.decisions = 0
+
+        # Asleep or waiting on a search: the AI rests or picks up the result
+        resting = _gather(needs.columns["resting"], self._rows[NEEDS], bool)
+        pending = _gather(path.columns["pending"], self._rows[PATH], bool)
+        self._decide(np.flatnonzero(resting | pending), "think")
+        awake = ~resting
+        self._refresh_waypoints()
+
+        # Needs decay for everyone awake
+        hunger = _gather(needs.columns["hunger"], self._rows[NEEDS], float)
+        sleep = _gather(needs.columns["sleep"], self._rows[NEEDS], float)
+        hunger = np.where(awake, np.maximum(0, hunger - HUNGER_DECAY * dt), hunger)
+        sleep = np.where(awake, np.maximum(0, sleep - SLEEP_DECAY * dt), sleep)
+        _scatter(needs.columns["hunger"], self._rows[NEEDS], hunger)
+        _scatter(needs.columns["sleep"], self._rows[NEEDS], sleep)
+
+        # Hungry with no path and no search: the AI looks for food
+        pending = _gather(path.columns["pending"], self._rows[PATH], bool)
+        self._decide(np.flatnonzero(awake & (hunger < HUNGER_THRESHOLD) & ~self.walking & ~pending),
+                     "seek_food")
+
+        # Step everyone walking towards their next waypoint
+        old_x = _gather(self._position.columns["x"], self._rows[POSITION], float)
+        old_y = _gather(self._position.columns["y"], self._rows[POSITION], float)
+        step = _gather(self._velocity.columns["speed"], self._rows[VELOCITY], float) * dt
+        walking = awake & self.walking
+        dx = self.target_x - old_x
+        dy = self.target_y - old_y
+        distance = np.hypot(dx, dy)
+        reached = walking & (distance <= step)
+        scale = np.divide(step, distance, out=np.zeros_like(step), where=walking & ~reached)
+        x = np.where(reached, self.target_x, old_x + dx * scale)  # Snap onto reached waypoints
+        y = np.where(reached, self.target_y, old_y + dy * scale)
+        _scatter(self._position.columns["x"], self._rows[POSITION], x)
+        _scatter(self._position.columns["y"], self._rows[POSITION], y)
+        if self._position.watched:
+            # A spatial hash follows positions: report the members now on another tile
+            crossed = (np.floor(x) != np.floor(old_x)) | (np.floor(y) != np.floor(old_y))
+            for i in np.flatnonzero(crossed).tolist():
+                self._position.mark(self.members[i].entity)
+
+        # Move on to the next waypoint, or arrive
+        arrived = []
+        for i in np.flatnonzero(reached).tolist():
+            move_path = self._paths[i]
+            move_path.advance()
+            if move_path:
+                self.target_x[i], self.target_y[i] = move_path.current()
+            else:
+                self.walking[i] = False
+                arrived.append(i)
+        self._decide(arrived, "arrive")
+
+    def _decide(self, rows, action):
+        """Run one scalar AI step on the given members"""
+        for i in (rows.tolist() if isinstance(rows, np.ndarray) else rows):
+            getattr(self.members[i], action)()
+        self.decisions += len(rows)
+
+    def _sync(self, crew):
+        """Rebuild member rows when the crew or the store's row layout changed"""
+        layout = tuple(array.version for array in (self._position, self._velocity, self._needs, self._path))
+        if crew == self.members and layout == self._layout:
+            return
+        if crew != self.members:
+            self.members = list(crew)
+            self._index = {member.entity: i for i, member in enumerate(self.members)}
+            count = len(self.members)
+            self.target_x = np.zeros(count)
+            self.target_y = np.zeros(count)
+            self.walking = np.zeros(count, dtype=bool)
+            self._paths = [None] * count
+            self._path_changes.update(self._index)  # Look up every waypoint again
+        self._layout = layout
+        for array in (self._position, self._velocity, self._needs, self._path):
+            rows = [array.rows[member.entity] for member in self.members]
+            whole = rows == list(range(len(array)))
+            self._rows[array.name] = None if whole else rows
+
+    def _refresh_waypoints(self):
+        changed = self._path_changes
+        for entity in changed:
+            i = self._index.get(entity)
+            if i is not None:
+                self._set_waypoint(i, self.members[i].move_path)
+        changed.clear()
+
+    def _set_waypoint(self, i, move_path):
+        """Cache the next waypoint of member i"""
+        self._paths[i] = move_path
+        self.walking[i] = bool(move_path)
+        if move_path:
+            self.target_x[i], self.target_y[i] = move_path.current()
+
+def _gather(column, rows, dtype):
+    """Values of the given rows of a store column as an array.
+
+    Only the crew's rows are read: the column also holds every other
+    entity with the component, such as turrets and enemies.
+    """
+    if rows is None:
+        return np.array(column, dtype=dtype)
+    return np.array([column[row] for row in rows], dtype=dtype)
+
+def _scatter(column, rows, values):
+    """Write an array back into the given rows of a store column"""
+    if rows is None:
+        column[:] = values.tolist()
+        return
+    for row, value in zip(rows, values.tolist()):
+        column[row] = value
@@ -1,21 +1,97 @@
+from utils.config_manager import ConfigManager
+from world.entity_store import EntityStore, NEEDS
+from world.systems.crew_kernel import CrewKernel, np
+from world.spatial_hash import CREW
+from world.systems.entity_systems import HUNGER_DECAY, HUNGER_THRESHOLD, decay_needs, move_entities
+
 class CrewManager:
-    def __init__(self):
+    def __init__(self, timers=None):
         self.crew = []
+        use_kernel = ConfigManager.get_instance().get('crew.batch_kernel', True)
+        self.kernel = CrewKernel() if use_kernel and np is not None else None
+        # With a timer wheel the per-member update only checks those whose hunger timer came due;
+        # the kernel checks every member's hunger in its batch anyway
+        self.timers = timers
+        self._hungry = set()  # Members that may be below the hunger threshold
+        self._hunger_timers = {}  # Member -> Timer due when its hunger reaches the threshold
+        self._rank = {}  # Member -> index in crew, to keep crew order
+        self._by_entity = {}  # Entity id -> member
+        # Eating, or anything else setting hunger, moves the time it runs low
+        self._hunger_writes = (EntityStore.get_instance().components[NEEDS].subscribe()
+                               if timers is not None and self.kernel is None else None)
 
     def add_crew_member(self, crew_member, ship):
         """Add a new crew member"""
         crew_member.ship = ship
+        self._rank[crew_member] = len(self.crew)
+        self._by_entity[crew_member.entity] = crew_member
         self.crew.append(crew_member)
+        ship.spatial_hash.insert(crew_member, CREW)
+        if self.timers is not None and self.kernel is None:
+            self._watch_hunger(crew_member)
 
     def remove_crew_member(self, crew_member):
         """Remove a crew member"""
         if crew_member in self.crew:
             self.crew.remove(crew_member)
+            self._rank = {member: i for i, member in enumerate(self.crew)}
+            del self._by_entity[crew_member.entity]
+            self._forget_hunger(crew_member)
+            if crew_member.ship is not None:
+                crew_member.ship.spatial_hash.remove(crew_member)
+            crew_member.destroy()
 
     def update(self, dt):
-        """Update all crew members"""
-        for crew_member in self.crew:
-            crew_member.update(dt)
+        """Update all crew members: needs and movement run as batched systems around each member's AI"""
+        if self.kernel is not None:
+            self.kernel.update(self.crew, dt)
+            return
+        awake = [crew_member for crew_member in self.crew if crew_member.think()]
+        entities = [crew_member.entity for crew_member in awake]
+        decay_needs(dt, entities)
+        if self.timers is None:
+            for crew_member in awake:
+                crew_member.seek_food()
+        else:
+            self._seek_food(awake)
+        by_entity = {crew_member.entity: crew_member for crew_member in awake}
+        for entity in move_entities(dt, entities):
+            by_entity[entity].arrive()
+
+    def _seek_food(self, awake):
+        """Let the members whose hunger timer came due look for food"""
+        for entity in self._hunger_writes:
+            crew_member = self._by_entity.get(entity)
+            if crew_member is not None:
+                self._forget_hunger(crew_member)
+                self._watch_hunger(crew_member)
+        self._hunger_writes.clear()
+        awake = set(awake)
+        for crew_member in sorted(self._hungry, key=self._rank.__getitem__):
+            if crew_member.hunger >= HUNGER_THRESHOLD:
+                # Ate, or rested while the timer ran: work out when it gets hungry now
+                self._hungry.discard(crew_member)
+                self._watch_hunger(crew_member)
+            elif crew_member in awake:
+                crew_member.seek_food()
+
+    def _watch_hunger(self, crew_member):
+        """Time when hunger will drop below the threshold at the current decay rate"""
+        if crew_member.hunger < HUNGER_THRESHOLD:
+            self._hungry.add(crew_member)
+        elif HUNGER_DECAY > 0:
+            delay = (crew_member.hunger - HUNGER_THRESHOLD) / HUNGER_DECAY
+            self._hunger_timers[crew_member] = self.timers.schedule(delay, self._hunger_due, crew_member)
+
+    def _forget_hunger(self, crew_member):
+        self._hungry.discard(crew_member)
+        timer = self._hunger_timers.pop(crew_member, None)
+        if timer is not None:
+            timer.cancel()
+
+    def _hunger_due(self, crew_member):
+        self._hunger_timers.pop(crew_member, None)
+        self._hungry.add(crew_member)
 
     def get_crew_count(self) -> int:
         """Get total number of crew members"""
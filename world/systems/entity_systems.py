@@ -0,0 +1,62 @@
+"""Systems that run over the entity store's component columns.
+
+Each takes an optional list of entity ids; without one it walks every
+entity holding the components it needs.
+"""
+from utils.config_manager import ConfigManager
+from world.entity_store import EntityStore, NEEDS, PATH, POSITION, VELOCITY
+
+_config = ConfigManager.get_instance()
+HUNGER_DECAY = _config.get('crew.needs.hunger.decay_rate', 0.1)  # Per second
+HUNGER_THRESHOLD = _config.get('crew.needs.hunger.threshold', 50)  # Look for food below this
+SLEEP_DECAY = _config.get('crew.needs.sleep.decay_rate', 0.01)
+
+def decay_needs(dt, entities=None):
+    """Lower hunger and sleep of entities that aren't resting"""
+    needs = EntityStore.get_instance().components[NEEDS]
+    hunger, sleep, resting = needs.columns["hunger"], needs.columns["sleep"], needs.columns["resting"]
+    rows = range(len(needs)) if entities is None else [needs.rows[entity] for entity in entities]
+    for row in rows:
+        if resting[row]:
+            continue
+        hunger[row] = max(0, hunger[row] - HUNGER_DECAY * dt)
+        sleep[row] = max(0, sleep[row] - SLEEP_DECAY * dt)
+
+def move_entities(dt, entities=None):
+    """Step entities along their paths; returns those whose path ran out this tick"""
+    store = EntityStore.get_instance()
+    position, velocity, path = (store.components[name] for name in (POSITION, VELOCITY, PATH))
+    xs, ys = position.columns["x"], position.columns["y"]
+    speeds, paths = velocity.columns["speed"], path.columns["path"]
+    if entities is None:
+        entities = store.query(POSITION, VELOCITY, PATH)
+
+    track_moves = position.watched  # A spatial hash follows positions
+    track_paths = path.watched  # A batch system caches waypoints
+    arrived = []
+    for entity in entities:
+        move_path = paths[path.rows[entity]]
+        if not move_path:
+            continue
+        row = position.rows[entity]
+        target = move_path.current()
+        move_distance = speeds[velocity.rows[entity]] * dt
+
+        dx = target[0] - xs[row]
+        dy = target[1] - ys[row]
+        distance = (dx ** 2 + dy ** 2) ** 0.5
+
+        if distance <= move_distance:
+            # Reached the next point in path
+            xs[row], ys[row] = target
+            move_path.advance()
+            if track_paths:
+                path.mark(entity)
+            if not move_path:
+                arrived.append(entity)
+        else:
+            xs[row] += (dx / distance) * move_distance
+            ys[row] += (dy / distance) * move_distance
+        if track_moves:
+            position.mark(entity)
+    return arrived
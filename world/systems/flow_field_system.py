@@ -0,0 +1,73 @@
+from world.flow_field import FlowField
+from world.items import ItemType
+from world.objects import Bed, StorageContainer
+
+class FlowFieldSystem:
+    """Shared per-deck flow fields towards registered points of interest.
+
+    Fields are rebuilt lazily: only when queried after the deck's
+    walkability changed or the set of matching targets changed.
+    """
+    def __init__(self):
+        self.targets = {}  # name -> (object_type, predicate or None)
+        self._fields = {}  # (deck, name) -> FlowField
+        self.builds = 0
+
+        self.register_target("food", StorageContainer,
+                             lambda container: container.get_item_count(ItemType.FOOD) > 0)
+        self.register_target("beds", Bed)
+
+    def register_target(self, name: str, object_type, predicate=None):
+        """Register a class of objects agents may want to walk to"""
+        self.targets[name] = (object_type, predicate)
+        for key in [key for key in self._fields if key[1] == name]:
+            del self._fields[key]
+
+    def field(self, deck, name: str) -> FlowField:
+        """Get the up-to-date flow field towards the named targets on a deck"""
+        field = self._current(deck, name)
+        for _ in field.build_steps():
+            pass
+        return field
+
+    def field_steps(self, deck, name: str):
+        """Resumable field(): yields while the field is being built, then returns it"""
+        while True:
+            field = self._current(deck, name)
+            yield from field.build_steps()
+            # Walls may have moved while the build was spread over frames
+            if field.revision == deck.walkability_revision:
+                return field
+
+    def _current(self, deck, name):
+        """The field matching the deck's walkability and targets, possibly still unbuilt"""
+        object_type, predicate = self.targets[name]
+        targets = [
+            (entity, pos) for entity, pos in deck.find_objects(object_type)
+            if predicate is None or predicate(entity)
+        ]
+
+        field = self._fields.get((deck, name))
+        if (field is None or field.revision != deck.walkability_revision or
+                field.targets != targets):
+            field = FlowField(deck, targets, build=False)
+            self._fields[(deck, name)] = field
+            self.builds += 1
+        return field
+
+    def find_nearest(self, deck, name: str, start):
+        """Nearest target by walking distance as (entity, (x, y), path), or None"""
+        return self._nearest(self.field(deck, name), start)
+
+    def find_nearest_steps(self, deck, name: str, start):
+        """Resumable find_nearest for the path scheduler"""
+        field = yield from self.field_steps(deck, name)
+        return self._nearest(field, start)
+
+    @staticmethod
+    def _nearest(field, start):
+        path = field.path_from(start)
+        if not path:
+            return None
+        entity, pos = field.target_for(path[-1])
+        return entity, pos, path
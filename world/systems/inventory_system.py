@@ -1,5 +1,6 @@
 from world.objects import StorageContainer
 from world.items import ItemType
+from world.pathfinding import find_nearest_target
 
 class InventorySystem:
     def __init__(self):
@@ -25,30 +26,26 @@ class InventorySystem:
 
     def find_nearest_storage(self, x: int, y: int) -> tuple[StorageContainer, tuple[int, int]] | None:
         """Find nearest storage container with food and its position"""
-        nearest_distance = float('inf')
-        nearest_storage = None
-        nearest_pos = None
-        
+        nearest = self.find_nearest_storage_path(x, y)
+        return (nearest[0], nearest[1]) if nearest else None
+
+    def find_nearest_storage_path(self, x: int, y: int):
+        """Find the storage container with food closest by walking distance.
+        Returns (container, position, path) or None."""
+        deck = self.ship.decks[0]
+        targets = []
         for container in self.storage_containers:
             if container.get_item_count(ItemType.FOOD) > 0:
-                # Find container position in ship
-                container_pos = self._find_container_position(container)
+                container_pos = deck.position_of(container)
                 if container_pos:
-                    tile_x, tile_y = container_pos
-                    distance = ((tile_x - x) ** 2 + (tile_y - y) ** 2) ** 0.5
-                    if distance < nearest_distance:
-                        nearest_distance = distance
-                        nearest_storage = container
-                        nearest_pos = container_pos
+                    targets.append((container, container_pos))
         
-        return (nearest_storage, nearest_pos) if nearest_storage else None
+        return find_nearest_target(deck, (int(x), int(y)), targets)
 
     def _find_container_position(self, container) -> tuple[int, int] | None:
         """Find the position of a container in the ship"""
         for deck in self.ship.decks:
-            for y in range(deck.height):
-                for x in range(deck.width):
-                    tile = deck.tiles[y][x]
-                    if tile.object == container:
-                        return (x, y)
-        return None 
\ No newline at end of file
+            pos = deck.position_of(container)
+            if pos:
+                return pos
+        return None
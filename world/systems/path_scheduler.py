@@ -0,0 +1,116 @@
+import time
+from heapq import heappush, heappop
+from itertools import count
+
+from utils.config_manager import ConfigManager
+from world.pathfinding import find_path_steps, path_cache, path_cache_key, path_goals
+from world.systems.path_workers import PathWorkerPool
+
+PRIORITY_ORDER = 0  # Player move orders
+PRIORITY_NEED = 1   # Background needs such as finding food
+
+TIME_CHECK_INTERVAL = 64  # Expansions between clock reads
+
+class PathRequest:
+    """Handle to a queued search; agents poll done and read result"""
+    def __init__(self, steps, priority: int):
+        self.steps = steps  # Generator yielding per expanded node and returning the result
+        self.priority = priority
+        self.done = False
+        self.cancelled = False
+        self.result = None
+
+    def cancel(self):
+        """Drop the request; it will not be worked on again"""
+        self.cancelled = True
+        if self.steps is not None:
+            self.steps.close()
+
+    def finish(self, result):
+        if not self.cancelled:
+            self.result = result
+            self.done = True
+
+class PathScheduler:
+    """Spreads pathfinding work over frames within a per-tick budget.
+
+    Requests are resumable searches processed in priority order, then
+    submission order. Each update works until either the node or the time
+    budget is spent; an unfinished search simply continues next tick.
+
+    With game.pathfinding.scheduler.workers > 0, find_path requests are
+    instead solved in a process pool and delivered on a later tick.
+    """
+    def __init__(self, node_budget: int = None, time_budget_ms: float = None, workers: int = None):
+        config = ConfigManager.get_instance()
+        self.node_budget = node_budget or config.get('game.pathfinding.scheduler.node_budget', 2000)
+        self.time_budget = (time_budget_ms or
+                            config.get('game.pathfinding.scheduler.time_budget_ms', 2.0)) / 1000
+        if workers is None:
+            workers = config.get('game.pathfinding.scheduler.workers', 0)
+        self.workers = PathWorkerPool(workers) if workers > 0 else None
+        self._queue = []  # heap of (priority, order, request)
+        self._order = count()
+        self.completed = 0
+        self.last_expanded = 0
+
+    def submit(self, steps, priority: int = PRIORITY_NEED) -> PathRequest:
+        """Queue any resumable search (a generator that returns its result)"""
+        request = PathRequest(steps, priority)
+        heappush(self._queue, (priority, next(self._order), request))
+        return request
+
+    def request_path(self, deck, start, goal, priority: int = PRIORITY_NEED) -> PathRequest:
+        """Queue a find_path search; result is the path, [] when unreachable"""
+        if self.workers is None:
+            return self.submit(find_path_steps(deck, start, goal), priority)
+
+        request = PathRequest(None, priority)
+        goals = path_goals(deck, start, goal)
+        key = path_cache_key(goals) if goals else None
+        path = path_cache.get(deck, start, key) if goals else []
+        if path is not None:
+            request.finish(path)
+            return request
+
+        def deliver(path):
+            path_cache.put(deck, start, key, path)
+            request.finish(path)
+            self.completed += 1
+        self.workers.submit(deck, start, goals, deliver)
+        return request
+
+    def pending(self) -> int:
+        return len(self._queue) + (self.workers.pending() if self.workers else 0)
+
+    def close(self):
+        """Shut down worker processes, if any"""
+        if self.workers is not None:
+            self.workers.close()
+            self.workers = None
+
+    def update(self):
+        """Work on queued requests until this tick's budget is spent"""
+        if self.workers is not None:
+            self.workers.collect()
+            self.workers.flush()
+
+        deadline = time.perf_counter() + self.time_budget
+        expanded = 0
+        while self._queue and expanded < self.node_budget:
+            request = self._queue[0][2]
+            if request.cancelled:
+                heappop(self._queue)
+                continue
+            try:
+                next(request.steps)
+            except StopIteration as finished:
+                heappop(self._queue)
+                request.result = finished.value
+                request.done = True
+                self.completed += 1
+                continue
+            expanded += 1
+            if expanded % TIME_CHECK_INTERVAL == 0 and time.perf_counter() >= deadline:
+                break
+        self.last_expanded = expanded
@@ -0,0 +1,169 @@
+import multiprocessing
+import struct
+from heapq import heappush, heappop
+from multiprocessing import resource_tracker, shared_memory
+
+HEADER = struct.Struct("qqqqq")  # revision, min x, min y, width, height
+PUBLISHING = -1  # Revision value while the grid is being rewritten
+
+class SharedWalkability:
+    """A deck's walkability published as a shared-memory byte grid.
+
+    The header carries the deck's walkability revision. It is set to
+    PUBLISHING while the grid is rewritten, so workers can tell a torn
+    read from a consistent one.
+    """
+    def __init__(self, deck):
+        self.deck = deck
+        self.origin = (deck.min_x, deck.min_y)
+        self.width = deck.width
+        self.height = deck.height
+        self.revision = None
+        self.memory = shared_memory.SharedMemory(create=True, size=HEADER.size + self.width * self.height)
+
+    @property
+    def name(self):
+        return self.memory.name
+
+    def publish(self):
+        """Copy the deck's walkability in if its revision moved on"""
+        deck = self.deck
+        if self.revision == deck.walkability_revision:
+            return
+        buffer = self.memory.buf
+        HEADER.pack_into(buffer, 0, PUBLISHING, *self.origin, self.width, self.height)
+        buffer[HEADER.size:] = bytes(walkable for row in deck.walkable_grid() for walkable in row)
+        HEADER.pack_into(buffer, 0, deck.walkability_revision, *self.origin, self.width, self.height)
+        self.revision = deck.walkability_revision
+
+    def close(self):
+        self.memory.close()
+        self.memory.unlink()
+
+# ---- worker side ----
+
+_attached = {}  # shared memory name -> SharedMemory, per worker process
+
+def _snapshot(name):
+    """(revision, min x, min y, width, height, grid bytes) or None if the grid was mid-publish"""
+    memory = _attached.get(name)
+    if memory is None:
+        memory = shared_memory.SharedMemory(name=name)
+        # The main process owns the segment; don't let this worker's tracker unlink it
+        resource_tracker.unregister(memory._name, "shared_memory")
+        _attached[name] = memory
+    revision, min_x, min_y, width, height = HEADER.unpack_from(memory.buf, 0)
+    grid = bytes(memory.buf[HEADER.size:HEADER.size + width * height])
+    if revision == PUBLISHING or HEADER.unpack_from(memory.buf, 0)[0] != revision:
+        return None
+    return revision, min_x, min_y, width, height, grid
+
+def _search(grid, min_x, min_y, width, height, start, goals):
+    """Multi-goal A* over a flat walkability grid, same rules as pathfinding.search_steps"""
+    goals = set(goals)
+
+    def heuristic(pos):
+        return min(abs(goal[0] - pos[0]) + abs(goal[1] - pos[1]) for goal in goals)
+
+    frontier = [(0, start)]
+    came_from = {start: None}
+    cost_so_far = {start: 0}
+    reached = None
+    while frontier:
+        current = heappop(frontier)[1]
+        if current in goals:
+            reached = current
+            break
+        x, y = current
+        for nx, ny in ((x, y + 1), (x + 1, y), (x, y - 1), (x - 1, y)):
+            gx, gy = nx - min_x, ny - min_y
+            if 0 <= gx < width and 0 <= gy < height and grid[gy * width + gx]:
+                new_cost = cost_so_far[current] + 1
+                if (nx, ny) not in cost_so_far or new_cost < cost_so_far[(nx, ny)]:
+                    cost_so_far[(nx, ny)] = new_cost
+                    heappush(frontier, (new_cost + heuristic((nx, ny)), (nx, ny)))
+                    came_from[(nx, ny)] = current
+
+    if reached is None:
+        return []
+    path = []
+    while reached is not None:
+        path.append(reached)
+        reached = came_from[reached]
+    path.reverse()
+    return path
+
+def solve_batch(name, queries):
+    """Worker entry point: returns (revision or None, [path per (start, goals) query])"""
+    try:
+        snapshot = _snapshot(name)
+    except FileNotFoundError:
+        snapshot = None  # The deck was resized and its old grid released
+    if snapshot is None:
+        return None, []
+    revision, min_x, min_y, width, height, grid = snapshot
+    return revision, [_search(grid, min_x, min_y, width, height, start, goals) for start, goals in queries]
+
+# ---- main process side ----
+
+class PathWorkerPool:
+    """Solves batches of path queries in a process pool.
+
+    Queries submitted during a tick are sent as one batch per deck at the
+    next flush; results arrive on a later tick. Results computed against a
+    walkability revision the deck has since left are thrown away and the
+    queries are sent again.
+    """
+    def __init__(self, processes: int):
+        self.pool = multiprocessing.Pool(processes)
+        self._grids = {}  # deck -> SharedWalkability
+        self._pending = {}  # deck -> [(start, goals, callback)]
+        self._in_flight = []  # (deck, AsyncResult, [(start, goals, callback)])
+        self.discarded = 0
+
+    def submit(self, deck, start, goals, callback):
+        """Queue a query; callback(path) is called from collect once it is solved"""
+        self._pending.setdefault(deck, []).append((start, tuple(goals), callback))
+
+    def flush(self):
+        """Publish walkability and send this tick's queries to the workers"""
+        for deck, queries in self._pending.items():
+            grid = self._grids.get(deck)
+            if grid is None or (grid.origin, grid.width, grid.height) != ((deck.min_x, deck.min_y),
+                                                                          deck.width, deck.height):
+                if grid is not None:
+                    grid.close()
+                grid = SharedWalkability(deck)
+                self._grids[deck] = grid
+            grid.publish()
+            batch = [(start, goals) for start, goals, _ in queries]
+            self._in_flight.append((deck, self.pool.apply_async(solve_batch, (grid.name, batch)), queries))
+        self._pending = {}
+
+    def collect(self):
+        """Deliver finished batches; stale ones are resubmitted"""
+        still_running = []
+        for deck, result, queries in self._in_flight:
+            if not result.ready():
+                still_running.append((deck, result, queries))
+                continue
+            revision, paths = result.get()
+            if revision != deck.walkability_revision:
+                self.discarded += 1
+                self._pending.setdefault(deck, []).extend(queries)
+                continue
+            for (_, _, callback), path in zip(queries, paths):
+                callback(path)
+        self._in_flight = still_running
+
+    def pending(self) -> int:
+        """Queries not yet delivered"""
+        return (sum(len(queries) for queries in self._pending.values()) +
+                sum(len(queries) for _, _, queries in self._in_flight))
+
+    def close(self):
+        self.pool.terminate()
+        self.pool.join()
+        for grid in self._grids.values():
+            grid.close()
+        self._grids = {}
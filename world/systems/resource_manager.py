@@ -1,5 +1,5 @@
 from world.items import ItemType
-from world.modules import ReactorModule
+from world.modules import LifeSupportModule, ReactorModule
 
 class ResourceManager:
     def __init__(self):
@@ -20,20 +20,16 @@ class ResourceManager:
         """Calculate and update power distribution"""
         total_power = 0
         for deck in ship.decks:
-            for room in deck.rooms:
-                for tile in room.tiles:
-                    if tile.module and hasattr(tile.module, 'power_output'):
-                        total_power += tile.module.power_output
+            for reactor, _ in deck.find_modules(ReactorModule):
+                total_power += reactor.power_output
         self.max_power = total_power
 
     def _update_oxygen(self, dt, ship):
         """Calculate and update oxygen levels"""
         life_support_oxygen = 0
         for deck in ship.decks:
-            for room in deck.rooms:
-                for tile in room.tiles:
-                    if tile.module and hasattr(tile.module, 'oxygen_production'):
-                        life_support_oxygen += tile.module.oxygen_production * dt
+            for life_support, _ in deck.find_modules(LifeSupportModule):
+                life_support_oxygen += life_support.oxygen_production * dt
 
         total_oxygen_production = life_support_oxygen
         total_oxygen_consumption = len(ship.crew) * self.oxygen_consumption_per_crew * dt
@@ -0,0 +1,96 @@
+from utils.config_manager import ConfigManager
+
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS  # Slots per level
+LEVELS = 4  # Level n holds timers due within SLOTS ** (n + 1) ticks
+
+class Timer:
+    """A scheduled callback; cancel() stops it from firing"""
+    __slots__ = ("due", "callback", "args", "cancelled")
+
+    def __init__(self, due, callback, args):
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+class TimerWheel:
+    """Hierarchical timing wheel: callbacks fire once game time reaches their due time.
+
+    Time is split into ticks of `resolution` seconds. Level 0 has a slot
+    per tick for the next SLOTS ticks, and each level above covers SLOTS
+    times the span of the one below. Farther timers are moved down a level
+    when time reaches their slot. Advancing therefore costs the ticks
+    passed, the timers moved down and the timers fired, however many
+    timers are waiting.
+    """
+    def __init__(self, resolution=None):
+        self.resolution = resolution or ConfigManager.get_instance().get('game.timers.resolution', 0.05)
+        self.now = 0.0  # Seconds of game time
+        self._tick = 0  # Last tick whose slot was emptied
+        self._levels = [[[] for _ in range(SLOTS)] for _ in range(LEVELS)]
+        self._overflow = []  # Too far for the top level
+        self._waiting = []  # Out of the wheel, due within the current tick
+
+    def schedule(self, delay, callback, *args) -> Timer:
+        """Call callback(*args) once `delay` seconds of game time have passed"""
+        return self.schedule_at(self.now + delay, callback, *args)
+
+    def schedule_at(self, due, callback, *args) -> Timer:
+        timer = Timer(due, callback, args)
+        self._insert(timer)
+        return timer
+
+    def advance(self, dt) -> int:
+        """Move game time on by dt and run every callback now due; returns how many ran"""
+        self.now += dt
+        target = int(self.now // self.resolution)
+        while self._tick < target:
+            self._tick += 1
+            self._cascade(self._tick)
+            slot = self._levels[0][self._tick & (SLOTS - 1)]
+            if slot:
+                self._waiting += slot
+                slot.clear()
+
+        due = [timer for timer in self._waiting if timer.due <= self.now and not timer.cancelled]
+        if not due:
+            return 0
+        self._waiting = [timer for timer in self._waiting if timer.due > self.now and not timer.cancelled]
+        due.sort(key=lambda timer: timer.due)
+        # Timers these callbacks schedule wait for the next advance
+        for timer in due:
+            if not timer.cancelled:
+                timer.callback(*timer.args)
+        return len(due)
+
+    def _insert(self, timer):
+        tick = int(timer.due // self.resolution)
+        if tick <= self._tick:
+            self._waiting.append(timer)
+            return
+        # Lowest level whose next slot boundary comes before the timer is due
+        for level in range(LEVELS):
+            shift = SLOT_BITS * (level + 1)
+            if tick >> shift == self._tick >> shift:
+                self._levels[level][(tick >> (SLOT_BITS * level)) & (SLOTS - 1)].append(timer)
+                return
+        self._overflow.append(timer)
+
+    def _cascade(self, tick):
+        """Move timers from the higher-level slots starting at this tick down a level"""
+        for level in range(LEVELS, 0, -1):
+            if tick & ((1 << (SLOT_BITS * level)) - 1):
+                continue
+            if level == LEVELS:
+                timers, self._overflow = self._overflow, []
+            else:
+                slot = self._levels[level][(tick >> (SLOT_BITS * level)) & (SLOTS - 1)]
+                timers = slot[:]
+                slot.clear()
+            for timer in timers:
+                if not timer.cancelled:
+                    self._insert(timer)
@@ -0,0 +1,210 @@
+from dataclasses import dataclass
+from math import ceil, floor
+
+from world.change_journal import JournalReader, MODULE_PLACED, MODULE_REMOVED, OBJECT_PLACED, OBJECT_REMOVED
+from world.entity_store import Entity, EntityStore, POSITION
+from world.spatial_hash import ENEMIES
+from world.type_registry import type_info
+
+RANGE_CELL = 8  # Tiles per side of the buckets range sleepers are filed in
+
+@dataclass(frozen=True, slots=True)
+class Sleep:
+    """Returned from an entity's update() to leave the active set until a wake condition.
+
+    With no condition set the entity sleeps until woken explicitly.
+    """
+    timer: float | None = None  # Seconds of game time
+    power: bool = False  # Wake when the ship's power distribution changes
+    enemy_range: float | None = None  # Wake when a live enemy comes this close
+
+class UpdateScheduler:
+    """Updates only the modules and objects that have work to do.
+
+    Entities placed on a watched deck start active, unless their registered
+    type has no updater. Each tick every active entity is updated, types with
+    a batch updater all at once; one that returns a Sleep is moved out of the
+    active set until its timer runs out, power changes or an enemy comes in range.
+    Sleepers watching for enemies are filed by area and looked up only
+    around enemies that moved, so a tick costs active entities plus moving
+    enemies, not sleepers or the number of tiles.
+    """
+    def __init__(self, timers, on_added=None):
+        self.timers = timers  # TimerWheel for timed sleeps, advanced by the owner
+        self.on_added = on_added  # Called as on_added(entity, deck, (x, y)) when an entity is picked up
+        self.active = {}  # entity -> its updater, in insertion order
+        self.updated = 0  # Entities updated on the last tick
+        self._positions = {}  # entity -> (x, y)
+        self._by_ident = {}  # id(entity) -> entity, to match the journal's Placements
+        self._decks = {}  # deck -> JournalReader
+        self._sleeping = {}  # entity -> Sleep
+        self._updaters = {}  # entity -> update(entity, dt)
+        self._batches = {}  # updater -> update_all(entities, dt) replacing it
+        self._timers = {}  # entity -> Timer waking it
+        self._power_waiters = set()
+        self._range_waiters = {}  # entity -> enemy range
+        self._range_cells = {}  # (x, y) // RANGE_CELL -> range waiters whose tile is in that bucket
+        self._max_range = 0  # Largest enemy range any waiter has asked for
+        self._new_range_waiters = []  # Look once for enemies already near, then wait for moves
+        self._enemy_moves = EntityStore.get_instance().components[POSITION].subscribe()
+
+    def watch(self, deck):
+        """Pick up every module and object on a deck, and follow its journal for new ones"""
+        if deck in self._decks:
+            return
+        self._decks[deck] = JournalReader(deck.journal)
+        for entity, pos in deck.find_modules(object) + deck.find_objects(object):
+            self.add(entity, deck, pos)
+
+    def add(self, entity, deck, pos):
+        if entity in self._positions:
+            return
+        self._positions[entity] = pos
+        self._by_ident[id(entity)] = entity
+        if self.on_added is not None:
+            self.on_added(entity, deck, pos)
+        info = type_info(type(entity))
+        updater = info.updater if info else entity.__class__.update
+        if updater is not None:
+            if info and info.batch_updater is not None:
+                self._batches[updater] = info.batch_updater
+            self._updaters[entity] = updater
+            self.active[entity] = updater
+
+    def remove(self, entity):
+        if self._positions.pop(entity, None) is not None:
+            del self._by_ident[id(entity)]
+        self._updaters.pop(entity, None)
+        self.active.pop(entity, None)
+        self._forget_sleep(entity)
+
+    def wake(self, entity):
+        """Move a sleeping entity back into the active set"""
+        if entity in self._sleeping:
+            self._forget_sleep(entity)
+            self.active[entity] = self._updaters[entity]
+
+    def power_changed(self):
+        """Wake everything sleeping until power changes"""
+        for entity in list(self._power_waiters):
+            self.wake(entity)
+
+    def is_sleeping(self, entity) -> bool:
+        return entity in self._sleeping
+
+    def update(self, dt, spatial_hash=None):
+        """Run one tick; spatial_hash is the ship's, for waking sleepers when enemies come near"""
+        self._read_journals()
+        self._wake_in_range(spatial_hash)
+
+        self.updated = 0
+        batched = {}
+        for entity, updater in list(self.active.items()):
+            batch = self._batches.get(updater)
+            if batch is not None:
+                batched.setdefault(batch, []).append(entity)
+                continue
+            result = updater(entity, dt)
+            self.updated += 1
+            if isinstance(result, Sleep):
+                self._sleep(entity, result)
+        for batch, entities in batched.items():
+            for entity, result in zip(entities, batch(entities, dt)):
+                if isinstance(result, Sleep):
+                    self._sleep(entity, result)
+            self.updated += len(entities)
+
+    def _read_journals(self):
+        for deck, reader in self._decks.items():
+            events = reader.read()
+            if events is None:
+                # Fell behind the journal: resync with what is on the deck now
+                placed = dict(deck.find_modules(object) + deck.find_objects(object))
+                for entity in [e for e in self._positions if e not in placed]:
+                    self._left_deck(entity)
+                for entity, pos in placed.items():
+                    self.add(entity, deck, pos)
+                continue
+            for event in events:
+                if event.kind in (MODULE_PLACED, OBJECT_PLACED):
+                    tile = deck.tile_at(*event.pos)
+                    entity = tile.module if event.kind == MODULE_PLACED else tile.object
+                    # Skip it if it was taken off again since; that removal is journaled too
+                    if entity is not None and id(entity) == event.new.ident:
+                        self.add(entity, deck, event.pos)
+                elif event.kind in (MODULE_REMOVED, OBJECT_REMOVED):
+                    entity = self._by_ident.get(event.old.ident)
+                    # Multi-tile modules stay while any of their tiles remain
+                    if entity is not None and deck.position_of(entity) is None:
+                        self._left_deck(entity)
+
+    def _left_deck(self, entity):
+        """Stop updating an entity taken off a deck, and free it unless another watched deck has it"""
+        self.remove(entity)
+        if isinstance(entity, Entity) and all(deck.position_of(entity) is None for deck in self._decks):
+            entity.destroy()
+
+    def _sleep(self, entity, sleep):
+        del self.active[entity]
+        self._sleeping[entity] = sleep
+        if sleep.timer is not None:
+            self._timers[entity] = self.timers.schedule(sleep.timer, self.wake, entity)
+        if sleep.power:
+            self._power_waiters.add(entity)
+        if sleep.enemy_range is not None:
+            self._range_waiters[entity] = sleep.enemy_range
+            self._range_cells.setdefault(_range_cell(*self._positions[entity]), set()).add(entity)
+            self._max_range = max(self._max_range, sleep.enemy_range)
+            self._new_range_waiters.append(entity)
+
+    def _forget_sleep(self, entity):
+        timer = self._timers.pop(entity, None)
+        if timer is not None:
+            timer.cancel()
+        self._sleeping.pop(entity, None)
+        self._power_waiters.discard(entity)
+        if self._range_waiters.pop(entity, None) is not None:
+            cell = _range_cell(*self._positions[entity])
+            waiters = self._range_cells[cell]
+            waiters.discard(entity)
+            if not waiters:
+                del self._range_cells[cell]
+
+    def _wake_in_range(self, spatial_hash):
+        """Wake range sleepers that a live enemy has come close enough to"""
+        moved = self._enemy_moves
+        if not self._range_waiters or spatial_hash is None:
+            moved.clear()
+            self._new_range_waiters.clear()
+            return
+
+        # New sleepers look once for enemies already near them; those may never move again
+        for entity in self._new_range_waiters:
+            radius = self._range_waiters.get(entity)
+            if radius is not None:
+                x, y = self._positions[entity]
+                if spatial_hash.nearest(x, y, radius=radius, layer=ENEMIES, predicate=_alive):
+                    self.wake(entity)
+        self._new_range_waiters.clear()
+
+        # After that, only an enemy moving can bring one in range
+        reach = ceil(self._max_range / RANGE_CELL)  # Buckets to look through on each side
+        for moved_entity in moved:
+            enemy = spatial_hash.find(moved_entity, ENEMIES)
+            if enemy is None or enemy.is_dead():
+                continue
+            ex, ey = enemy.x, enemy.y
+            cx, cy = _range_cell(floor(ex), floor(ey))
+            for bx in range(cx - reach, cx + reach + 1):
+                for by in range(cy - reach, cy + reach + 1):
+                    for entity in list(self._range_cells.get((bx, by), ())):
+                        x, y = self._positions[entity]
+                        if ((ex - x) ** 2 + (ey - y) ** 2) ** 0.5 <= self._range_waiters[entity]:
+                            self.wake(entity)
+        moved.clear()
+
+def _alive(enemy):
+    return not enemy.is_dead()
+
+def _range_cell(x, y):
+    return x // RANGE_CELL, y // RANGE_CELL
@@ -1,36 +1,127 @@
+from utils.tracing import get_channel
+
+_trace = get_channel("power")
+
+# Floor type names are interned here; tiles and array layers store their index
+FLOOR_TYPES = ["metal_floor"]
+
+def floor_type_id(name: str) -> int:
+    if name not in FLOOR_TYPES:
+        FLOOR_TYPES.append(name)
+    return FLOOR_TYPES.index(name)
+
 class Tile:
-    def __init__(self, x, y):
+    # Cables and connected modules are rare, so they live in side tables on the deck
+    __slots__ = ("x", "y", "deck", "_floor_type", "_wall", "_object", "_module")
+
+    def __init__(self, x, y, deck=None):
         self.x = x
         self.y = y
-        self.floor_type = "metal_floor"
-        self.wall = False
-        self.object = None
-        self.module = None
-        self.cable = None
-        self.connected_modules = set()  # Track connected modules through cables
+        self.deck = deck  # Owning deck, notified when wall/module/object change
+        self._floor_type = 0  # Index into FLOOR_TYPES
+        self._wall = False
+        self._object = None
+        self._module = None
+
+    @property
+    def floor_type(self):
+        return FLOOR_TYPES[self._floor_type]
+
+    @floor_type.setter
+    def floor_type(self, value):
+        self._floor_type = floor_type_id(value)
+
+    @property
+    def cable(self):
+        if self.deck is None:
+            return None
+        return self.deck.tile_cables.get((self.x, self.y))
+
+    @cable.setter
+    def cable(self, value):
+        old = self.cable
+        if value is old:
+            return
+        if value is None:
+            self.deck.tile_cables.pop((self.x, self.y), None)
+        else:
+            self.deck.tile_cables[(self.x, self.y)] = value
+        self._notify("cable", old)
+
+    @property
+    def connected_modules(self):
+        """Modules connected through cables; read-only here, tiles without any share an empty set"""
+        return self.deck.connected_modules.get((self.x, self.y), frozenset())
+
+    @property
+    def wall(self):
+        return self._wall
+
+    @wall.setter
+    def wall(self, value):
+        if value != self._wall:
+            old = self._wall
+            self._wall = value
+            self._notify("wall", old)
+
+    @property
+    def object(self):
+        return self._object
+
+    @object.setter
+    def object(self, value):
+        if value is not self._object:
+            old = self._object
+            self._object = value
+            self._notify("object", old)
+
+    @property
+    def module(self):
+        return self._module
+
+    @module.setter
+    def module(self, value):
+        if value is not self._module:
+            old = self._module
+            self._module = value
+            self._notify("module", old)
+
+    def _notify(self, change: str, old):
+        """Tell the owning deck that this tile changed"""
+        if self.deck is not None:
+            self.deck.tile_changed(self, change, old)
 
     def is_walkable(self):
+        # Same rule as walkable_with, read straight from the slots: this runs per neighbour in every search
+        if self._wall:
+            return False
+        obj = self._object
+        return not (obj and obj.solid and not obj.walkable)
+
+    @staticmethod
+    def walkable_with(wall, obj):
+        """Walkability of a tile with the given wall flag and object"""
         # Base tiles are walkable if they're not walls
-        if self.wall:
+        if wall:
             return False
         # Objects might block movement unless they're walkable
-        if self.object and self.object.solid and not self.object.walkable:
+        if obj and obj.solid and not obj.walkable:
             return False
         return True
 
     def has_power(self, required_power: float) -> bool:
         """Check if this tile has enough power for the required amount"""
-        print(f"\nChecking power for tile ({self.x}, {self.y}):")
         # If there's no cable, there's no power
         if not self.cable:
-            print("  No cable")
+            if _trace.debug_enabled:
+                _trace.debug("Tile (%s, %s) has no cable", self.x, self.y)
             return False
             
         # Check if the cable is powered and has enough capacity
-        print(f"  Cable powered: {self.cable.powered}")
         if self.cable.powered and self.cable.network:
-            print(f"  Network available power: {self.cable.network.available_power}")
-            print(f"  Required power: {required_power}")
+            if _trace.debug_enabled:
+                _trace.debug("Tile (%s, %s) network power %s, required %s", self.x, self.y,
+                             self.cable.network.available_power, required_power)
             return self.cable.network.available_power >= required_power
             
         return False
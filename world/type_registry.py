@@ -0,0 +1,85 @@
+"""Per-class facts about modules and objects, looked up instead of isinstance chains.
+
+Each game class registers itself where it is defined, so the table is
+filled once as those modules are imported:
+
+    @register(MODULE, sprite='reactor', power_role=PRODUCER, build_name="Reactor")
+    class ReactorModule(BaseModule): ...
+
+Subclasses that don't register inherit their nearest registered base's entry.
+"""
+from dataclasses import dataclass
+
+# Categories
+MODULE = "module"
+OBJECT = "object"
+WEAPON = "weapon"
+
+# Power roles
+PRODUCER = "producer"
+CONSUMER = "consumer"
+
+@dataclass(slots=True)
+class TypeInfo:
+    cls: type
+    category: str
+    sprite: str | None = None  # Asset key of its image
+    color: tuple | None = None  # Drawn when the sprite is missing
+    power_role: str | None = None  # PRODUCER, CONSUMER or None if it never touches power
+    updater: object = None  # update(entity, dt) for the update scheduler; None if it never has work
+    batch_updater: object = None  # update_all(entities, dt) -> results, run once for every active one instead
+    builder: object = None  # build(ship, deck, x, y) -> bool placing a new one
+    build_name: str | None = None  # Name of the BuildableItem that builds it
+    renderer: object = None  # Set by the rendering code: draw(renderer, screen, entity, rect_or_pos, ...)
+
+_types = {}  # class -> TypeInfo, including unregistered subclasses once looked up
+_by_build_name = {}
+
+def register(category, updates=False, **info):
+    """Class decorator adding the class to the registry; updates=True schedules its update()"""
+    def decorate(cls):
+        entry = TypeInfo(cls, category, **info)
+        if updates:
+            entry.updater = cls.update
+        if entry.build_name and entry.builder is None:
+            entry.builder = module_builder(cls) if category == MODULE else object_builder(cls)
+        _types[cls] = entry
+        if entry.build_name:
+            _by_build_name[entry.build_name] = entry
+        return cls
+    return decorate
+
+def type_info(cls) -> TypeInfo | None:
+    """Entry for a class, falling back to its nearest registered base (cached)"""
+    entry = _types.get(cls)
+    if entry is None and cls not in _types:
+        entry = next((_types[base] for base in cls.__mro__[1:] if base in _types), None)
+        _types[cls] = entry
+    return entry
+
+def info_of(obj) -> TypeInfo | None:
+    return type_info(type(obj))
+
+def buildable(build_name) -> TypeInfo | None:
+    return _by_build_name.get(build_name)
+
+def set_renderer(cls, renderer):
+    _types[cls].renderer = renderer
+
+def power_role(obj) -> str | None:
+    entry = type_info(type(obj))
+    return entry.power_role if entry else None
+
+def module_builder(cls):
+    """Builder placing a new cls() as the module of one tile"""
+    def build(ship, deck, x, y):
+        deck.tiles[y][x].module = cls()
+        return True
+    return build
+
+def object_builder(cls):
+    """Builder placing a new cls() as the object of one tile"""
+    def build(ship, deck, x, y):
+        deck.tiles[y][x].object = cls()
+        return True
+    return build
@@ -1,9 +1,29 @@
+from world.entity_store import COOLDOWN, ComponentField, Entity, EntityStore, POSITION, POWER
 from world.objects import BaseObject
 from typing import Optional, List
 from models.enemies import Enemy
+from utils.tracing import get_channel
+from world.spatial_hash import ENEMIES
+from world.systems.combat_system import update_turrets
+from world.systems.update_scheduler import Sleep
+from world.type_registry import CONSUMER, WEAPON, register
+
+_trace = get_channel("weapons")
+
+@register(WEAPON, updates=True, power_role=CONSUMER)
+class Weapon(BaseObject, Entity):
+    __slots__ = ("entity", "damage", "range", "target", "ship", "tile", "cooldown_timer")
+
+    # Stored in the entity store
+    x = ComponentField(POSITION, "x")
+    y = ComponentField(POSITION, "y")
+    current_cooldown = ComponentField(COOLDOWN, "remaining")
+    attack_cooldown = ComponentField(COOLDOWN, "duration")
+    power_required = ComponentField(POWER, "required")
+    power_available = ComponentField(POWER, "available")
 
-class Weapon(BaseObject):
     def __init__(self, name: str):
+        self.entity = EntityStore.get_instance().create(position={}, cooldown={}, power={'available': 0})
         super().__init__(name)
         self.solid = True
         self.walkable = False
@@ -15,63 +35,78 @@ class Weapon(BaseObject):
         self.power_required = 2
         self.target: Optional[Enemy] = None
         self.ship = None  # Reference to parent ship
-        
+        self.tile = None  # Tile the weapon is mounted on, set when placed
+        self.cooldown_timer = None  # Timer ending the cooldown on the ship's timer wheel
+
+    @property
+    def powered(self) -> bool:
+        return self.power_available > 0 and self.power_available >= self.power_required
+
+    @powered.setter
+    def powered(self, powered: bool):
+        self.power_available = self.power_required if powered else 0
+
     def set_ship(self, ship):
         """Set reference to parent ship"""
-        print(f"Setting ship reference for {self.name}")
-        print(f"Previous ship reference: {self.ship}")
-        print(f"New ship object id: {id(ship)}")
+        if _trace.debug_enabled:
+            _trace.debug("Setting ship reference for %s: %s -> %s", self.name, self.ship, id(ship))
         self.ship = ship
-        print(f"Stored ship reference id: {id(self.ship)}")
         
     def set_position(self, x: int, y: int):
         """Explicitly set the weapon position"""
         self.x = x
         self.y = y
-        print(f"Setting weapon position to ({x}, {y})")
 
     def update(self, dt):
-        print(f"\n=== WEAPON BASE UPDATE ===")
-        print(f"Weapon: {self.name}")
-        print(f"Position: ({self.x}, {self.y})")
-        print(f"Has ship reference: {self.ship is not None}")
-        if self.ship:
-            print(f"Ship enemies count: {len(self.ship.enemies)}")
-            for enemy in self.ship.enemies:
-                print(f"  - Enemy {enemy.name} at ({enemy.x}, {enemy.y}) health: {enemy.health}")
+        if _trace.debug_enabled:
+            _trace.debug("%s update at (%s, %s), has ship: %s",
+                         self.name, self.x, self.y, self.ship is not None)
         
         # Check power state
         if hasattr(self, 'tile') and self.tile:
             self.powered = self.tile.has_power(self.power_required)
-            print(f"Power check: {self.powered} (requires {self.power_required})")
         else:
             self.powered = False
-            print("No tile reference - unpowered")
+        if _trace.debug_enabled:
+            _trace.debug("%s powered: %s (requires %s)", self.name, self.powered, self.power_required)
             
         if not self.powered:
-            print("Weapon unpowered - skipping update")
-            return
+            return Sleep(power=True)
             
-        if self.current_cooldown > 0:
+        if self.current_cooldown > 0 and self.cooldown_timer is None:
             self.current_cooldown = max(0, self.current_cooldown - dt)
-            print(f"Cooldown active: {self.current_cooldown:.2f}s remaining")
+
+    def start_cooldown(self) -> bool:
+        """Start the attack cooldown; True if the ship's timers end it, so the weapon can sleep until then"""
+        self.current_cooldown = self.attack_cooldown
+        timers = self.ship.timers if self.ship is not None else None
+        if timers is None:
+            return False  # Counted down in update()
+        self.cooldown_timer = timers.schedule(self.attack_cooldown, self._cooldown_expired)
+        return True
+
+    def _cooldown_expired(self):
+        self.cooldown_timer = None
+        self.current_cooldown = 0
+        self.ship.update_scheduler.wake(self)
+
+    def destroy(self):
+        if self.cooldown_timer is not None:
+            self.cooldown_timer.cancel()
+            self.cooldown_timer = None
+        super().destroy()
 
     def can_attack(self) -> bool:
-        print("\nChecking can_attack:")
         if self.current_cooldown > 0:
-            print("  Cooldown active")
             return False
             
         if not self.target:
-            print("  No target")
             return False
             
         if not self.powered:
-            print("  Not powered")
             return False
             
         if self.target.is_dead():
-            print("  Target is dead")
             return False
             
         # Check if target is in range using tile coordinates
@@ -79,60 +114,51 @@ class Weapon(BaseObject):
         dy = self.target.y - self.y
         distance = (dx ** 2 + dy ** 2) ** 0.5
         in_range = distance <= self.range
-        print(f"  Distance to target: {distance}, Range: {self.range}, In range: {in_range}")
+        if _trace.debug_enabled:
+            _trace.debug("%s distance to target: %.2f, range: %s", self.name, distance, self.range)
         return in_range
 
     def fire(self):
-        print("\n=== FIRE ATTEMPT ===")
         if self.target and self.can_attack():
-            print(f"Firing at {self.target.name}!")
-            print(f"Target health before: {self.target.health}")
             self.target.take_damage(self.damage)
-            print(f"Target health after: {self.target.health}")
-            self.current_cooldown = self.attack_cooldown
-            print(f"Weapon on cooldown: {self.attack_cooldown}s")
-        else:
-            print("Cannot fire - conditions not met")
+            self.start_cooldown()
+            if _trace.info_enabled:
+                _trace.info("%s fired at %s, health now %s", self.name, self.target.name, self.target.health)
+        elif _trace.debug_enabled:
+            _trace.debug("%s cannot fire - conditions not met", self.name)
 
     def find_target(self, enemies: List[Enemy]) -> Optional[Enemy]:
-        print("\n=== TARGET SEARCH DEBUG ===")
-        print(f"Weapon at ({self.x}, {self.y})")
-        print(f"Range: {self.range}")
-        
         if not self.ship or not self.ship.enemies:
-            print("No ship reference or no enemies!")
             return None
             
-        closest_enemy = None
-        closest_distance = float('inf')
-        
-        for enemy in self.ship.enemies:
-            print(f"\nChecking enemy: {enemy.name}")
-            print(f"Enemy position: ({enemy.x}, {enemy.y})")
-            
-            if enemy.is_dead():
-                print("Enemy is dead, skipping")
-                continue
-                
-            dx = enemy.x - self.x
-            dy = enemy.y - self.y
-            distance = (dx ** 2 + dy ** 2) ** 0.5
-            print(f"Distance to enemy: {distance}")
-            print(f"In range? {distance <= self.range}")
-            
-            if distance <= self.range and distance < closest_distance:
-                closest_enemy = enemy
-                closest_distance = distance
-                print("New closest target found!")
+        # Nearest live enemy in range; ties go to the one that boarded first
+        found = self.ship.spatial_hash.nearest(self.x, self.y, radius=self.range, layer=ENEMIES,
+                                               predicate=_alive)
+        closest_enemy = found[0] if found else None
         
-        if closest_enemy:
-            print(f"Selected target: {closest_enemy.name} at ({closest_enemy.x}, {closest_enemy.y})")
-        else:
-            print("No valid target found")
+        if _trace.debug_enabled:
+            _trace.debug("%s at (%s, %s) target search: %s", self.name, self.x, self.y,
+                         closest_enemy.name if closest_enemy else None)
             
         return closest_enemy
 
+def _alive(enemy):
+    return not enemy.is_dead()
+
+def build_laser_turret(ship, deck, x, y) -> bool:
+    turret = LaserTurret()
+    deck.tiles[y][x].object = turret
+    turret.tile = deck.tiles[y][x]
+    turret.x = x
+    turret.y = y
+    turret.set_ship(ship)  # Important: Set the ship reference
+    return True
+
+@register(WEAPON, updates=True, sprite='laser_turret', color=(150, 0, 0), power_role=CONSUMER,
+          builder=build_laser_turret, build_name="Laser Turret", batch_updater=update_turrets)
 class LaserTurret(Weapon):
+    __slots__ = ("firing_animation_time", "firing")
+
     def __init__(self):
         super().__init__("Laser Turret")
         self.damage = 15
@@ -143,61 +169,45 @@ class LaserTurret(Weapon):
         self.firing = False
     
     def update(self, dt):
-        print("\n=== LASER TURRET UPDATE ===")
-        print(f"Current state:")
-        print(f"  Position: ({self.x}, {self.y})")
-        print(f"  Powered: {self.powered}")
-        print(f"  Current target: {self.target.name if self.target else 'None'}")
-        print(f"  Range: {self.range}")
-        print(f"  Cooldown: {self.current_cooldown:.2f}")
-        
-        if self.ship:
-            print(f"\nShip status:")
-            print(f"  Enemy count: {len(self.ship.enemies)}")
-            for enemy in self.ship.enemies:
-                dx = enemy.x - self.x
-                dy = enemy.y - self.y
-                distance = (dx ** 2 + dy ** 2) ** 0.5
-                print(f"  - Enemy {enemy.name} at ({enemy.x}, {enemy.y})")
-                print(f"    Distance: {distance:.1f}, In range: {distance <= self.range}")
-        else:
-            print("No ship reference!")
+        if _trace.debug_enabled:
+            _trace.debug("%s state: powered=%s target=%s cooldown=%.2f enemies=%s",
+                         self.name, self.powered, self.target.name if self.target else None,
+                         self.current_cooldown, len(self.ship.enemies) if self.ship else None)
         
         # Call parent update
-        super().update(dt)
+        sleep = super().update(dt)
         
         if not self.powered:
-            print("Turret unpowered - skipping targeting")
-            return
+            return sleep
             
         # Reset target if it's dead or null
         if self.target and self.target.is_dead():
-            print(f"Current target {self.target.name} is dead - resetting target")
+            if _trace.info_enabled:
+                _trace.info("%s target %s is dead - resetting target", self.name, self.target.name)
             self.target = None
             
         # Try to fire at current target if we have one
         if self.target and self.can_attack():
-            print("Attempting to fire at current target...")
             self.fire()
         # Otherwise look for a new target
         elif not self.target and self.powered and self.ship:
-            print("\nSearching for new target...")
             self.target = self.find_target(self.ship.enemies)
             if self.target:
-                print(f"New target acquired: {self.target.name}")
-                print(f"Attempting to fire...")
+                if _trace.info_enabled:
+                    _trace.info("%s acquired target %s", self.name, self.target.name)
                 self.fire()
-            else:
-                print("No valid target found")
+            elif self.current_cooldown == 0:
+                # Idle until an enemy comes in range or power changes
+                return Sleep(power=True, enemy_range=self.range)
+
+        if self.cooldown_timer is not None:
+            return Sleep()  # The cooldown timer wakes it
 
     def fire(self):
-        print("\n=== FIRE ATTEMPT ===")
         if self.target and self.can_attack():
-            print(f"Firing at {self.target.name}!")
-            print(f"Target health before: {self.target.health}")
             self.target.take_damage(self.damage)
-            print(f"Target health after: {self.target.health}")
-            self.current_cooldown = self.attack_cooldown
-            print(f"Weapon on cooldown: {self.attack_cooldown}s")
-        else:
-            print("Cannot fire - conditions not met")
\ No newline at end of file
+            self.start_cooldown()
+            if _trace.info_enabled:
+                _trace.info("%s fired at %s, health now %s", self.name, self.target.name, self.target.health)
+        elif _trace.debug_enabled:
+            _trace.debug("%s cannot fire - conditions not met", self.name)
\ No newline at end of file